@@ -0,0 +1,59 @@
+"""Integer-backed equality, ordering and hashing for single-value models."""
+
+from abc import abstractmethod
+from functools import total_ordering
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+I = TypeVar("I", bound="IntegerValue")
+
+
+@total_ordering
+class IntegerValue(BaseModel):
+    """
+    A model whose string ``value`` has a canonical integer form.
+
+    Subclasses provide ``_to_int`` and ``_from_int`` to convert between a
+    valid value and its integer. ``int()`` converts on demand rather than
+    caching, so instances cost no more than a plain single-field model.
+    Equality, hashing and ordering use the integer; the value still
+    serializes exactly as received.
+    """
+
+    value: str
+
+    @staticmethod
+    @abstractmethod
+    def _to_int(value: str) -> int:
+        """Integer form of a valid value."""
+
+    @staticmethod
+    @abstractmethod
+    def _from_int(number: int) -> str:
+        """Value spelling of an integer form."""
+
+    @classmethod
+    def from_int(cls: Type[I], number: int) -> I:
+        """Build an instance from its integer form."""
+        return cls(value=cls._from_int(number))
+
+    def __int__(self) -> int:
+        return self._to_int(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        # Values parsed by the same function share one integer space.
+        if not isinstance(other, IntegerValue) or other._to_int is not self._to_int:
+            return NotImplemented
+        return int(self) == int(other)
+
+    def __lt__(self, other: "IntegerValue") -> bool:
+        if not isinstance(other, IntegerValue) or other._to_int is not self._to_int:
+            return NotImplemented
+        return int(self) < int(other)
+
+    def __hash__(self) -> int:
+        return hash(int(self))
+
+    def __str__(self) -> str:
+        return self.value
@@ -0,0 +1,85 @@
+"""Interning cache for frequently repeated CAMARA values."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, NamedTuple, Tuple, Type, TypeVar, cast
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class InternCacheInfo(NamedTuple):
+    """Counters reported by ``InternCache.info``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class InternCache:
+    """
+    Thread-safe bounded LRU of validated single-value models.
+
+    ``get(SingleIpv4Addr, "84.125.93.10")`` validates the raw value the
+    first time it is seen and returns the same instance on later calls, so
+    hot values such as carrier gateway addresses, common ports or test phone
+    numbers are validated once. Works for any model with a single ``value``
+    field: SingleIpv4Addr, DeviceIpv6Address, Port, PhoneNumber and the
+    like. Entries are keyed by ``(model class, raw value)`` and the least
+    recently used entry is evicted once ``maxsize`` is reached.
+
+    Interned instances are shared between every caller, so they must be
+    treated as read-only; assigning to a field of one changes it for all.
+    Validation runs outside the lock, so a ValidationError propagates
+    without caching anything.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("InternCache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[type, Any], BaseModel]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, cls: Type[M], raw: Any) -> M:
+        """Return the shared ``cls`` instance for ``raw``, validating on a miss."""
+        key = (cls, raw)
+        with self._lock:
+            instance = self._entries.get(key)
+            if instance is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cast(M, instance)
+            self._misses += 1
+        created = cls(value=raw)
+        with self._lock:
+            # Another thread may have interned the same value meanwhile.
+            instance = self._entries.get(key)
+            if instance is not None:
+                self._entries.move_to_end(key)
+                return cast(M, instance)
+            self._entries[key] = created
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return created
+
+    def info(self) -> InternCacheInfo:
+        """Return hit and miss counters and the current size."""
+        with self._lock:
+            return InternCacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,23 @@
+"""Pydantic's lax string coercion for batch parsers that skip the models."""
+
+_STRING_TYPE = "Input should be a valid string"
+_STRING_UNICODE = (
+    "Input should be a valid string, unable to parse raw data as a unicode string"
+)
+
+
+def lax_str(value: object) -> str:
+    """
+    Coerce a value the way a pydantic ``str`` field does in lax mode.
+
+    Strings pass through and bytes are decoded as UTF-8; anything else
+    raises ValueError with pydantic's message for the same input.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            return value.decode()
+        except UnicodeDecodeError:
+            raise ValueError(_STRING_UNICODE)
+    raise ValueError(_STRING_TYPE)
@@ -0,0 +1,17 @@
+"""Equality for models whose private attributes only hold caches."""
+
+from pydantic import BaseModel
+
+
+def fields_equal(model: BaseModel, other: BaseModel) -> bool:
+    """
+    ``BaseModel.__eq__`` without the private attribute comparison.
+
+    For models whose private attributes only memoize values derived from
+    their fields, so filling a cache does not change equality.
+    """
+    return (
+        type(model) is type(other)
+        and model.__dict__ == other.__dict__
+        and (model.__pydantic_extra__ or {}) == (other.__pydantic_extra__ or {})
+    )
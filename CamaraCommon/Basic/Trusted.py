@@ -0,0 +1,102 @@
+"""Validation-free construction of CAMARA models from trusted data."""
+
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+_Defaults = Tuple[Optional[Dict[str, Any]], List[str], Optional[Dict[str, Any]]]
+
+# Per model class: (every field in declaration order mapped to its default,
+# or None for single-field models; names of fields with a default factory;
+# private attribute defaults or None). Serialization follows __dict__ order,
+# so instance dicts are built from the ordered template.
+_DEFAULTS: Dict[type, _Defaults] = {}
+
+# BaseModel keeps its state in slots; setting them through the slot
+# descriptors bypasses BaseModel.__setattr__.
+_new = object.__new__
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _defaults(cls: Type[BaseModel]) -> _Defaults:
+    defaults = _DEFAULTS.get(cls)
+    if defaults is None:
+        template = {}
+        factories = []
+        for name, field in cls.model_fields.items():
+            if field.default_factory is not None:
+                factories.append(name)
+            template[name] = None if field.is_required() else field.default
+        private = {
+            name: attr.get_default()
+            for name, attr in cls.__private_attributes__.items()
+        }
+        single = len(template) == 1 and not factories
+        defaults = _DEFAULTS[cls] = (
+            None if single else template,
+            factories,
+            private or None,
+        )
+    return defaults
+
+
+def construct_trusted(cls: Type[M], values: Dict[str, Any]) -> M:
+    """
+    Build ``cls`` from already-validated field values without validation.
+
+    Use only for data this service produced itself, such as rows read back
+    from its own store: invalid input yields an invalid instance rather
+    than an error. The ``from_trusted`` constructors of the models build
+    on this and ``construct_trusted_value``.
+
+    Neither pydantic's core validation nor the model's validators run, so
+    ``values`` must hold every required field with the exact type it
+    declares, including nested model instances. Omitted optional fields
+    take their defaults and are left out of ``model_fields_set``, as with
+    normal construction. The instance may take ownership of ``values``, so
+    pass a fresh dict.
+
+    Unlike ``model_construct`` this skips the per-field default lookup. It
+    pays off for models with Python validators or nested models; models
+    validated entirely by pydantic-core build in about the same time. Plain
+    field defaults and private attribute defaults are shared between
+    instances, so they must be immutable; default factories still run, but
+    are called without the validated data.
+    """
+    template, factories, private = _defaults(cls)
+    if template is None:
+        data = values
+    else:
+        data = dict(template)
+        data.update(values)
+    for name in factories:
+        if name not in values:
+            data[name] = cls.model_fields[name].get_default(call_default_factory=True)
+    instance = _new(cls)
+    _set_dict(instance, data)
+    _set_fields_set(instance, set(values))
+    _set_extra(instance, None)
+    _set_private(instance, None if private is None else dict(private))
+    return instance
+
+
+def construct_trusted_value(cls: Type[M], value: Any) -> M:
+    """
+    Build a model whose only field is ``value``, without validation.
+
+    The leaf types (PhoneNumber, SingleIpv4Addr, Port, ...) all have this
+    shape, so the field template and default handling of
+    ``construct_trusted`` can be skipped.
+    """
+    private = _defaults(cls)[2]
+    instance = _new(cls)
+    _set_dict(instance, {"value": value})
+    _set_fields_set(instance, {"value"})
+    _set_extra(instance, None)
+    _set_private(instance, None if private is None else dict(private))
+    return instance
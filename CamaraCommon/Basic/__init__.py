@@ -1,4 +1,7 @@
 """Basic data types for CAMARA APIs."""
 
+from .IntegerValue import IntegerValue as IntegerValue
+from .InternCache import InternCache as InternCache
+from .InternCache import InternCacheInfo as InternCacheInfo
 from .TimePeriod import TimePeriod as TimePeriod
 from .XCorrelator import XCorrelator as XCorrelator
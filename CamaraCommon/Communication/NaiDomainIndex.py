@@ -0,0 +1,88 @@
+"""Per-domain index of network access identifiers."""
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .NaiParser import parse_external_identifiers
+from .NetworkAccessIdentifier import NetworkAccessIdentifier
+
+
+class NaiDomainIndex:
+    """
+    Network access identifiers grouped by their Domain Identifier.
+
+    Supports per-operator fan-out: ``identifiers("operator.example")``
+    returns every indexed identifier of that domain without scanning the
+    rest. Domains are matched case-insensitively and stored as the interned
+    strings produced by ``NetworkAccessIdentifier.domain_identifier``, so
+    each distinct domain is held once. Identifiers that are not
+    well-formed External Identifiers are rejected with ValueError.
+    """
+
+    def __init__(self) -> None:
+        self._domains: Dict[str, List[NetworkAccessIdentifier]] = {}
+
+    @classmethod
+    def from_identifiers(
+        cls, identifiers: Iterable[NetworkAccessIdentifier]
+    ) -> "NaiDomainIndex":
+        """Build an index from identifier models."""
+        index = cls()
+        for identifier in identifiers:
+            index.add(identifier)
+        return index
+
+    @classmethod
+    def from_strings(cls, values: Iterable[str]) -> "NaiDomainIndex":
+        """
+        Build an index from raw strings, parsing them in bulk.
+
+        Raises ValueError naming the first malformed identifier.
+        """
+        values = list(values)
+        parsed = parse_external_identifiers(values)
+        index = cls()
+        domains = index._domains
+        from_trusted = NetworkAccessIdentifier.from_trusted
+        for value, valid, domain, error in zip(
+            values, parsed.valid, parsed.domain, parsed.errors
+        ):
+            if not valid:
+                raise ValueError(error)
+            identifier = from_trusted(value)
+            group = domains.get(domain)
+            if group is None:
+                group = domains[domain] = []
+            group.append(identifier)
+        return index
+
+    def add(self, identifier: NetworkAccessIdentifier) -> None:
+        """Index ``identifier`` under its domain."""
+        domain = identifier.domain_identifier
+        group = self._domains.get(domain)
+        if group is None:
+            group = self._domains[domain] = []
+        group.append(identifier)
+
+    def identifiers(self, domain: str) -> List[NetworkAccessIdentifier]:
+        """Return the identifiers of ``domain``, in insertion order."""
+        return list(self._domains.get(domain.lower(), ()))
+
+    def domains(self) -> List[str]:
+        """Return the indexed domains."""
+        return list(self._domains)
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of identifiers per domain."""
+        return {domain: len(group) for domain, group in self._domains.items()}
+
+    def items(self) -> Iterator[Tuple[str, List[NetworkAccessIdentifier]]]:
+        """Iterate over ``(domain, identifiers)`` groups."""
+        for domain, group in self._domains.items():
+            yield domain, list(group)
+
+    def __contains__(self, domain: object) -> bool:
+        return isinstance(domain, str) and domain.lower() in self._domains
+
+    def __len__(self) -> int:
+        """Number of indexed identifiers."""
+        return sum(len(group) for group in self._domains.values())
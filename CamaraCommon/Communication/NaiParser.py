@@ -0,0 +1,108 @@
+"""External Identifier parsing for network access identifiers."""
+
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from CamaraCommon.Basic.LaxString import lax_str
+
+_LABEL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+
+
+def _domain_error(domain: str) -> Optional[str]:
+    if not domain:
+        return "missing Domain Identifier"
+    if len(domain) > 253:
+        return "Domain Identifier longer than 253 characters"
+    for label in domain.split("."):
+        if not 1 <= len(label) <= 63:
+            return "Domain Identifier labels must be 1-63 characters"
+        if label[0] == "-" or label[-1] == "-":
+            return "Domain Identifier labels must not start or end with '-'"
+        if not _LABEL_CHARS.issuperset(label):
+            return "Domain Identifier must use letters, digits, '-' and '.'"
+    return None
+
+
+def _local_error(local: str) -> Optional[str]:
+    if not local:
+        return "missing Local Identifier"
+    if "@" in local:
+        return "more than one '@'"
+    if not local.isascii() or not local.isprintable() or " " in local:
+        return "Local Identifier must be printable ASCII without spaces"
+    return None
+
+
+def split_external_identifier(value: str) -> Tuple[str, str]:
+    """
+    Split ``{Local Identifier}@{Domain Identifier}`` into its two parts.
+
+    The domain is lower-cased and interned, so every identifier of one
+    operator shares a single domain string. Raises ValueError when
+    ``value`` is not a well-formed External Identifier: exactly one ``@``,
+    a non-empty printable local part and a DNS-style domain.
+    """
+    local, at, domain = value.rpartition("@")
+    domain = domain.lower()
+    error = "missing '@'" if not at else _local_error(local) or _domain_error(domain)
+    if error is not None:
+        raise ValueError(f"Invalid External Identifier {value!r}: {error}")
+    return local, sys.intern(domain)
+
+
+class NaiBatchResult(NamedTuple):
+    """
+    Outcome of parsing a column of network access identifier strings.
+
+    Invalid rows hold empty ``local`` and ``domain`` strings and an error
+    message; equal domains share one interned string object.
+    """
+
+    valid: List[bool]
+    local: List[str]
+    domain: List[str]
+    errors: List[Optional[str]]
+
+
+def parse_external_identifiers(values: Iterable[object]) -> NaiBatchResult:
+    """
+    Parse many External Identifiers without building models.
+
+    Rows are accepted or rejected exactly as ``split_external_identifier``
+    would, with the same error message. Bytes rows are decoded as UTF-8
+    and other non-string rows get pydantic's message, as for the model.
+    """
+    valid: List[bool] = []
+    locals_: List[str] = []
+    domains: List[str] = []
+    errors: List[Optional[str]] = []
+    # Domains repeat heavily, so each distinct one is checked and interned once.
+    seen: Dict[str, Tuple[str, Optional[str]]] = {}
+    for value in values:
+        try:
+            text = lax_str(value)
+        except ValueError as exc:
+            error: Optional[str] = str(exc)
+        else:
+            local, at, domain = text.rpartition("@")
+            if not at:
+                error = "missing '@'"
+            else:
+                parsed = seen.get(domain)
+                if parsed is None:
+                    lowered = domain.lower()
+                    parsed = (sys.intern(lowered), _domain_error(lowered))
+                    seen[domain] = parsed
+                error = _local_error(local) or parsed[1]
+                if error is None:
+                    valid.append(True)
+                    locals_.append(local)
+                    domains.append(parsed[0])
+                    errors.append(None)
+                    continue
+            error = f"Invalid External Identifier {text!r}: {error}"
+        valid.append(False)
+        locals_.append("")
+        domains.append("")
+        errors.append(error)
+    return NaiBatchResult(valid, locals_, domains, errors)
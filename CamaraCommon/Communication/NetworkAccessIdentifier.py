@@ -1,6 +1,13 @@
 """NetworkAccessIdentifier data type for CAMARA APIs."""
 
-from pydantic import BaseModel
+from typing import Iterable, Tuple
+
+from pydantic import BaseModel, ValidationInfo, model_validator
+
+from CamaraCommon.Basic.Trusted import construct_trusted_value
+
+from .NaiParser import (NaiBatchResult, parse_external_identifiers,
+                        split_external_identifier)
 
 
 class NetworkAccessIdentifier(BaseModel):
@@ -12,10 +19,68 @@ class NetworkAccessIdentifier(BaseModel):
     Unlike the telephone number, the network access identifier is not
     subjected to portability ruling in force, and is individually
     managed by each operator.
+
+    Any string is accepted by default; validate with
+    ``context={"external_identifier": True}`` to require the External
+    Identifier format. ``local_identifier`` and ``domain_identifier`` split
+    the value on demand, with the domain lower-cased and interned; nothing
+    is cached on the instance, so construction stays as cheap as a plain
+    string model. ``parse_batch`` splits many values at once.
     """
 
     value: str
 
+    @model_validator(mode="after")
+    def check_external_identifier(
+        self, info: ValidationInfo
+    ) -> "NetworkAccessIdentifier":
+        """Validate the format when requested through the validation context."""
+        if info.context and info.context.get("external_identifier"):
+            self.parts()
+        return self
+
+    @classmethod
+    def from_trusted(cls, value: str) -> "NetworkAccessIdentifier":
+        """Build an identifier from a trusted value; see ``construct_trusted``."""
+        return construct_trusted_value(cls, value)
+
+    @classmethod
+    def parse_batch(cls, values: Iterable[str]) -> NaiBatchResult:
+        """
+        Split many identifiers at once without building models.
+
+        Returns a validity mask, local and domain columns and per-row error
+        messages; each distinct domain is one shared interned string.
+        """
+        return parse_external_identifiers(values)
+
+    def parts(self) -> Tuple[str, str]:
+        """
+        Return ``(local identifier, domain identifier)``.
+
+        Raises ValueError if the value is not a well-formed External
+        Identifier.
+        """
+        return split_external_identifier(self.value)
+
+    @property
+    def local_identifier(self) -> str:
+        """The part before the ``@``."""
+        return self.parts()[0]
+
+    @property
+    def domain_identifier(self) -> str:
+        """The lower-cased, interned part after the ``@``."""
+        return self.parts()[1]
+
+    def is_external_identifier(self) -> bool:
+        """Return whether the value is a well-formed External Identifier."""
+        try:
+            self.parts()
+        except ValueError:
+            return False
+        return True
+
     def __str__(self) -> str:
         return self.value
 
@@ -1,15 +1,29 @@
 """PhoneNumber data type for CAMARA APIs."""
 
-from pydantic import BaseModel, Field
+from typing import Any, Iterable, Optional
 
+from pydantic import Field
 
-class PhoneNumber(BaseModel):
+from CamaraCommon.Basic.IntegerValue import IntegerValue
+from CamaraCommon.Basic.Trusted import construct_trusted_value
+
+from .PhoneNumberParser import PhoneNumberBatchResult, parse_phone_numbers
+from .PhonePrefixTable import PhonePrefixTable
+
+
+class PhoneNumber(IntegerValue):
     """
     A public identifier addressing a telephone subscription.
 
     In mobile networks it corresponds to the MSISDN (Mobile Station International
     Subscriber Directory Number). Must be formatted in international format,
     according to E.164 standard, prefixed with '+'.
+
+    ``int(number)`` is the digit string read as an integer, at most 15 digits,
+    so it fits in a uint64. The pattern forbids a leading zero, so the
+    integer converts back to the exact value and no digit count needs to be
+    stored alongside it. Equality, hashing and ordering use the integer,
+    computed on demand; ``PhoneNumberArray`` stores numbers packed in bulk.
     """
 
     value: str = Field(
@@ -18,5 +32,27 @@ class PhoneNumber(BaseModel):
         examples=["+123456789"],
     )
 
-    def __str__(self) -> str:
-        return self.value
+    @classmethod
+    def from_trusted(cls, value: str) -> "PhoneNumber":
+        """Build a phone number from a trusted value; see ``construct_trusted``."""
+        return construct_trusted_value(cls, value)
+
+    @classmethod
+    def parse_batch(
+        cls, values: Iterable[object], routes: Optional[PhonePrefixTable[Any]] = None
+    ) -> PhoneNumberBatchResult:
+        """
+        Parse many E.164 strings at once without building models.
+
+        Returns columns of validity, country code, national number and the
+        routing tag from ``routes``; validity matches the value pattern.
+        """
+        return parse_phone_numbers(values, routes)
+
+    @staticmethod
+    def _to_int(value: str) -> int:
+        return int(value[1:])
+
+    @staticmethod
+    def _from_int(number: int) -> str:
+        return f"+{number}"
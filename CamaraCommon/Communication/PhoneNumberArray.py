@@ -0,0 +1,104 @@
+"""PhoneNumberArray compact phone number set for CAMARA APIs."""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Union
+
+from .PhoneNumber import PhoneNumber
+from .PhoneNumberParser import is_e164
+
+PhoneNumberLike = Union[PhoneNumber, str, int]
+
+
+def _pack(number: PhoneNumberLike) -> int:
+    if isinstance(number, PhoneNumber):
+        return int(number)
+    if isinstance(number, str):
+        if not is_e164(number):
+            raise ValueError(f"Invalid E.164 phone number: {number}")
+        return int(number[1:])
+    if not 10**4 <= number < 10**15:
+        raise ValueError(f"Invalid E.164 phone number: +{number}")
+    return number
+
+
+class PhoneNumberArray:
+    """
+    Sorted set of phone numbers packed into a uint64 array.
+
+    Each number is stored as ``int(PhoneNumber)``, eight bytes instead of a
+    model and its string. Numbers are kept sorted and unique, so membership
+    and ``index`` are binary searches. Strings are checked against the
+    PhoneNumber pattern without building models; PhoneNumber instances are
+    only created when items are read back.
+    """
+
+    __slots__ = ("_numbers",)
+
+    def __init__(self, numbers: Iterable[PhoneNumberLike] = ()) -> None:
+        self._numbers = array("Q", sorted({_pack(number) for number in numbers}))
+
+    def add(self, number: PhoneNumberLike) -> None:
+        """Insert ``number``, keeping the array sorted; duplicates are ignored."""
+        packed = _pack(number)
+        numbers = self._numbers
+        index = bisect_left(numbers, packed)
+        if index == len(numbers) or numbers[index] != packed:
+            numbers.insert(index, packed)
+
+    def update(self, numbers: Iterable[PhoneNumberLike]) -> None:
+        """Insert many numbers with a single re-sort."""
+        merged = set(self._numbers)
+        merged.update(_pack(number) for number in numbers)
+        self._numbers = array("Q", sorted(merged))
+
+    def index(self, number: PhoneNumberLike) -> int:
+        """Return the position of ``number``; raises ValueError if absent."""
+        packed = _pack(number)
+        numbers = self._numbers
+        index = bisect_left(numbers, packed)
+        if index == len(numbers) or numbers[index] != packed:
+            raise ValueError(f"{number} is not in PhoneNumberArray")
+        return index
+
+    def contains_batch(self, numbers: Iterable[int]) -> List[bool]:
+        """Test membership of many integer-form numbers at once."""
+        stored = self._numbers
+        size = len(stored)
+        result = []
+        for packed in numbers:
+            index = bisect_left(stored, packed)
+            result.append(index < size and stored[index] == packed)
+        return result
+
+    def to_strings(self) -> List[str]:
+        """Return the numbers as E.164 strings in ascending order."""
+        return [f"+{packed}" for packed in self._numbers]
+
+    def __contains__(self, number: object) -> bool:
+        if not isinstance(number, (PhoneNumber, str, int)):
+            return False
+        try:
+            self.index(number)
+        except ValueError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __getitem__(self, index: int) -> PhoneNumber:
+        return PhoneNumber.from_trusted(f"+{self._numbers[index]}")
+
+    def __iter__(self) -> Iterator[PhoneNumber]:
+        from_trusted = PhoneNumber.from_trusted
+        for packed in self._numbers:
+            yield from_trusted(f"+{packed}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PhoneNumberArray):
+            return NotImplemented
+        return self._numbers == other._numbers
+
+    def __repr__(self) -> str:
+        return f"PhoneNumberArray({self.to_strings()!r})"
@@ -0,0 +1,145 @@
+"""E.164 country calling codes and bulk phone number parsing."""
+
+from array import array
+from typing import Any, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from CamaraCommon.Basic.LaxString import lax_str
+
+from .PhonePrefixTable import PhonePrefixTable
+
+# ITU-T E.164 assigned country calling codes. The set is prefix-free, so at
+# most one of the first one, two or three digits of a number is a member.
+COUNTRY_CODES: FrozenSet[str] = frozenset("""
+    1 7
+    20 27 30 31 32 33 34 36 39 40 41 43 44 45 46 47 48 49
+    51 52 53 54 55 56 57 58 60 61 62 63 64 65 66 81 82 84 86
+    90 91 92 93 94 95 98
+    211 212 213 216 218 220 221 222 223 224 225 226 227 228 229
+    230 231 232 233 234 235 236 237 238 239 240 241 242 243 244 245 246 247
+    248 249 250 251 252 253 254 255 256 257 258 260 261 262 263 264 265 266
+    267 268 269 290 291 297 298 299
+    350 351 352 353 354 355 356 357 358 359 370 371 372 373 374 375 376 377
+    378 379 380 381 382 383 385 386 387 389
+    420 421 423
+    500 501 502 503 504 505 506 507 508 509 590 591 592 593 594 595 596 597
+    598 599
+    670 672 673 674 675 676 677 678 679 680 681 682 683 685 686 687 688 689
+    690 691 692
+    800 808 850 852 853 855 856 870 878 880 881 882 883 886 888
+    960 961 962 963 964 965 966 967 968 970 971 972 973 974 975 976 977 979
+    992 993 994 995 996 998
+    """.split())
+
+
+def is_e164(value: str) -> bool:
+    """
+    Return whether ``value`` matches the PhoneNumber pattern.
+
+    Equivalent to ``^\\+[1-9][0-9]{4,14}$`` without running a regex.
+    """
+    return (
+        6 <= len(value) <= 16
+        and value[0] == "+"
+        and value[1] != "0"
+        and value[1:].isdigit()
+        and value.isascii()
+    )
+
+
+def split_country_code(digits: str) -> Tuple[int, str]:
+    """
+    Split E.164 digits (without ``+``) into country code and national number.
+
+    Returns ``(0, digits)`` when the number does not start with an assigned
+    country calling code.
+    """
+    for length in (1, 2, 3):
+        code = digits[:length]
+        if code in COUNTRY_CODES:
+            return int(code), digits[length:]
+    return 0, digits
+
+
+class PhoneNumberBatchResult(NamedTuple):
+    """
+    Columnar outcome of parsing a batch of E.164 strings.
+
+    ``valid`` matches PhoneNumber validation row for row. For valid rows
+    ``country_code`` holds the calling code (0 when it is unassigned),
+    ``national_number`` the remaining digits as an integer and
+    ``national_length`` their count, which keeps leading zeros of the
+    national part recoverable. ``routing_tag`` holds the PhonePrefixTable
+    match, if a table was given. Invalid rows hold zeros and ``None``.
+    """
+
+    valid: List[bool]
+    country_code: "array[int]"
+    national_number: "array[int]"
+    national_length: "array[int]"
+    routing_tag: List[Optional[Any]]
+
+    def national_digits(self, index: int) -> str:
+        """Return the national number of row ``index`` as a digit string."""
+        return str(self.national_number[index]).zfill(self.national_length[index])
+
+
+def parse_phone_numbers(
+    values: Iterable[object], routes: Optional[PhonePrefixTable[Any]] = None
+) -> PhoneNumberBatchResult:
+    """
+    Parse a batch of E.164 strings into columns without building models.
+
+    ``routes`` maps number ranges to routing tags by longest prefix. Bytes
+    rows are decoded as UTF-8, as pydantic's lax string mode does.
+    """
+    valid: List[bool] = []
+    country_codes = array("H")
+    national_numbers = array("Q")
+    national_lengths = array("B")
+    tags: List[Optional[Any]] = []
+    codes = COUNTRY_CODES
+    lookup = routes.lookup_digits if routes is not None else None
+    add_valid = valid.append
+    add_code = country_codes.append
+    add_national = national_numbers.append
+    add_length = national_lengths.append
+    add_tag = tags.append
+    for value in values:
+        if isinstance(value, (bytes, bytearray)):
+            try:
+                value = lax_str(value)
+            except ValueError:
+                pass  # undecodable, so rejected below
+        # is_e164, inlined for the hot loop.
+        if not (
+            isinstance(value, str)
+            and 6 <= len(value) <= 16
+            and value[0] == "+"
+            and value[1] != "0"
+            and value[1:].isdigit()
+            and value.isascii()
+        ):
+            add_valid(False)
+            add_code(0)
+            add_national(0)
+            add_length(0)
+            add_tag(None)
+            continue
+        digits = value[1:]
+        if digits[0] in codes:
+            split = 1
+        elif digits[:2] in codes:
+            split = 2
+        elif digits[:3] in codes:
+            split = 3
+        else:
+            split = 0
+        national = digits[split:]
+        add_valid(True)
+        add_code(int(digits[:split]) if split else 0)
+        add_national(int(national))
+        add_length(len(national))
+        add_tag(lookup(digits) if lookup is not None else None)
+    return PhoneNumberBatchResult(
+        valid, country_codes, national_numbers, national_lengths, tags
+    )
@@ -0,0 +1,92 @@
+"""Longest-prefix-match table for E.164 number ranges."""
+
+from typing import (TYPE_CHECKING, Dict, Generic, Iterable, List, Optional,
+                    Tuple, TypeVar, Union)
+
+if TYPE_CHECKING:
+    from .PhoneNumber import PhoneNumber
+
+V = TypeVar("V")
+
+
+def _digits(number: Union["PhoneNumber", str]) -> str:
+    # PhoneNumber.__str__ returns its value.
+    value = str(number)
+    return value[1:] if value.startswith("+") else value
+
+
+class PhonePrefixTable(Generic[V]):
+    """
+    Longest-prefix-match table mapping E.164 number ranges to routing values.
+
+    Prefixes are digit strings such as ``"+4917"`` (the ``+`` is optional),
+    stored in one hash table per prefix length. A lookup slices the number
+    once per populated length, longest first, so it costs at most 15 dict
+    probes whatever the table size. ``None`` cannot be stored as a value
+    because it signals a miss.
+    """
+
+    def __init__(self) -> None:
+        self._tables: Dict[int, Dict[str, V]] = {}
+        # Populated prefix lengths, longest first.
+        self._lengths: List[int] = []
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, V]]) -> "PhonePrefixTable[V]":
+        """Build a table from ``(prefix, value)`` pairs."""
+        table: "PhonePrefixTable[V]" = cls()
+        for prefix, value in items:
+            table.insert(prefix, value)
+        return table
+
+    @staticmethod
+    def _parse(prefix: str) -> str:
+        digits = _digits(prefix)
+        if not (1 <= len(digits) <= 15 and digits.isascii() and digits.isdigit()):
+            raise ValueError(f"Invalid E.164 prefix: {prefix}")
+        return digits
+
+    def insert(self, prefix: str, value: V) -> None:
+        """Map every number starting with ``prefix`` to ``value``."""
+        if value is None:
+            raise ValueError("PhonePrefixTable values must not be None")
+        digits = self._parse(prefix)
+        table = self._tables.get(len(digits))
+        if table is None:
+            table = self._tables[len(digits)] = {}
+            self._lengths = sorted(self._tables, reverse=True)
+        table[digits] = value
+
+    def delete(self, prefix: str) -> None:
+        """Remove a prefix; raises KeyError if it is not present."""
+        digits = self._parse(prefix)
+        table = self._tables.get(len(digits))
+        if table is None or digits not in table:
+            raise KeyError(prefix)
+        del table[digits]
+        if not table:
+            del self._tables[len(digits)]
+            self._lengths = sorted(self._tables, reverse=True)
+
+    def lookup_digits(self, digits: str) -> Optional[V]:
+        """Longest-prefix match for a number given as digits without ``+``."""
+        tables = self._tables
+        for length in self._lengths:
+            value = tables[length].get(digits[:length])
+            if value is not None:
+                return value
+        return None
+
+    def lookup(self, number: Union["PhoneNumber", str]) -> Optional[V]:
+        """Return the value of the longest prefix of ``number``."""
+        return self.lookup_digits(_digits(number))
+
+    def lookup_many(
+        self, numbers: Iterable[Union["PhoneNumber", str]]
+    ) -> List[Optional[V]]:
+        """Look up a batch of numbers."""
+        lookup_digits = self.lookup_digits
+        return [lookup_digits(_digits(number)) for number in numbers]
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
@@ -1,5 +1,8 @@
 """Communication data types for CAMARA APIs."""
 
+from .NaiDomainIndex import NaiDomainIndex as NaiDomainIndex
 from .NetworkAccessIdentifier import \
     NetworkAccessIdentifier as NetworkAccessIdentifier
 from .PhoneNumber import PhoneNumber as PhoneNumber
+from .PhoneNumberArray import PhoneNumberArray as PhoneNumberArray
+from .PhonePrefixTable import PhonePrefixTable as PhonePrefixTable
@@ -1,12 +1,17 @@
 """Device data type for CAMARA APIs."""
 
-from typing import Optional
+from hashlib import blake2b
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
 
+from CamaraCommon.Basic.ModelEquality import fields_equal
+from CamaraCommon.Basic.Trusted import construct_trusted
 from CamaraCommon.Communication import NetworkAccessIdentifier, PhoneNumber
 from CamaraCommon.Network import DeviceIpv4Addr, DeviceIpv6Address
 
+D = TypeVar("D", bound="Device")
+
 
 class Device(BaseModel):
     """
@@ -27,6 +32,9 @@ class Device(BaseModel):
     NOTE2: as for this Commonalities release, we are enforcing that the
     networkAccessIdentifier is only part of the schema for future-proofing,
     and CAMARA does not currently allow its use.
+
+    ``fingerprint()`` returns a stable digest of the canonical identifiers
+    for use as a cache key, since equal devices can serialize differently.
     """
 
     phoneNumber: Optional[PhoneNumber] = None
@@ -34,6 +42,99 @@ class Device(BaseModel):
     ipv4Address: Optional[DeviceIpv4Addr] = None
     ipv6Address: Optional[DeviceIpv6Address] = None
 
+    # (identifier leaf values, digest) so changing any identifier, at any
+    # depth, invalidates the cached fingerprint.
+    _fingerprint: Optional[Tuple[Tuple[Any, ...], bytes]] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_trusted(
+        cls: Type[D],
+        phoneNumber: Optional[str] = None,
+        networkAccessIdentifier: Optional[str] = None,
+        ipv4Address: Optional[DeviceIpv4Addr] = None,
+        ipv6Address: Optional[str] = None,
+    ) -> D:
+        """
+        Build a device from identifiers known to be valid, skipping validation.
+
+        Pass ``ipv4Address`` as a DeviceIpv4Addr, e.g. from
+        ``DeviceIpv4Addr.from_trusted``. No identifier rules are checked;
+        see ``construct_trusted``.
+        """
+        values: Dict[str, Any] = {}
+        if phoneNumber is not None:
+            values["phoneNumber"] = PhoneNumber.from_trusted(phoneNumber)
+        if networkAccessIdentifier is not None:
+            values["networkAccessIdentifier"] = NetworkAccessIdentifier.from_trusted(
+                networkAccessIdentifier
+            )
+        if ipv4Address is not None:
+            values["ipv4Address"] = ipv4Address
+        if ipv6Address is not None:
+            values["ipv6Address"] = DeviceIpv6Address.from_trusted(ipv6Address)
+        return construct_trusted(cls, values)
+
+    def _identity(self) -> Tuple[Any, ...]:
+        ipv4 = self.ipv4Address
+        return (
+            self.phoneNumber and self.phoneNumber.value,
+            self.networkAccessIdentifier and self.networkAccessIdentifier.value,
+            ipv4 and ipv4.publicAddress.value,
+            ipv4 and ipv4.privateAddress and ipv4.privateAddress.value,
+            ipv4 and ipv4.publicPort and ipv4.publicPort.value,
+            self.ipv6Address and self.ipv6Address.value,
+        )
+
+    def _canonical_bytes(self) -> bytes:
+        # Phone numbers, dotted-quad IPv4 addresses and ports each have a
+        # single valid spelling, so their values are used as they are.
+        parts = []
+        if self.phoneNumber is not None:
+            parts.append("P" + self.phoneNumber.value)
+        nai = self.networkAccessIdentifier
+        if nai is not None:
+            # Domains are case-insensitive; the local part is not. The length
+            # prefix keeps arbitrary identifier text unambiguous.
+            local, at, domain = nai.value.rpartition("@")
+            text = local + at + domain.lower()
+            parts.append(f"N{len(text)}:{text}")
+        ipv4 = self.ipv4Address
+        if ipv4 is not None:
+            parts.append("4" + ipv4.publicAddress.value)
+            if ipv4.privateAddress is not None:
+                parts.append("v" + ipv4.privateAddress.value)
+            if ipv4.publicPort is not None:
+                parts.append(f"p{ipv4.publicPort.value}")
+        if self.ipv6Address is not None:
+            parts.append(f"6{int(self.ipv6Address):032x}")
+        return "\0".join(parts).encode()
+
+    def fingerprint(self) -> bytes:
+        """
+        Return a 16-byte digest of the device's canonical identifiers.
+
+        Identifiers are compared by value, not notation: IPv6 addresses by
+        their integer, NAI domains case-insensitively, and field order or
+        unset fields do not matter. Devices and DeviceResponses with the same
+        identifiers share a fingerprint. The digest is BLAKE2b, memoized on
+        the instance and recomputed only if an identifier changes.
+        """
+        identity = self._identity()
+        private = self.__pydantic_private__  # bypasses BaseModel.__getattr__
+        assert private is not None
+        cached: Optional[Tuple[Tuple[Any, ...], bytes]] = private["_fingerprint"]
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        digest = blake2b(self._canonical_bytes(), digest_size=16).digest()
+        private["_fingerprint"] = (identity, digest)
+        return digest
+
+    def __eq__(self, other: object) -> bool:
+        # The cached fingerprint must not take part in equality.
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return fields_equal(self, other)
+
     @model_validator(mode="after")
     def validate_min_properties(self) -> "Device":
         """Validate that at least one identifier is provided."""
@@ -0,0 +1,154 @@
+"""Multi-key device identity registry for CAMARA APIs."""
+
+from typing import (Any, Dict, Generic, Hashable, List, NamedTuple, Optional,
+                    Tuple, TypeVar)
+
+from .Device import Device
+
+V = TypeVar("V")
+
+
+class DeviceResolution(NamedTuple):
+    """
+    Outcome of ``DeviceRegistry.resolve``.
+
+    ``matches`` maps each identifier of the device that was found to the
+    value it is registered to, keyed by ``phoneNumber``,
+    ``networkAccessIdentifier``, ``ipv4Address.publicPort``,
+    ``ipv4Address.privateAddress`` or ``ipv6Address``. ``value`` is the
+    single value they all agree on, or None when nothing matched or the
+    identifiers conflict.
+    """
+
+    value: Optional[Any]
+    matches: Dict[str, Any]
+
+    @property
+    def conflict(self) -> bool:
+        """Whether the device's identifiers belong to different entries."""
+        values = iter(self.matches.values())
+        first = next(values, None)
+        return any(value != first for value in values)
+
+
+class DeviceRegistry(Generic[V]):
+    """
+    In-memory registry resolving Device identifiers to subscriber values.
+
+    CAMARA requires every identifier of a Device to belong to the same
+    device, so each identifier type has its own hash index and ``resolve``
+    checks all of them, at most five dict probes per call. Keys are the
+    packed integer forms of the identifiers: the MSISDN as
+    ``int(PhoneNumber)``, IPv4 as ``public << 16 | port`` or
+    ``public << 32 | private`` and IPv6 as the ``prefix_len`` (default /64)
+    prefix key, so any address in a device's subnet resolves. The network
+    access identifier is keyed by its value with the domain lowercased, as
+    in the device fingerprint. Each key costs one dict entry and an int, not
+    a model. ``None`` cannot be registered because it signals a miss.
+    """
+
+    def __init__(self, ipv6_prefix_len: int = 64) -> None:
+        if not 0 <= ipv6_prefix_len <= 128:
+            raise ValueError(f"Invalid IPv6 prefix length: {ipv6_prefix_len}")
+        self.ipv6_prefix_len = ipv6_prefix_len
+        self._phone: Dict[int, V] = {}
+        self._nai: Dict[str, V] = {}
+        self._ipv4_port: Dict[int, V] = {}
+        self._ipv4_private: Dict[int, V] = {}
+        self._ipv6: Dict[int, V] = {}
+
+    def _keys(self, device: Device) -> List[Tuple[str, Dict[Any, V], Hashable]]:
+        keys: List[Tuple[str, Dict[Any, V], Hashable]] = []
+        if device.phoneNumber is not None:
+            keys.append(("phoneNumber", self._phone, int(device.phoneNumber)))
+        if device.networkAccessIdentifier is not None:
+            # Domains are case-insensitive; the local part is not.
+            local, at, domain = device.networkAccessIdentifier.value.rpartition("@")
+            keys.append(
+                ("networkAccessIdentifier", self._nai, local + at + domain.lower())
+            )
+        ipv4 = device.ipv4Address
+        if ipv4 is not None:
+            public = int(ipv4.publicAddress)
+            if ipv4.publicPort is not None:
+                keys.append(
+                    (
+                        "ipv4Address.publicPort",
+                        self._ipv4_port,
+                        (public << 16) | int(ipv4.publicPort),
+                    )
+                )
+            if ipv4.privateAddress is not None:
+                keys.append(
+                    (
+                        "ipv4Address.privateAddress",
+                        self._ipv4_private,
+                        (public << 32) | int(ipv4.privateAddress),
+                    )
+                )
+        if device.ipv6Address is not None:
+            keys.append(
+                (
+                    "ipv6Address",
+                    self._ipv6,
+                    device.ipv6Address.prefix_key(self.ipv6_prefix_len),
+                )
+            )
+        return keys
+
+    def register(self, device: Device, value: V, replace: bool = False) -> None:
+        """
+        Register every identifier of ``device`` to ``value``.
+
+        Calling it again for the same value adds identifiers incrementally.
+        An identifier already registered to a different value raises
+        ValueError, and nothing is changed, unless ``replace`` is true.
+        """
+        if value is None:
+            raise ValueError("DeviceRegistry values must not be None")
+        keys = self._keys(device)
+        if not replace:
+            for name, index, key in keys:
+                current = index.get(key)
+                if current is not None and current != value:
+                    raise ValueError(f"{name} is already registered to {current!r}")
+        for _, index, key in keys:
+            index[key] = value
+
+    def unregister(self, device: Device, value: V) -> int:
+        """
+        Remove the identifiers of ``device`` registered to ``value``.
+
+        Identifiers registered to another value are left alone, so a
+        device whose identifiers conflict only loses the entries it owns.
+        Returns how many identifiers were removed.
+        """
+        removed = 0
+        for _, index, key in self._keys(device):
+            current = index.get(key)
+            if current is not None and current == value:
+                del index[key]
+                removed += 1
+        return removed
+
+    def resolve(self, device: Device) -> DeviceResolution:
+        """Look up every identifier of ``device`` and report conflicts."""
+        matches: Dict[str, Any] = {}
+        for name, index, key in self._keys(device):
+            value = index.get(key)
+            if value is not None:
+                matches[name] = value
+        resolution = DeviceResolution(None, matches)
+        if matches and not resolution.conflict:
+            return DeviceResolution(next(iter(matches.values())), matches)
+        return resolution
+
+    def __len__(self) -> int:
+        """Number of registered identifiers across all indexes."""
+        return (
+            len(self._phone)
+            + len(self._nai)
+            + len(self._ipv4_port)
+            + len(self._ipv4_private)
+            + len(self._ipv6)
+        )
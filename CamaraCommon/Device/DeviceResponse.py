@@ -1,9 +1,34 @@
 """DeviceResponse data type for CAMARA APIs."""
 
+from typing import Iterable, List, Sequence, Tuple, Type, TypeVar
+
 from pydantic import BaseModel, model_validator
 
+from CamaraCommon.Basic.Trusted import construct_trusted
+
 from .Device import Device
 
+R = TypeVar("R", bound="DeviceResponse")
+
+# Order in which from_device picks the identifier to return by default.
+IDENTIFIER_PRIORITY: Tuple[str, ...] = (
+    "phoneNumber",
+    "networkAccessIdentifier",
+    "ipv4Address",
+    "ipv6Address",
+)
+
+
+def _check_priority(prefer: Sequence[str]) -> Tuple[str, ...]:
+    if isinstance(prefer, str):
+        prefer = (prefer,)
+    for name in prefer:
+        if name not in IDENTIFIER_PRIORITY:
+            raise ValueError(f"Unknown device identifier: {name!r}")
+    if not prefer:
+        raise ValueError("At least one device identifier must be preferred")
+    return tuple(prefer)
+
 
 class DeviceResponse(Device):
     """
@@ -24,6 +49,53 @@ class DeviceResponse(Device):
     identifiers with a given end user.
     """
 
+    @classmethod
+    def from_device(
+        cls: Type[R], device: Device, prefer: Sequence[str] = IDENTIFIER_PRIORITY
+    ) -> R:
+        """
+        Build the response for ``device`` from its first identifier in ``prefer``.
+
+        ``prefer`` lists field names in priority order; identifiers not
+        listed are never returned. The chosen identifier is already
+        validated, so it is reused as is and no validator runs. Raises
+        ValueError if ``device`` has none of the preferred identifiers.
+        """
+        prefer = _check_priority(prefer)
+        for name in prefer:
+            value = getattr(device, name)
+            if value is not None:
+                return construct_trusted(cls, {name: value})
+        raise ValueError(f"Device has none of the identifiers {list(prefer)}")
+
+    @classmethod
+    def from_devices(
+        cls: Type[R],
+        devices: Iterable[Device],
+        prefer: Sequence[str] = IDENTIFIER_PRIORITY,
+    ) -> List[R]:
+        """
+        Build one response per device, as ``from_device`` would.
+
+        ``prefer`` is checked once for the whole batch. Raises ValueError
+        naming the position of the first device with none of the preferred
+        identifiers.
+        """
+        prefer = _check_priority(prefer)
+        responses: List[R] = []
+        for position, device in enumerate(devices):
+            fields = device.__dict__
+            for name in prefer:
+                value = fields[name]
+                if value is not None:
+                    responses.append(construct_trusted(cls, {name: value}))
+                    break
+            else:
+                raise ValueError(
+                    f"Device {position} has none of the identifiers {list(prefer)}"
+                )
+        return responses
+
     @model_validator(mode="after")
     def validate_max_properties(self) -> "DeviceResponse":
         """Validate that exactly one identifier is provided (maxProperties: 1)."""
@@ -0,0 +1,357 @@
+"""Streaming decoders for large NDJSON and JSON-array Device payloads."""
+
+import codecs
+import json
+from typing import (IO, Any, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Tuple, Union)
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails, from_json
+
+from CamaraCommon.Basic.Trusted import (construct_trusted,
+                                        construct_trusted_value)
+from CamaraCommon.Communication import NetworkAccessIdentifier, PhoneNumber
+from CamaraCommon.Communication.PhoneNumberParser import is_e164
+from CamaraCommon.Network import (DeviceIpv4Addr, DeviceIpv6Address, Port,
+                                  SingleIpv4Addr)
+from CamaraCommon.Network.AddressParser import inet_pton_ipv6, parse_ipv4
+
+from .Device import Device
+
+Source = Union[bytes, IO[bytes], Iterable[bytes]]
+
+CHUNK_SIZE = 1 << 16
+BATCH_SIZE = 1024
+
+# Built once; rows outside the fast path are validated through it a batch
+# at a time.
+_DEVICES: "TypeAdapter[List[Device]]" = TypeAdapter(List[Device])
+
+_DEVICE_FIELDS = frozenset(Device.model_fields)
+_IPV4_FIELDS = frozenset(DeviceIpv4Addr.model_fields)
+_WHITESPACE = " \t\n\r"
+
+
+class DeviceRecord(NamedTuple):
+    """
+    One decoded Device record.
+
+    ``line`` is the 1-based line the record starts on. Exactly one of
+    ``device`` and ``errors`` is set: invalid records carry pydantic's
+    error details, with ``loc`` relative to the record.
+    """
+
+    line: int
+    device: Optional[Device]
+    errors: List[ErrorDetails]
+
+    @property
+    def valid(self) -> bool:
+        """Whether the record decoded into a Device."""
+        return self.device is not None
+
+
+class _Invalid(NamedTuple):
+    # A record that failed before validation, such as malformed JSON.
+    errors: List[ErrorDetails]
+
+
+def _json_error(message: str, raw: Any) -> _Invalid:
+    return _Invalid(
+        [
+            {
+                "type": "json_invalid",
+                "loc": (),
+                "msg": f"Invalid JSON: {message}",
+                "input": raw,
+                "ctx": {"error": message},
+            }
+        ]
+    )
+
+
+def _chunks(source: Source, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+        return
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _leaf_value(item: Any, kind: type) -> Any:
+    # The value of ``{"value": ...}`` when it has exactly type ``kind``.
+    if type(item) is dict and len(item) == 1:
+        value = item.get("value")
+        if type(value) is kind:
+            return value
+    return None
+
+
+def _trusted_address(item: Any) -> Optional[SingleIpv4Addr]:
+    value = _leaf_value(item, str)
+    if value is None:
+        return None
+    try:
+        parse_ipv4(value)
+    except ValueError:
+        return None
+    return construct_trusted_value(SingleIpv4Addr, value)
+
+
+def _trusted_ipv4(item: Any) -> Optional[DeviceIpv4Addr]:
+    if type(item) is not dict or not _IPV4_FIELDS.issuperset(item):
+        return None
+    values: Dict[str, Any] = {}
+    public = _trusted_address(item.get("publicAddress"))
+    if public is None:
+        return None
+    values["publicAddress"] = public
+    if "privateAddress" in item:
+        private = item["privateAddress"]
+        if private is not None:
+            private = _trusted_address(private)
+            if private is None:
+                return None
+        values["privateAddress"] = private
+    if "publicPort" in item:
+        port = item["publicPort"]
+        if port is not None:
+            number = _leaf_value(port, int)
+            if number is None or not 0 <= number <= 65535:
+                return None
+            port = construct_trusted_value(Port, number)
+        values["publicPort"] = port
+    if values.get("privateAddress") is None and values.get("publicPort") is None:
+        return None
+    return construct_trusted(DeviceIpv4Addr, values)
+
+
+def _trusted_device(data: Any) -> Optional[Device]:
+    """
+    Build a Device from decoded JSON in its canonical shape, or return None.
+
+    Covers exact types only: no extra keys, strings where strings are
+    declared and plain integer ports. Values are checked with the same
+    parsers the models use, so everything accepted here validates to an
+    equal Device; anything else is left to pydantic.
+    """
+    if type(data) is not dict or not _DEVICE_FIELDS.issuperset(data):
+        return None
+    values: Dict[str, Any] = {}
+    found = False
+    for name, item in data.items():
+        if item is None:
+            values[name] = None
+            continue
+        if name == "phoneNumber":
+            value = _leaf_value(item, str)
+            if value is None or not is_e164(value):
+                return None
+            model: Any = construct_trusted_value(PhoneNumber, value)
+        elif name == "networkAccessIdentifier":
+            value = _leaf_value(item, str)
+            if value is None:
+                return None
+            model = construct_trusted_value(NetworkAccessIdentifier, value)
+        elif name == "ipv4Address":
+            model = _trusted_ipv4(item)
+            if model is None:
+                return None
+        else:
+            value = _leaf_value(item, str)
+            if value is None:
+                return None
+            # Forms inet_pton does not take are left to the validator.
+            if inet_pton_ipv6(value) is None:
+                return None
+            model = construct_trusted_value(DeviceIpv6Address, value)
+        values[name] = model
+        found = True
+    if not found:
+        return None
+    return construct_trusted(Device, values)
+
+
+def _decode_batch(batch: List[Tuple[int, Any]]) -> List[DeviceRecord]:
+    records: List[DeviceRecord] = []
+    pending: List[int] = []
+    for line, data in batch:
+        if isinstance(data, _Invalid):
+            records.append(DeviceRecord(line, None, data.errors))
+            continue
+        device = _trusted_device(data)
+        if device is None:
+            pending.append(len(records))
+        records.append(DeviceRecord(line, device, []))
+    if not pending:
+        return records
+    items = [batch[index][1] for index in pending]
+    try:
+        devices = _DEVICES.validate_python(items)
+    except ValidationError as exc:
+        failures: Dict[int, List[ErrorDetails]] = {}
+        for error in exc.errors():
+            detail = error.copy()
+            detail["loc"] = error["loc"][1:]
+            failures.setdefault(int(error["loc"][0]), []).append(detail)
+        for position, index in enumerate(pending):
+            errors = failures.get(position)
+            if errors is None:
+                device = Device.model_validate(items[position])
+                records[index] = DeviceRecord(records[index].line, device, [])
+            else:
+                records[index] = DeviceRecord(records[index].line, None, errors)
+        return records
+    for index, device in zip(pending, devices):
+        records[index] = DeviceRecord(records[index].line, device, [])
+    return records
+
+
+def iter_devices_ndjson(
+    source: Source, chunk_size: int = CHUNK_SIZE, batch_size: int = BATCH_SIZE
+) -> Iterator[DeviceRecord]:
+    """
+    Decode newline-delimited JSON, one Device object per line.
+
+    ``source`` is bytes, a binary file or an iterable of byte chunks; files
+    are read ``chunk_size`` bytes at a time, so memory holds one chunk and
+    one batch of records, not the whole input. Blank lines are skipped and
+    every other line yields one DeviceRecord, in order. A malformed line
+    is reported as a ``json_invalid`` error and decoding carries on.
+
+    Lines in the canonical shape are built without pydantic validation,
+    using the same parsers as the models; the others are validated through
+    a cached ``TypeAdapter(List[Device])``, ``batch_size`` lines per call.
+    Either way the result equals ``Device.model_validate_json(line)``.
+    """
+    batch: List[Tuple[int, Any]] = []
+    line = 0
+    tail = b""
+    chunks = _chunks(source, chunk_size)
+    done = False
+    while not done:
+        chunk = next(chunks, None)
+        if chunk is None:
+            done = True
+            data, tail = tail, b""
+        else:
+            data = tail + chunk
+            end = data.rfind(b"\n")
+            if end < 0:
+                tail = data
+                continue
+            data, tail = data[:end], data[end + 1 :]
+        for raw in data.split(b"\n"):
+            line += 1
+            if not raw.strip():
+                continue
+            try:
+                decoded: Any = from_json(raw)
+            except ValueError as exc:
+                decoded = _json_error(str(exc), raw)
+            batch.append((line, decoded))
+            if len(batch) == batch_size:
+                yield from _decode_batch(batch)
+                batch = []
+    if batch:
+        yield from _decode_batch(batch)
+
+
+def iter_devices_json_array(
+    source: Source, chunk_size: int = CHUNK_SIZE, batch_size: int = BATCH_SIZE
+) -> Iterator[DeviceRecord]:
+    """
+    Decode a JSON array of Device objects without loading it whole.
+
+    Takes the same sources as ``iter_devices_ndjson`` and yields one
+    DeviceRecord per array element. Elements are split off with the
+    standard library's C decoder as chunks arrive, so only the chunk and
+    the current element are held. A JSON syntax error cannot be skipped
+    inside an array: it is reported as a ``json_invalid`` record and
+    decoding stops there.
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    batch: List[Tuple[int, Any]] = []
+    text = ""
+    pos = 0
+    line = 1
+    counted = 0
+    # "[" expected, first element or "]", element, "," or "]", end of input.
+    state = "open"
+    chunks = _chunks(source, chunk_size)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        line += text.count("\n", counted, pos)
+        text = text[pos:] + decoder.decode(chunk or b"", final)
+        pos = counted = 0
+        size = len(text)
+        error: Optional[str] = None
+        while error is None:
+            while pos < size and text[pos] in _WHITESPACE:
+                pos += 1
+            if pos == size:
+                break
+            char = text[pos]
+            if state == "open":
+                if char != "[":
+                    error = "expected a JSON array of devices"
+                    break
+                state = "first"
+                pos += 1
+            elif state == "separator" or state == "end":
+                if state == "end":
+                    error = "trailing characters after the array"
+                elif char == ",":
+                    state = "element"
+                    pos += 1
+                elif char == "]":
+                    state = "end"
+                    pos += 1
+                else:
+                    error = "expected ',' or ']' after an array element"
+            elif state == "first" and char == "]":
+                state = "end"
+                pos += 1
+            else:
+                try:
+                    item, end = raw_decode(text, pos)
+                except json.JSONDecodeError as exc:
+                    # Truncated text fails at its end or as an unterminated
+                    # string; any other error is malformed input.
+                    if final or (
+                        exc.pos < size - 6
+                        and not exc.msg.startswith("Unterminated string")
+                    ):
+                        error = exc.msg
+                    break
+                if end == size and not final:
+                    # A number or literal may continue in the next chunk.
+                    break
+                line += text.count("\n", counted, pos)
+                counted = pos
+                batch.append((line, item))
+                if len(batch) == batch_size:
+                    yield from _decode_batch(batch)
+                    batch = []
+                state = "separator"
+                pos = end
+        if error is None and final and state != "end":
+            error = "EOF while parsing a list"
+        if error is not None:
+            line += text.count("\n", counted, pos)
+            batch.append((line, _json_error(error, text[pos : pos + 80])))
+            break
+    if batch:
+        yield from _decode_batch(batch)
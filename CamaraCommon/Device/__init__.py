@@ -1,2 +1,4 @@
 from .Device import Device as Device
+from .DeviceRegistry import DeviceRegistry as DeviceRegistry
+from .DeviceRegistry import DeviceResolution as DeviceResolution
 from .DeviceResponse import DeviceResponse as DeviceResponse
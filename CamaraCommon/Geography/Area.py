@@ -1,15 +1,61 @@
 """Area base schema for CAMARA APIs."""
 
+from abc import abstractmethod
+from typing import List, Sequence
+
 from pydantic import BaseModel
 
 from .AreaType import AreaType
+from .BoundingBox import BoundingBox
+from .Point import Point
+from .PointBatch import PointBatch
 
 
 class Area(BaseModel):
     """
     Base schema for all areas.
 
-    This is used with discriminator for Circle and Polygon types.
+    This is used with discriminator for Circle and Polygon types. The
+    geometry methods are abstract, so only concrete area types can be
+    instantiated.
     """
 
     areaType: AreaType
+
+    @abstractmethod
+    def bounding_box(self) -> BoundingBox:
+        """Return the latitude/longitude box enclosing this area."""
+
+    @abstractmethod
+    def contains_batch(
+        self, latitudes: Sequence[float], longitudes: Sequence[float]
+    ) -> List[bool]:
+        """
+        Test a batch of coordinates for containment in this area.
+
+        Accepts two equally sized sequences of degrees (lists, ``array.array``
+        or NumPy arrays) and returns one boolean per coordinate pair.
+        """
+
+    def contains_coordinates(self, latitude: float, longitude: float) -> bool:
+        """Check whether a single latitude/longitude pair lies in this area."""
+        return self.contains_batch([latitude], [longitude])[0]
+
+    def contains(self, point: Point) -> bool:
+        """Check whether a point lies in this area."""
+        return self.contains_coordinates(point.latitude.value, point.longitude.value)
+
+    def contains_points(self, points: PointBatch) -> List[bool]:
+        """Test every coordinate of a PointBatch for containment."""
+        return self.contains_batch(points.latitudes, points.longitudes)
+
+
+def _check_batch_lengths(
+    latitudes: Sequence[float], longitudes: Sequence[float]
+) -> None:
+    """Ensure the latitude and longitude columns line up."""
+    if len(latitudes) != len(longitudes):
+        raise ValueError(
+            "latitudes and longitudes must have the same length "
+            f"({len(latitudes)} != {len(longitudes)})"
+        )
@@ -0,0 +1,33 @@
+"""BoundingBox helper type for geographic areas."""
+
+from typing import NamedTuple
+
+
+class BoundingBox(NamedTuple):
+    """
+    Latitude/longitude aligned bounding box in degrees.
+
+    Boxes never wrap the antimeridian: an area that crosses it is bounded by
+    the full -180 to 180 longitude range instead.
+    """
+
+    min_latitude: float
+    min_longitude: float
+    max_latitude: float
+    max_longitude: float
+
+    def contains_coordinates(self, latitude: float, longitude: float) -> bool:
+        """Check whether a latitude/longitude pair lies in the box."""
+        return (
+            self.min_latitude <= latitude <= self.max_latitude
+            and self.min_longitude <= longitude <= self.max_longitude
+        )
+
+    def intersects(self, other: "BoundingBox") -> bool:
+        """Check whether two boxes overlap (touching edges count)."""
+        return (
+            self.min_latitude <= other.max_latitude
+            and other.min_latitude <= self.max_latitude
+            and self.min_longitude <= other.max_longitude
+            and other.min_longitude <= self.max_longitude
+        )
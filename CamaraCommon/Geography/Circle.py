@@ -1,9 +1,14 @@
 """Circle area type for CAMARA APIs."""
 
+import math
+from typing import List, Sequence, Tuple
+
 from pydantic import BaseModel, Field
 
-from .Area import Area
+from .Area import Area, _check_batch_lengths
 from .AreaType import AreaType
+from .BoundingBox import BoundingBox
+from .Distance import EARTH_RADIUS_METERS, _haversines, _radian_columns
 from .Point import Point
 
 
@@ -17,3 +22,84 @@ class Circle(Area):
     areaType: AreaType = AreaType.CIRCLE
     center: Point
     radius: float = Field(ge=1, description="Distance from the center in meters")
+
+    def bounding_box(self) -> BoundingBox:
+        """
+        Return the box enclosing the circle.
+
+        Circles reaching a pole or crossing the antimeridian are bounded by
+        the full longitude range.
+        """
+        latitude = self.center.latitude.value
+        longitude = self.center.longitude.value
+        angle = self.radius / EARTH_RADIUS_METERS
+        delta_lat = math.degrees(angle)
+        min_lat = latitude - delta_lat
+        max_lat = latitude + delta_lat
+        if min_lat <= -90.0 or max_lat >= 90.0:
+            return BoundingBox(max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0)
+
+        ratio = math.sin(angle) / math.cos(math.radians(latitude))
+        if angle >= math.pi / 2.0 or ratio >= 1.0:
+            return BoundingBox(min_lat, -180.0, max_lat, 180.0)
+        delta_lon = math.degrees(math.asin(ratio))
+        min_lon = longitude - delta_lon
+        max_lon = longitude + delta_lon
+        if min_lon < -180.0 or max_lon > 180.0:
+            return BoundingBox(min_lat, -180.0, max_lat, 180.0)
+        return BoundingBox(min_lat, min_lon, max_lat, max_lon)
+
+    def contains_batch(
+        self, latitudes: Sequence[float], longitudes: Sequence[float]
+    ) -> List[bool]:
+        """
+        Test a batch of coordinates against the circle using haversine distance.
+
+        A coordinate is inside when its great-circle distance from the center
+        is at most ``radius``. The haversine term is compared against a
+        precomputed threshold, so no square roots or arcsines are evaluated
+        per coordinate.
+        """
+        _check_batch_lengths(latitudes, longitudes)
+        angle = self.radius / EARTH_RADIUS_METERS
+        if angle >= math.pi:
+            return [True] * len(latitudes)
+        threshold = math.sin(angle / 2.0) ** 2
+        haversines = _haversines(
+            self.center.latitude.value,
+            self.center.longitude.value,
+            *_radian_columns(latitudes, longitudes),
+        )
+        return [hav <= threshold for hav in haversines]
+
+
+def _longitude_spans(circle: Circle, box: BoundingBox) -> List[Tuple[float, float]]:
+    """
+    Longitude spans covered by a circle with bounding box ``box``.
+
+    Bounding boxes never wrap, so a circle crossing the antimeridian gets
+    the full longitude range; it is split into its two spans at +/-180
+    here. Circles reaching a pole really do span every longitude.
+    """
+    if (
+        box.min_longitude == -180.0
+        and box.max_longitude == 180.0
+        and -90.0 < box.min_latitude
+        and box.max_latitude < 90.0
+    ):
+        angle = circle.radius / EARTH_RADIUS_METERS
+        ratio = math.sin(angle) / math.cos(math.radians(circle.center.latitude.value))
+        if angle < math.pi / 2.0 and ratio < 1.0:
+            longitude = circle.center.longitude.value
+            delta_lon = math.degrees(math.asin(ratio))
+            if longitude - delta_lon < -180.0:
+                return [
+                    (-180.0, longitude + delta_lon),
+                    (longitude - delta_lon + 360.0, 180.0),
+                ]
+            if longitude + delta_lon > 180.0:
+                return [
+                    (-180.0, longitude + delta_lon - 360.0),
+                    (longitude - delta_lon, 180.0),
+                ]
+    return [(box.min_longitude, box.max_longitude)]
@@ -0,0 +1,253 @@
+"""Distance calculations between CAMARA points."""
+
+import math
+from typing import Iterator, List, Sequence, Tuple, Union
+
+from .DistanceMethod import DistanceMethod
+from .Point import Point
+from .PointBatch import PointBatch
+
+# Mean Earth radius (IUGG) in meters, used for haversine distances.
+EARTH_RADIUS_METERS = 6_371_008.8
+
+# WGS-84 ellipsoid parameters for Vincenty distances.
+WGS84_SEMI_MAJOR_AXIS = 6_378_137.0
+WGS84_FLATTENING = 1 / 298.257223563
+WGS84_SEMI_MINOR_AXIS = WGS84_SEMI_MAJOR_AXIS * (1 - WGS84_FLATTENING)
+
+_VINCENTY_MAX_ITERATIONS = 200
+_VINCENTY_TOLERANCE = 1e-12
+
+Points = Union[
+    Point, PointBatch, Sequence[Point], Tuple[Sequence[float], Sequence[float]]
+]
+
+
+def _columns(points: Points) -> Tuple[Sequence[float], Sequence[float]]:
+    """Normalize any supported point input to (latitudes, longitudes) columns."""
+    if isinstance(points, Point):
+        return [points.latitude.value], [points.longitude.value]
+    if isinstance(points, PointBatch):
+        return points.latitudes, points.longitudes
+    if (
+        isinstance(points, tuple)
+        and len(points) == 2
+        and not isinstance(points[0], Point)
+    ):
+        latitudes, longitudes = points
+        if len(latitudes) != len(longitudes):
+            raise ValueError(
+                "latitudes and longitudes must have the same length "
+                f"({len(latitudes)} != {len(longitudes)})"
+            )
+        return latitudes, longitudes
+    return (
+        [point.latitude.value for point in points],
+        [point.longitude.value for point in points],
+    )
+
+
+def _wrap_longitude(delta: float) -> float:
+    """Reduce a longitude difference to the range [-180, 180)."""
+    return (delta + 180.0) % 360.0 - 180.0
+
+
+def _radian_columns(
+    latitudes: Sequence[float], longitudes: Sequence[float]
+) -> Tuple[List[float], List[float], List[float]]:
+    """Split degree columns into latitude, latitude cosine and longitude radians."""
+    phis = [math.radians(lat) for lat in latitudes]
+    return (
+        phis,
+        [math.cos(phi) for phi in phis],
+        [math.radians(lon) for lon in longitudes],
+    )
+
+
+def _haversines(
+    lat0: float,
+    lon0: float,
+    phis: Sequence[float],
+    cos_phis: Sequence[float],
+    lambdas: Sequence[float],
+) -> List[float]:
+    """
+    Haversine of the central angle from one coordinate to each target.
+
+    The origin is in degrees; the targets are pre-split columns from
+    ``_radian_columns``, so callers reusing them skip the per-target
+    conversions.
+    """
+    phi0 = math.radians(lat0)
+    lambda0 = math.radians(lon0)
+    cos_phi0 = math.cos(phi0)
+    sin = math.sin
+    return [
+        sin((phi - phi0) / 2.0) ** 2
+        + cos_phi0 * cos_phi * sin((lam - lambda0) / 2.0) ** 2
+        for phi, cos_phi, lam in zip(phis, cos_phis, lambdas)
+    ]
+
+
+def _meters(haversines: List[float]) -> List[float]:
+    """Convert haversine terms to great-circle distances in meters."""
+    asin = math.asin
+    sqrt = math.sqrt
+    diameter = 2.0 * EARTH_RADIUS_METERS
+    return [diameter * asin(min(1.0, sqrt(hav))) for hav in haversines]
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two coordinates in degrees."""
+    phi2 = math.radians(lat2)
+    return _meters(
+        _haversines(lat1, lon1, [phi2], [math.cos(phi2)], [math.radians(lon2)])
+    )[0]
+
+
+def vincenty_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Geodesic distance in meters on the WGS-84 ellipsoid (Vincenty inverse).
+
+    The iteration does not converge for nearly antipodal points; those pairs
+    fall back to the haversine distance.
+    """
+    a = WGS84_SEMI_MAJOR_AXIS
+    b = WGS84_SEMI_MINOR_AXIS
+    f = WGS84_FLATTENING
+    big_l = math.radians(lon2 - lon1)
+    u1 = math.atan((1 - f) * math.tan(math.radians(lat1)))
+    u2 = math.atan((1 - f) * math.tan(math.radians(lat2)))
+    sin_u1, cos_u1 = math.sin(u1), math.cos(u1)
+    sin_u2, cos_u2 = math.sin(u2), math.cos(u2)
+
+    lam = big_l
+    for _ in range(_VINCENTY_MAX_ITERATIONS):
+        sin_lam, cos_lam = math.sin(lam), math.cos(lam)
+        sin_sigma = math.hypot(
+            cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam
+        )
+        if sin_sigma == 0.0:
+            return 0.0
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lam / sin_sigma
+        cos_sq_alpha = 1.0 - sin_alpha * sin_alpha
+        cos_2sigma_m = (
+            cos_sigma - 2.0 * sin_u1 * sin_u2 / cos_sq_alpha if cos_sq_alpha else 0.0
+        )
+        c = f / 16.0 * cos_sq_alpha * (4.0 + f * (4.0 - 3.0 * cos_sq_alpha))
+        previous = lam
+        lam = big_l + (1.0 - c) * f * sin_alpha * (
+            sigma
+            + c
+            * sin_sigma
+            * (cos_2sigma_m + c * cos_sigma * (-1.0 + 2.0 * cos_2sigma_m**2))
+        )
+        if abs(lam - previous) < _VINCENTY_TOLERANCE:
+            break
+    else:
+        return haversine_distance(lat1, lon1, lat2, lon2)
+
+    u_sq = cos_sq_alpha * (a * a - b * b) / (b * b)
+    big_a = 1.0 + u_sq / 16384.0 * (
+        4096.0 + u_sq * (-768.0 + u_sq * (320.0 - 175.0 * u_sq))
+    )
+    big_b = u_sq / 1024.0 * (256.0 + u_sq * (-128.0 + u_sq * (74.0 - 47.0 * u_sq)))
+    delta_sigma = (
+        big_b
+        * sin_sigma
+        * (
+            cos_2sigma_m
+            + big_b
+            / 4.0
+            * (
+                cos_sigma * (-1.0 + 2.0 * cos_2sigma_m**2)
+                - big_b
+                / 6.0
+                * cos_2sigma_m
+                * (-3.0 + 4.0 * sin_sigma**2)
+                * (-3.0 + 4.0 * cos_2sigma_m**2)
+            )
+        )
+    )
+    return b * big_a * (sigma - delta_sigma)
+
+
+def distance(
+    first: Point, second: Point, method: DistanceMethod = DistanceMethod.HAVERSINE
+) -> float:
+    """Distance in meters between two points."""
+    return distances_from(first, second, method)[0]
+
+
+def distances_from(
+    origin: Point, targets: Points, method: DistanceMethod = DistanceMethod.HAVERSINE
+) -> List[float]:
+    """Distances in meters from one point to each of ``targets``."""
+    latitudes, longitudes = _columns(targets)
+    lat0 = origin.latitude.value
+    lon0 = origin.longitude.value
+    if method == DistanceMethod.VINCENTY:
+        return [
+            vincenty_distance(lat0, lon0, lat, lon)
+            for lat, lon in zip(latitudes, longitudes)
+        ]
+
+    return _meters(_haversines(lat0, lon0, *_radian_columns(latitudes, longitudes)))
+
+
+def iter_distance_matrix(
+    sources: Points,
+    targets: Points,
+    method: DistanceMethod = DistanceMethod.HAVERSINE,
+    chunk_size: int = 1024,
+) -> Iterator[List[List[float]]]:
+    """
+    Yield the source-by-target distance matrix in blocks of rows.
+
+    Each block holds at most ``chunk_size`` rows of ``len(targets)`` distances
+    in meters, so memory stays bounded however many sources there are. Target
+    trigonometry is computed once and shared by all rows.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    source_lats, source_lons = _columns(sources)
+    target_lats, target_lons = _columns(targets)
+
+    if method == DistanceMethod.VINCENTY:
+        targets_pairs = list(zip(target_lats, target_lons))
+        block: List[List[float]] = []
+        for lat0, lon0 in zip(source_lats, source_lons):
+            block.append(
+                [vincenty_distance(lat0, lon0, lat, lon) for lat, lon in targets_pairs]
+            )
+            if len(block) == chunk_size:
+                yield block
+                block = []
+        if block:
+            yield block
+        return
+
+    columns = _radian_columns(target_lats, target_lons)
+    block = []
+    for lat0, lon0 in zip(source_lats, source_lons):
+        block.append(_meters(_haversines(lat0, lon0, *columns)))
+        if len(block) == chunk_size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def distance_matrix(
+    sources: Points,
+    targets: Points,
+    method: DistanceMethod = DistanceMethod.HAVERSINE,
+    chunk_size: int = 1024,
+) -> List[List[float]]:
+    """Return the full source-by-target distance matrix in meters."""
+    matrix: List[List[float]] = []
+    for block in iter_distance_matrix(sources, targets, method, chunk_size):
+        matrix.extend(block)
+    return matrix
@@ -0,0 +1,15 @@
+"""DistanceMethod enumeration for geographic distance calculations."""
+
+from enum import Enum
+
+
+class DistanceMethod(str, Enum):
+    """
+    Method used to compute distances between points.
+
+    HAVERSINE - Great-circle distance on a sphere of mean Earth radius.
+    VINCENTY - Geodesic distance on the WGS-84 ellipsoid (Vincenty inverse).
+    """
+
+    HAVERSINE = "HAVERSINE"
+    VINCENTY = "VINCENTY"
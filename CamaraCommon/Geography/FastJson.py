@@ -0,0 +1,65 @@
+"""Fast JSON encoding and decoding for CAMARA geography types."""
+
+from typing import Any, Dict, Union
+
+from pydantic_core import from_json, to_json
+
+from .Circle import Circle
+from .Point import Point
+from .PointBatch import PointBatch
+
+
+def _point_dict(point: Point) -> Dict[str, Dict[str, float]]:
+    return {
+        "latitude": {"value": point.latitude.value},
+        "longitude": {"value": point.longitude.value},
+    }
+
+
+def dump_point_json(point: Point) -> str:
+    """
+    Serialize a Point exactly like ``Point.model_dump_json()``.
+
+    The float values are read directly and written by the same pydantic-core
+    JSON writer, skipping the Point/Latitude/Longitude serializer layers, so
+    the output is byte-identical to the model path.
+    """
+    return to_json(_point_dict(point)).decode()
+
+
+def dump_circle_json(circle: Circle) -> str:
+    """Serialize a Circle exactly like ``Circle.model_dump_json()``."""
+    return to_json(
+        {
+            "areaType": circle.areaType.value,
+            "center": _point_dict(circle.center),
+            "radius": circle.radius,
+        }
+    ).decode()
+
+
+def load_points_json(data: Union[str, bytes]) -> PointBatch:
+    """
+    Decode points from JSON into a PointBatch without building models.
+
+    Accepts a single Point, a JSON array of Points, a PointList
+    (``{"points": [...]}``) or a Polygon (``{"boundary": {"points": [...]}}``).
+    Coordinate ranges are validated in bulk by PointBatch; malformed
+    structures raise ValueError.
+    """
+    decoded: Any = from_json(data)
+    if isinstance(decoded, dict):
+        if "boundary" in decoded:
+            decoded = decoded["boundary"]
+        if "points" in decoded:
+            decoded = decoded["points"]
+        else:
+            decoded = [decoded]
+    if not isinstance(decoded, list):
+        raise ValueError("Expected a Point, a list of Points, a PointList or a Polygon")
+    try:
+        latitudes = [float(item["latitude"]["value"]) for item in decoded]
+        longitudes = [float(item["longitude"]["value"]) for item in decoded]
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"Malformed point in JSON input: {error!r}")
+    return PointBatch(latitudes, longitudes)
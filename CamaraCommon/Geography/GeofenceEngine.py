@@ -0,0 +1,162 @@
+"""Streaming geofence event engine for CAMARA areas."""
+
+from datetime import datetime, timedelta
+from typing import (AsyncIterable, AsyncIterator, Dict, Generic, Hashable,
+                    Iterable, Iterator, List, Optional, Tuple, TypeVar)
+
+from CamaraCommon.Basic import TimePeriod
+
+from .Area import Area
+from .GeofenceEvent import GeofenceEvent
+from .GeofenceEventType import GeofenceEventType
+from .Point import Point
+from .SpatialIndex import SpatialIndex
+
+D = TypeVar("D", bound=Hashable)
+A = TypeVar("A", bound=Hashable)
+
+LocationReport = Tuple[D, Point, datetime]
+
+DEFAULT_BATCH_SIZE = 1024
+
+
+class GeofenceEngine(Generic[D, A]):
+    """
+    Turns a stream of (device, Point, timestamp) reports into geofence events.
+
+    Each report is matched against a SpatialIndex, so only areas whose
+    bounding box holds the point are tested. Per-device state is a small
+    dict from area key to ``(entered_at, dwell_reported)`` and exists only
+    while the device is inside at least one area. Only transitions are
+    emitted: ENTER, EXIT, and DWELL once the device has stayed ``dwell_time``.
+    Reports for a device are expected in timestamp order.
+    """
+
+    def __init__(self, dwell_time: Optional[timedelta] = None) -> None:
+        self.dwell_time = dwell_time
+        self._index: SpatialIndex[A] = SpatialIndex()
+        self._state: Dict[D, Dict[A, Tuple[datetime, bool]]] = {}
+
+    def register(self, area_id: A, area: Area) -> None:
+        """Start tracking an area, replacing any area with the same key."""
+        self._index.insert(area_id, area)
+
+    def unregister(self, area_id: A) -> None:
+        """Stop tracking an area; devices inside it are dropped silently."""
+        self._index.delete(area_id)
+        for device_id in list(self._state):
+            memberships = self._state[device_id]
+            memberships.pop(area_id, None)
+            if not memberships:
+                del self._state[device_id]
+
+    def memberships(self, device_id: D) -> List[A]:
+        """Return the keys of the areas a device is currently inside."""
+        return list(self._state.get(device_id, ()))
+
+    def process_batch(
+        self, reports: Iterable[LocationReport[D]]
+    ) -> List[GeofenceEvent]:
+        """Apply a batch of reports and return the resulting events in order."""
+        events: List[GeofenceEvent] = []
+        query = self._index.query_coordinates
+        state = self._state
+        dwell_time = self.dwell_time
+        for device_id, point, timestamp in reports:
+            inside = query(point.latitude.value, point.longitude.value)
+            previous = state.get(device_id)
+            if previous is None:
+                if not inside:
+                    continue
+                previous = state[device_id] = {}
+
+            for area_id in [key for key in previous if key not in inside]:
+                entered_at, _ = previous.pop(area_id)
+                events.append(
+                    self._event(
+                        GeofenceEventType.EXIT,
+                        device_id,
+                        area_id,
+                        timestamp,
+                        entered_at,
+                    )
+                )
+            for area_id in inside:
+                membership = previous.get(area_id)
+                if membership is None:
+                    previous[area_id] = (timestamp, False)
+                    events.append(
+                        self._event(
+                            GeofenceEventType.ENTER, device_id, area_id, timestamp, None
+                        )
+                    )
+                elif (
+                    dwell_time is not None
+                    and not membership[1]
+                    and timestamp - membership[0] >= dwell_time
+                ):
+                    previous[area_id] = (membership[0], True)
+                    events.append(
+                        self._event(
+                            GeofenceEventType.DWELL,
+                            device_id,
+                            area_id,
+                            timestamp,
+                            membership[0],
+                        )
+                    )
+            if not previous:
+                del state[device_id]
+        return events
+
+    def process(
+        self,
+        reports: Iterable[LocationReport[D]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[GeofenceEvent]:
+        """Consume reports in batches of ``batch_size`` and yield events."""
+        batch: List[LocationReport[D]] = []
+        for report in reports:
+            batch.append(report)
+            if len(batch) >= batch_size:
+                yield from self.process_batch(batch)
+                batch = []
+        if batch:
+            yield from self.process_batch(batch)
+
+    async def process_async(
+        self,
+        reports: AsyncIterable[LocationReport[D]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[GeofenceEvent]:
+        """Async variant of ``process`` for async report sources."""
+        batch: List[LocationReport[D]] = []
+        async for report in reports:
+            batch.append(report)
+            if len(batch) >= batch_size:
+                for event in self.process_batch(batch):
+                    yield event
+                batch = []
+        if batch:
+            for event in self.process_batch(batch):
+                yield event
+
+    @staticmethod
+    def _event(
+        event_type: GeofenceEventType,
+        device_id: D,
+        area_id: A,
+        timestamp: datetime,
+        entered_at: Optional[datetime],
+    ) -> GeofenceEvent:
+        if entered_at is None:
+            period = TimePeriod(startDate=timestamp, endDate=None)
+        else:
+            period = TimePeriod(startDate=entered_at, endDate=timestamp)
+        return GeofenceEvent(
+            eventType=event_type,
+            deviceId=device_id,
+            areaId=area_id,
+            timestamp=timestamp,
+            period=period,
+        )
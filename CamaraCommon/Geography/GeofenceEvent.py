@@ -0,0 +1,25 @@
+"""GeofenceEvent data type for CAMARA APIs."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from CamaraCommon.Basic import TimePeriod
+
+from .GeofenceEventType import GeofenceEventType
+
+
+class GeofenceEvent(BaseModel):
+    """
+    A device entering, leaving or dwelling in a registered area.
+
+    The period starts when the device entered the area. It is open for
+    ENTER events and ends at the exit or dwell time for EXIT and DWELL.
+    """
+
+    eventType: GeofenceEventType
+    deviceId: Any = Field(description="Device key as given in the location report")
+    areaId: Any = Field(description="Area key as registered with the engine")
+    timestamp: datetime = Field(description="Time of the report causing the event")
+    period: TimePeriod
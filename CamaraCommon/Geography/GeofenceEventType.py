@@ -0,0 +1,17 @@
+"""GeofenceEventType enumeration for CAMARA APIs."""
+
+from enum import Enum
+
+
+class GeofenceEventType(str, Enum):
+    """
+    Type of geofence state transition.
+
+    ENTER - The device moved into the area.
+    EXIT - The device left the area.
+    DWELL - The device has stayed in the area for the dwell time.
+    """
+
+    ENTER = "ENTER"
+    EXIT = "EXIT"
+    DWELL = "DWELL"
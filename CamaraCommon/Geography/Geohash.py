@@ -0,0 +1,301 @@
+"""Geohash encoding and area cell covers for CAMARA points and areas."""
+
+import math
+from typing import Dict, List, Sequence, Set, Tuple, Union
+
+from .Area import Area
+from .BoundingBox import BoundingBox
+from .Circle import Circle, _longitude_spans
+from .Distance import _wrap_longitude, haversine_distance
+from .Point import Point
+from .PointBatch import PointBatch
+from .Polygon import Polygon
+from .PolygonGeometry import segments_intersect
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {char: index for index, char in enumerate(BASE32)}
+
+MAX_PRECISION = 12
+DEFAULT_PRECISION = 9
+# Upper bound on the number of cells cover() will examine.
+DEFAULT_MAX_CELLS = 100_000
+
+
+def _bit_counts(precision: int) -> Tuple[int, int]:
+    """Return (latitude_bits, longitude_bits) for a hash length."""
+    if not 1 <= precision <= MAX_PRECISION:
+        raise ValueError(f"precision must be between 1 and {MAX_PRECISION}")
+    total = 5 * precision
+    return total // 2, total - total // 2
+
+
+def _spread(value: int) -> int:
+    """Move bit i of a 32-bit value to bit 2i."""
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    return (value | (value << 1)) & 0x5555555555555555
+
+
+def _compact(value: int) -> int:
+    """Inverse of _spread: gather the even bits of a 64-bit value."""
+    value &= 0x5555555555555555
+    value = (value | (value >> 1)) & 0x3333333333333333
+    value = (value | (value >> 2)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value >> 4)) & 0x00FF00FF00FF00FF
+    value = (value | (value >> 8)) & 0x0000FFFF0000FFFF
+    return (value | (value >> 16)) & 0x00000000FFFFFFFF
+
+
+def _hash_from_cell(lat_index: int, lon_index: int, precision: int) -> str:
+    """Encode grid cell indices at ``precision`` as a geohash string."""
+    # Longitude owns the most significant bit of every interleaved pair.
+    if precision % 2:
+        code = _spread(lon_index) | (_spread(lat_index) << 1)
+    else:
+        code = (_spread(lon_index) << 1) | _spread(lat_index)
+    return "".join(
+        BASE32[(code >> shift) & 31] for shift in range(5 * precision - 5, -1, -5)
+    )
+
+
+def _cell_from_hash(geohash: str) -> Tuple[int, int]:
+    """Decode a geohash to its (lat_index, lon_index) grid cell."""
+    code = 0
+    try:
+        for char in geohash.lower():
+            code = (code << 5) | _DECODE[char]
+    except KeyError:
+        raise ValueError(f"Invalid geohash: {geohash}")
+    if len(geohash) % 2:
+        return _compact(code >> 1), _compact(code)
+    return _compact(code), _compact(code >> 1)
+
+
+def encode(
+    latitude: float, longitude: float, precision: int = DEFAULT_PRECISION
+) -> str:
+    """Encode a coordinate as a geohash of ``precision`` characters."""
+    lat_bits, lon_bits = _bit_counts(precision)
+    lat_cells = 1 << lat_bits
+    lon_cells = 1 << lon_bits
+    lat_index = min(int((latitude + 90.0) / 180.0 * lat_cells), lat_cells - 1)
+    lon_index = min(int((longitude + 180.0) / 360.0 * lon_cells), lon_cells - 1)
+    return _hash_from_cell(lat_index, lon_index, precision)
+
+
+def encode_point(point: Point, precision: int = DEFAULT_PRECISION) -> str:
+    """Encode a Point as a geohash."""
+    return encode(point.latitude.value, point.longitude.value, precision)
+
+
+def encode_batch(
+    points: Union[PointBatch, Tuple[Sequence[float], Sequence[float]]],
+    precision: int = DEFAULT_PRECISION,
+) -> List[str]:
+    """Encode every coordinate of a PointBatch or (latitudes, longitudes) pair."""
+    if isinstance(points, PointBatch):
+        latitudes: Sequence[float] = points.latitudes
+        longitudes: Sequence[float] = points.longitudes
+    else:
+        latitudes, longitudes = points
+        if len(latitudes) != len(longitudes):
+            raise ValueError(
+                "latitudes and longitudes must have the same length "
+                f"({len(latitudes)} != {len(longitudes)})"
+            )
+    lat_bits, lon_bits = _bit_counts(precision)
+    lat_cells = 1 << lat_bits
+    lon_cells = 1 << lon_bits
+    lat_scale = lat_cells / 180.0
+    lon_scale = lon_cells / 360.0
+    return [
+        _hash_from_cell(
+            min(int((lat + 90.0) * lat_scale), lat_cells - 1),
+            min(int((lon + 180.0) * lon_scale), lon_cells - 1),
+            precision,
+        )
+        for lat, lon in zip(latitudes, longitudes)
+    ]
+
+
+def decode_bbox(geohash: str) -> BoundingBox:
+    """Return the cell covered by a geohash."""
+    lat_bits, lon_bits = _bit_counts(len(geohash))
+    lat_index, lon_index = _cell_from_hash(geohash)
+    height = 180.0 / (1 << lat_bits)
+    width = 360.0 / (1 << lon_bits)
+    return BoundingBox(
+        -90.0 + lat_index * height,
+        -180.0 + lon_index * width,
+        -90.0 + (lat_index + 1) * height,
+        -180.0 + (lon_index + 1) * width,
+    )
+
+
+def decode(geohash: str) -> Tuple[float, float]:
+    """Return the (latitude, longitude) centre of a geohash cell."""
+    box = decode_bbox(geohash)
+    return (
+        (box.min_latitude + box.max_latitude) / 2.0,
+        (box.min_longitude + box.max_longitude) / 2.0,
+    )
+
+
+def _circle_touches(circle: Circle, box: BoundingBox) -> bool:
+    """Check whether a circle reaches a cell, using the nearest cell point."""
+    lat0 = circle.center.latitude.value
+    lon0 = circle.center.longitude.value
+    if box.min_longitude <= lon0 <= box.max_longitude:
+        nearest_lat = min(max(lat0, box.min_latitude), box.max_latitude)
+        nearest_lon = lon0
+    else:
+        # The nearer edge is measured the short way round, so a cell just
+        # across the antimeridian is reached through it.
+        to_min = _wrap_longitude(box.min_longitude - lon0)
+        to_max = _wrap_longitude(box.max_longitude - lon0)
+        if abs(to_min) <= abs(to_max):
+            nearest_lon, offset = box.min_longitude, to_min
+        else:
+            nearest_lon, offset = box.max_longitude, to_max
+        # The closest point of a meridian lies poleward of the centre latitude.
+        delta = math.radians(offset)
+        if math.cos(delta) > 0.0:
+            meridian_lat = math.degrees(
+                math.atan(math.tan(math.radians(lat0)) / math.cos(delta))
+            )
+        else:
+            meridian_lat = 90.0 if lat0 >= 0 else -90.0
+        nearest_lat = min(max(meridian_lat, box.min_latitude), box.max_latitude)
+    return haversine_distance(lat0, lon0, nearest_lat, nearest_lon) <= circle.radius
+
+
+def _polygon_touches(polygon: Polygon, box: BoundingBox) -> bool:
+    """Check whether a polygon shares any point with a cell."""
+    geometry = polygon.geometry
+    corners_lat = [
+        box.min_latitude,
+        box.min_latitude,
+        box.max_latitude,
+        box.max_latitude,
+    ]
+    corners_lon = [
+        box.min_longitude,
+        box.max_longitude,
+        box.max_longitude,
+        box.min_longitude,
+    ]
+    if any(geometry.contains_batch(corners_lat, corners_lon)):
+        return True
+    lats = geometry.latitudes
+    lons = geometry.longitudes
+    if box.contains_coordinates(lats[0], lons[0]):
+        return True
+    previous = len(lats) - 1
+    for current in range(len(lats)):
+        ax, ay = lons[previous], lats[previous]
+        bx, by = lons[current], lats[current]
+        for side in range(4):
+            following = (side + 1) % 4
+            if segments_intersect(
+                ax,
+                ay,
+                bx,
+                by,
+                corners_lon[side],
+                corners_lat[side],
+                corners_lon[following],
+                corners_lat[following],
+            ):
+                return True
+        previous = current
+    return False
+
+
+def _longitude_ranges(area: Area, box: BoundingBox) -> List[Tuple[float, float]]:
+    """Longitude spans to scan for an area's cover."""
+    if isinstance(area, Circle):
+        return _longitude_spans(area, box)
+    return [(box.min_longitude, box.max_longitude)]
+
+
+def _cell_touches(area: Area, box: BoundingBox) -> bool:
+    if isinstance(area, Circle):
+        return _circle_touches(area, box)
+    if isinstance(area, Polygon):
+        return _polygon_touches(area, box)
+    return area.bounding_box().intersects(box)
+
+
+def _compact_cover(cells: Set[str]) -> Set[str]:
+    """Replace every complete group of 32 sibling cells with their parent."""
+    result = set(cells)
+    current = cells
+    while current:
+        siblings: Dict[str, int] = {}
+        for cell in current:
+            if len(cell) > 1:
+                parent = cell[:-1]
+                siblings[parent] = siblings.get(parent, 0) + 1
+        parents = {parent for parent, count in siblings.items() if count == 32}
+        for parent in parents:
+            for char in BASE32:
+                result.discard(parent + char)
+            result.add(parent)
+        current = parents
+    return result
+
+
+def cover(
+    area: Area,
+    precision: int = 6,
+    compact: bool = True,
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> Set[str]:
+    """
+    Return geohash cells at ``precision`` that intersect an area.
+
+    Every point of the area lies in one of the returned cells, so the cover
+    can serve as partition keys or as a first-stage filter before exact
+    containment. With ``compact`` set, complete groups of 32 sibling cells
+    are merged into their parent prefix; use ``covers()`` to test membership.
+    Raises ValueError if more than ``max_cells`` cells would be examined.
+    Circles crossing the antimeridian are scanned on both sides of it, but
+    those reaching a pole still span every longitude, so a high precision
+    may need a larger ``max_cells``.
+    """
+    lat_bits, lon_bits = _bit_counts(precision)
+    lat_cells = 1 << lat_bits
+    lon_cells = 1 << lon_bits
+    height = 180.0 / lat_cells
+    width = 360.0 / lon_cells
+    box = area.bounding_box()
+    lat_start = min(int((box.min_latitude + 90.0) / height), lat_cells - 1)
+    lat_stop = min(int((box.max_latitude + 90.0) / height), lat_cells - 1)
+    lon_indices: Set[int] = set()
+    for min_lon, max_lon in _longitude_ranges(area, box):
+        lon_start = min(int((min_lon + 180.0) / width), lon_cells - 1)
+        lon_stop = min(int((max_lon + 180.0) / width), lon_cells - 1)
+        lon_indices.update(range(lon_start, lon_stop + 1))
+    examined = (lat_stop - lat_start + 1) * len(lon_indices)
+    if examined > max_cells:
+        raise ValueError(
+            f"Cover at precision {precision} needs {examined} cells, more than "
+            f"max_cells={max_cells}; use a lower precision"
+        )
+
+    cells: Set[str] = set()
+    for lat_index in range(lat_start, lat_stop + 1):
+        min_lat = -90.0 + lat_index * height
+        for lon_index in sorted(lon_indices):
+            min_lon = -180.0 + lon_index * width
+            cell_box = BoundingBox(min_lat, min_lon, min_lat + height, min_lon + width)
+            if _cell_touches(area, cell_box):
+                cells.add(_hash_from_cell(lat_index, lon_index, precision))
+    return _compact_cover(cells) if compact else cells
+
+
+def covers(cells: Set[str], geohash: str) -> bool:
+    """Check whether a geohash falls in a (possibly compacted) cover."""
+    return any(geohash[:length] in cells for length in range(1, len(geohash) + 1))
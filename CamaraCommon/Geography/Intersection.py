@@ -0,0 +1,192 @@
+"""Intersection and overlap tests between CAMARA areas."""
+
+import math
+from typing import List, Tuple
+
+from .Area import Area
+from .Circle import Circle, _longitude_spans
+from .Distance import EARTH_RADIUS_METERS, _wrap_longitude, haversine_distance
+from .Polygon import Polygon
+from .PolygonGeometry import segments_intersect
+
+# Sampling grid side used by overlap_ratio for non circle-circle pairs.
+DEFAULT_OVERLAP_RESOLUTION = 64
+
+
+def _unsupported(first: Area, second: Area) -> TypeError:
+    return TypeError(
+        f"Intersection between {type(first).__name__} and "
+        f"{type(second).__name__} is not supported"
+    )
+
+
+def _circles_intersect(first: Circle, second: Circle) -> bool:
+    gap = haversine_distance(
+        first.center.latitude.value,
+        first.center.longitude.value,
+        second.center.latitude.value,
+        second.center.longitude.value,
+    )
+    return gap <= first.radius + second.radius
+
+
+def _circle_polygon_intersect(circle: Circle, polygon: Polygon) -> bool:
+    """
+    Check a circle against a polygon in a local projection around the center.
+
+    The polygon intersects the circle when it contains the center or when
+    one of its edges passes within ``radius`` meters of the center.
+    Longitude offsets are taken the short way round, so a polygon just
+    across the antimeridian is projected next to the center.
+    """
+    lat0 = circle.center.latitude.value
+    lon0 = circle.center.longitude.value
+    if polygon.contains_coordinates(lat0, lon0):
+        return True
+    geometry = polygon.geometry
+    scale_y = math.radians(EARTH_RADIUS_METERS)
+    scale_x = scale_y * math.cos(math.radians(lat0))
+    xs = [_wrap_longitude(lon - lon0) * scale_x for lon in geometry.longitudes]
+    ys = [(lat - lat0) * scale_y for lat in geometry.latitudes]
+    radius_sq = circle.radius * circle.radius
+    previous = len(xs) - 1
+    for current in range(len(xs)):
+        x1, y1 = xs[previous], ys[previous]
+        dx, dy = xs[current] - x1, ys[current] - y1
+        length_sq = dx * dx + dy * dy
+        t = (
+            0.0
+            if not length_sq
+            else max(0.0, min(1.0, -(x1 * dx + y1 * dy) / length_sq))
+        )
+        nearest_x, nearest_y = x1 + t * dx, y1 + t * dy
+        if nearest_x * nearest_x + nearest_y * nearest_y <= radius_sq:
+            return True
+        previous = current
+    return False
+
+
+def _polygons_intersect(first: Polygon, second: Polygon) -> bool:
+    a = first.geometry
+    b = second.geometry
+    if first.contains_coordinates(b.latitudes[0], b.longitudes[0]) or (
+        second.contains_coordinates(a.latitudes[0], a.longitudes[0])
+    ):
+        return True
+    b_edges: List[Tuple[float, float, float, float]] = []
+    previous = len(b.latitudes) - 1
+    for current in range(len(b.latitudes)):
+        b_edges.append(
+            (
+                b.longitudes[previous],
+                b.latitudes[previous],
+                b.longitudes[current],
+                b.latitudes[current],
+            )
+        )
+        previous = current
+    previous = len(a.latitudes) - 1
+    for current in range(len(a.latitudes)):
+        ax1, ay1 = a.longitudes[previous], a.latitudes[previous]
+        ax2, ay2 = a.longitudes[current], a.latitudes[current]
+        for bx1, by1, bx2, by2 in b_edges:
+            if segments_intersect(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2):
+                return True
+        previous = current
+    return False
+
+
+def intersects(first: Area, second: Area) -> bool:
+    """
+    Check whether two areas share any point.
+
+    Bounding boxes are compared first; the exact test only runs when they
+    overlap. Polygon edges are straight lines in latitude/longitude space,
+    as in the containment test.
+    """
+    if not first.bounding_box().intersects(second.bounding_box()):
+        return False
+    if isinstance(first, Circle):
+        if isinstance(second, Circle):
+            return _circles_intersect(first, second)
+        if isinstance(second, Polygon):
+            return _circle_polygon_intersect(first, second)
+    elif isinstance(first, Polygon):
+        if isinstance(second, Circle):
+            return _circle_polygon_intersect(second, first)
+        if isinstance(second, Polygon):
+            return _polygons_intersect(first, second)
+    raise _unsupported(first, second)
+
+
+def _circle_lens_ratio(first: Circle, second: Circle) -> float:
+    """Exact planar ratio of the circle-circle lens to the first circle."""
+    r1 = first.radius
+    r2 = second.radius
+    gap = haversine_distance(
+        first.center.latitude.value,
+        first.center.longitude.value,
+        second.center.latitude.value,
+        second.center.longitude.value,
+    )
+    if gap >= r1 + r2:
+        return 0.0
+    if gap <= abs(r1 - r2):
+        return 1.0 if r1 <= r2 else (r2 * r2) / (r1 * r1)
+    part1 = r1 * r1 * math.acos((gap * gap + r1 * r1 - r2 * r2) / (2 * gap * r1))
+    part2 = r2 * r2 * math.acos((gap * gap + r2 * r2 - r1 * r1) / (2 * gap * r2))
+    part3 = 0.5 * math.sqrt(
+        (-gap + r1 + r2) * (gap + r1 - r2) * (gap - r1 + r2) * (gap + r1 + r2)
+    )
+    return min(1.0, (part1 + part2 - part3) / (math.pi * r1 * r1))
+
+
+def overlap_ratio(
+    first: Area, second: Area, resolution: int = DEFAULT_OVERLAP_RESOLUTION
+) -> float:
+    """
+    Approximate fraction of ``first`` that is also covered by ``second``.
+
+    Circle pairs use the exact lens area. Other pairs sample a
+    ``resolution`` x ``resolution`` grid of cell centres over the bounding
+    box of ``first`` and count how many samples inside ``first`` are also
+    inside ``second``. A circle crossing the antimeridian is sampled over
+    its two longitude spans rather than the whole longitude range.
+    """
+    if resolution < 1:
+        raise ValueError("resolution must be at least 1")
+    if not intersects(first, second):
+        return 0.0
+    if isinstance(first, Circle) and isinstance(second, Circle):
+        return _circle_lens_ratio(first, second)
+
+    box = first.bounding_box()
+    if isinstance(first, Circle):
+        spans = _longitude_spans(first, box)
+    else:
+        spans = [(box.min_longitude, box.max_longitude)]
+    # Columns are spread evenly over the spans laid end to end.
+    step_lon = sum(max_lon - min_lon for min_lon, max_lon in spans) / resolution
+    column_lons: List[float] = []
+    for column in range(resolution):
+        offset = (column + 0.5) * step_lon
+        for min_lon, max_lon in spans:
+            if offset <= max_lon - min_lon:
+                break
+            offset -= max_lon - min_lon
+        column_lons.append(min_lon + offset)
+    step_lat = (box.max_latitude - box.min_latitude) / resolution
+    latitudes: List[float] = []
+    longitudes: List[float] = []
+    for row in range(resolution):
+        lat = box.min_latitude + (row + 0.5) * step_lat
+        latitudes.extend([lat] * resolution)
+        longitudes.extend(column_lons)
+
+    in_first = first.contains_batch(latitudes, longitudes)
+    sample_lats = [lat for lat, inside in zip(latitudes, in_first) if inside]
+    sample_lons = [lon for lon, inside in zip(longitudes, in_first) if inside]
+    if not sample_lats:
+        return 0.0
+    covered = sum(second.contains_batch(sample_lats, sample_lons))
+    return covered / len(sample_lats)
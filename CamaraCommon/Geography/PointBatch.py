@@ -0,0 +1,131 @@
+"""PointBatch columnar coordinate container for CAMARA APIs."""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from .Latitude import Latitude
+from .Longitude import Longitude
+from .Point import Point
+
+
+def _validate_column(
+    values: "array[float]", name: str, lower: float, upper: float
+) -> None:
+    """Range-check a whole column, locating the offender only on failure."""
+    if not values:
+        return
+    total = sum(values)
+    if total == total and lower <= min(values) and max(values) <= upper:
+        return
+    for index, value in enumerate(values):
+        if not lower <= value <= upper:
+            raise ValueError(
+                f"{name} at index {index} must be between {lower} and {upper}, "
+                f"got {value}"
+            )
+
+
+class PointBatch:
+    """
+    Columnar batch of coordinates backed by two contiguous float64 arrays.
+
+    Holds the same data as a ``List[Point]`` without allocating a Point,
+    Latitude and Longitude model per coordinate. Ranges are validated in
+    bulk on construction and on append.
+    """
+
+    __slots__ = ("latitudes", "longitudes")
+
+    def __init__(
+        self, latitudes: Iterable[float] = (), longitudes: Iterable[float] = ()
+    ) -> None:
+        self.latitudes = array("d", latitudes)
+        self.longitudes = array("d", longitudes)
+        if len(self.latitudes) != len(self.longitudes):
+            raise ValueError(
+                "latitudes and longitudes must have the same length "
+                f"({len(self.latitudes)} != {len(self.longitudes)})"
+            )
+        _validate_column(self.latitudes, "latitude", -90.0, 90.0)
+        _validate_column(self.longitudes, "longitude", -180.0, 180.0)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> "PointBatch":
+        """Build a batch from Point models."""
+        batch = cls()
+        lats = batch.latitudes
+        lons = batch.longitudes
+        for point in points:
+            lats.append(point.latitude.value)
+            lons.append(point.longitude.value)
+        return batch
+
+    @classmethod
+    def from_json(cls, data: Iterable[Mapping[str, Any]]) -> "PointBatch":
+        """
+        Build a batch from decoded CAMARA JSON points.
+
+        Each item has the shape
+        ``{"latitude": {"value": ...}, "longitude": {"value": ...}}``.
+        """
+        latitudes: List[float] = []
+        longitudes: List[float] = []
+        for item in data:
+            latitudes.append(item["latitude"]["value"])
+            longitudes.append(item["longitude"]["value"])
+        return cls(latitudes, longitudes)
+
+    def to_points(self) -> List[Point]:
+        """Materialize the batch as Point models (already validated)."""
+        construct_point = Point.model_construct
+        construct_lat = Latitude.model_construct
+        construct_lon = Longitude.model_construct
+        return [
+            construct_point(
+                latitude=construct_lat(value=lat), longitude=construct_lon(value=lon)
+            )
+            for lat, lon in zip(self.latitudes, self.longitudes)
+        ]
+
+    def to_json(self) -> List[Dict[str, Dict[str, float]]]:
+        """Return the batch in the CAMARA JSON point shape."""
+        return [
+            {"latitude": {"value": lat}, "longitude": {"value": lon}}
+            for lat, lon in zip(self.latitudes, self.longitudes)
+        ]
+
+    def append(self, latitude: float, longitude: float) -> None:
+        """Append a single validated coordinate pair."""
+        if not -90.0 <= latitude <= 90.0:
+            raise ValueError(f"latitude must be between -90.0 and 90.0, got {latitude}")
+        if not -180.0 <= longitude <= 180.0:
+            raise ValueError(
+                f"longitude must be between -180.0 and 180.0, got {longitude}"
+            )
+        self.latitudes.append(latitude)
+        self.longitudes.append(longitude)
+
+    def coordinates(self) -> Iterator[Tuple[float, float]]:
+        """Iterate over ``(latitude, longitude)`` pairs."""
+        return zip(self.latitudes, self.longitudes)
+
+    def __len__(self) -> int:
+        return len(self.latitudes)
+
+    def __getitem__(self, index: int) -> Point:
+        return Point.model_construct(
+            latitude=Latitude.model_construct(value=self.latitudes[index]),
+            longitude=Longitude.model_construct(value=self.longitudes[index]),
+        )
+
+    def __iter__(self) -> Iterator[Point]:
+        for index in range(len(self.latitudes)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointBatch):
+            return NotImplemented
+        return self.latitudes == other.latitudes and self.longitudes == other.longitudes
+
+    def __repr__(self) -> str:
+        return f"PointBatch(size={len(self)})"
@@ -1,10 +1,17 @@
 """Polygon area type for CAMARA APIs."""
 
-from pydantic import BaseModel
+from typing import List, Optional, Sequence, Tuple
 
-from .Area import Area
+from pydantic import BaseModel, PrivateAttr, ValidationInfo, model_validator
+
+from CamaraCommon.Basic.ModelEquality import fields_equal
+
+from .Area import Area, _check_batch_lengths
 from .AreaType import AreaType
+from .BoundingBox import BoundingBox
+from .Point import Point
 from .PointList import PointList
+from .PolygonGeometry import PolygonGeometry
 
 
 class Polygon(Area):
@@ -13,7 +20,78 @@ class Polygon(Area):
     i.e. should not intersect itself.
 
     Defined by a boundary of 3-15 points.
+
+    Simplicity is not enforced by default. Call ``validate_simple()`` or
+    validate with ``context={"simple_polygon": True}`` to reject degenerate
+    and self-intersecting boundaries.
     """
 
     areaType: AreaType = AreaType.POLYGON
     boundary: PointList
+
+    # (boundary, boundary.points, geometry) so reassigning either invalidates.
+    _geometry: Optional[Tuple[PointList, List[Point], PolygonGeometry]] = PrivateAttr(
+        default=None
+    )
+
+    @model_validator(mode="after")
+    def check_simple_polygon(self, info: ValidationInfo) -> "Polygon":
+        """Validate simplicity when requested through the validation context."""
+        if info.context and info.context.get("simple_polygon"):
+            self.validate_simple()
+        return self
+
+    @property
+    def geometry(self) -> PolygonGeometry:
+        """
+        Cached planar geometry of the boundary.
+
+        Computed on first access and reused while ``boundary`` and
+        ``boundary.points`` are the same objects, so each later access is
+        two identity checks. Points are treated as immutable: to change the
+        shape, assign a new boundary or points list.
+        """
+        private = self.__pydantic_private__  # bypasses BaseModel.__getattr__
+        assert private is not None
+        cached: Optional[Tuple[PointList, List[Point], PolygonGeometry]] = private[
+            "_geometry"
+        ]
+        boundary = self.boundary
+        if (
+            cached is not None
+            and cached[0] is boundary
+            and cached[1] is boundary.points
+        ):
+            return cached[2]
+        geometry = PolygonGeometry(boundary)
+        private["_geometry"] = (boundary, boundary.points, geometry)
+        return geometry
+
+    def __eq__(self, other: object) -> bool:
+        # The cached geometry must not take part in equality.
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return fields_equal(self, other)
+
+    def validate_simple(self) -> "Polygon":
+        """Raise ValueError if the boundary is degenerate or self-intersecting."""
+        self.geometry.validate_simple()
+        return self
+
+    def bounding_box(self) -> BoundingBox:
+        """Return the box enclosing the boundary points."""
+        return self.geometry.bbox
+
+    def contains_batch(
+        self, latitudes: Sequence[float], longitudes: Sequence[float]
+    ) -> List[bool]:
+        """
+        Test a batch of coordinates against the polygon using ray casting.
+
+        Edges are treated as straight lines in latitude/longitude space, which
+        is accurate for the small, non-antimeridian-crossing areas CAMARA
+        APIs deal with. Coordinates outside the bounding box are rejected
+        before the edge loop.
+        """
+        _check_batch_lengths(latitudes, longitudes)
+        return self.geometry.contains_batch(latitudes, longitudes)
@@ -0,0 +1,275 @@
+"""Precomputed planar geometry of a Polygon boundary."""
+
+import math
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+from .BoundingBox import BoundingBox
+from .Distance import EARTH_RADIUS_METERS
+from .PointList import PointList
+
+
+def _cross(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Z component of (b - a) x (c - a); zero when the points are collinear."""
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _on_segment(
+    ax: float, ay: float, bx: float, by: float, px: float, py: float
+) -> bool:
+    """Check whether p, known to be collinear with a-b, lies on segment a-b."""
+    return min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)
+
+
+def segments_intersect(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    dx: float,
+    dy: float,
+) -> bool:
+    """Check whether closed segments a-b and c-d share at least one point."""
+    d1 = _cross(cx, cy, dx, dy, ax, ay)
+    d2 = _cross(cx, cy, dx, dy, bx, by)
+    d3 = _cross(ax, ay, bx, by, cx, cy)
+    d4 = _cross(ax, ay, bx, by, dx, dy)
+    if ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0)) and (
+        (d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0)
+    ):
+        return True
+    return (
+        (d1 == 0 and _on_segment(cx, cy, dx, dy, ax, ay))
+        or (d2 == 0 and _on_segment(cx, cy, dx, dy, bx, by))
+        or (d3 == 0 and _on_segment(ax, ay, bx, by, cx, cy))
+        or (d4 == 0 and _on_segment(ax, ay, bx, by, dx, dy))
+    )
+
+
+class PolygonGeometry:
+    """
+    Geometry derived from a polygon boundary, computed once and reused.
+
+    Holds the vertex columns in degrees, the bounding box, ray-casting edge
+    coefficients, and a local equirectangular projection in meters (centred
+    on the mean vertex latitude/longitude) from which the signed area and
+    centroid are derived. Edges are straight lines in latitude/longitude
+    space, matching the containment test.
+    """
+
+    __slots__ = (
+        "latitudes",
+        "longitudes",
+        "bbox",
+        "edges",
+        "x",
+        "y",
+        "signed_area",
+        "centroid",
+    )
+
+    def __init__(self, boundary: PointList) -> None:
+        points = boundary.points
+        self.latitudes = array("d", [point.latitude.value for point in points])
+        self.longitudes = array("d", [point.longitude.value for point in points])
+        ys = self.latitudes
+        xs = self.longitudes
+        count = len(ys)
+        self.bbox = BoundingBox(min(ys), min(xs), max(ys), max(xs))
+
+        # (y_start, y_end, x_start, dx/dy) for every non-horizontal edge.
+        self.edges: List[Tuple[float, float, float, float]] = []
+        previous = count - 1
+        for current in range(count):
+            y1, y2 = ys[previous], ys[current]
+            if y1 != y2:
+                self.edges.append(
+                    (y1, y2, xs[previous], (xs[current] - xs[previous]) / (y2 - y1))
+                )
+            previous = current
+
+        ref_lat = sum(ys) / count
+        ref_lon = sum(xs) / count
+        scale_y = math.radians(EARTH_RADIUS_METERS)
+        scale_x = scale_y * math.cos(math.radians(ref_lat))
+        self.x = array("d", [(lon - ref_lon) * scale_x for lon in xs])
+        self.y = array("d", [(lat - ref_lat) * scale_y for lat in ys])
+
+        # Shoelace formula; positive for counter-clockwise rings.
+        twice_area = 0.0
+        cx = 0.0
+        cy = 0.0
+        previous = count - 1
+        for current in range(count):
+            x1, y1 = self.x[previous], self.y[previous]
+            x2, y2 = self.x[current], self.y[current]
+            cross = x1 * y2 - x2 * y1
+            twice_area += cross
+            cx += (x1 + x2) * cross
+            cy += (y1 + y2) * cross
+            previous = current
+        self.signed_area = twice_area / 2.0
+
+        if twice_area:
+            cx /= 3.0 * twice_area
+            cy /= 3.0 * twice_area
+        else:
+            cx = sum(self.x) / count
+            cy = sum(self.y) / count
+        self.centroid = (ref_lat + cy / scale_y, ref_lon + cx / scale_x)
+
+    @property
+    def area(self) -> float:
+        """Unsigned area in square meters."""
+        return abs(self.signed_area)
+
+    def contains_batch(
+        self, latitudes: Sequence[float], longitudes: Sequence[float]
+    ) -> List[bool]:
+        """Ray-cast each coordinate against the cached edges."""
+        min_y, min_x, max_y, max_x = self.bbox
+        edges = self.edges
+        mask: List[bool] = []
+        append = mask.append
+        for y, x in zip(latitudes, longitudes):
+            if y < min_y or y > max_y or x < min_x or x > max_x:
+                append(False)
+                continue
+            inside = False
+            for y1, y2, x1, slope in edges:
+                if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * slope:
+                    inside = not inside
+            append(inside)
+        return mask
+
+    def _edge(self, index: int) -> Tuple[float, float, float, float]:
+        """Return edge ``index`` as (x1, y1, x2, y2) in degrees."""
+        following = (index + 1) % len(self.latitudes)
+        return (
+            self.longitudes[index],
+            self.latitudes[index],
+            self.longitudes[following],
+            self.latitudes[following],
+        )
+
+    def _edges_conflict(self, first: int, second: int) -> bool:
+        """Check whether two boundary edges intersect illegally."""
+        count = len(self.latitudes)
+        if first > second:
+            first, second = second, first
+        if second == first + 1 or (first == 0 and second == count - 1):
+            # Adjacent edges legitimately share one vertex; they only conflict
+            # when they are collinear and fold back over each other.
+            shared = second if second == first + 1 else 0
+            before = (shared - 1) % count
+            after = (shared + 1) % count
+            bx, by = self.longitudes[shared], self.latitudes[shared]
+            ax, ay = self.longitudes[before], self.latitudes[before]
+            cx, cy = self.longitudes[after], self.latitudes[after]
+            if _cross(ax, ay, bx, by, cx, cy) != 0:
+                return False
+            return (ax - bx) * (cx - bx) + (ay - by) * (cy - by) > 0
+        return segments_intersect(*self._edge(first), *self._edge(second))
+
+    def find_self_intersection(self) -> Optional[Tuple[int, int]]:
+        """
+        Return the indices of two intersecting edges, or None if simple.
+
+        Uses a Shamos-Hoey sweep line: edges enter and leave a status list
+        ordered by their height at the sweep position, and only edges that
+        become neighbours in that list are tested, giving O(n log n)
+        comparisons instead of the O(n^2) pairwise test.
+        """
+        count = len(self.latitudes)
+        segments: List[Tuple[float, float, float, float]] = []
+        events: List[Tuple[float, float, int, int]] = []
+        for index in range(count):
+            x1, y1, x2, y2 = self._edge(index)
+            if (x2, y2) < (x1, y1):
+                x1, y1, x2, y2 = x2, y2, x1, y1
+            segments.append((x1, y1, x2, y2))
+            # Insertions sort before removals at the same point so edges that
+            # only touch at a vertex are still compared.
+            events.append((x1, y1, 0, index))
+            events.append((x2, y2, 1, index))
+        events.sort()
+
+        def sweep_key(index: int, x: float) -> Tuple[float, float]:
+            x1, y1, x2, y2 = segments[index]
+            if x1 == x2:
+                return (y1, math.inf)
+            slope = (y2 - y1) / (x2 - x1)
+            return (y1 + (x - x1) * slope, slope)
+
+        status: List[int] = []
+        for x, _, kind, index in events:
+            if kind == 0:
+                key = sweep_key(index, x)
+                low, high = 0, len(status)
+                while low < high:
+                    middle = (low + high) // 2
+                    if sweep_key(status[middle], x) < key:
+                        low = middle + 1
+                    else:
+                        high = middle
+                position = low
+                status.insert(position, index)
+                for neighbour in (position - 1, position + 1):
+                    if 0 <= neighbour < len(status) and self._edges_conflict(
+                        index, status[neighbour]
+                    ):
+                        return (
+                            min(index, status[neighbour]),
+                            max(index, status[neighbour]),
+                        )
+            else:
+                position = status.index(index)
+                if 0 < position < len(status) - 1:
+                    below = status[position - 1]
+                    above = status[position + 1]
+                    if self._edges_conflict(below, above):
+                        return (min(below, above), max(below, above))
+                del status[position]
+        return None
+
+    def validate_simple(self) -> None:
+        """
+        Raise ValueError unless the boundary is a simple, non-degenerate ring.
+
+        Rejects duplicate consecutive vertices (including last equal to
+        first), rings with zero area and self-intersecting rings.
+        """
+        count = len(self.latitudes)
+        for index in range(count):
+            following = (index + 1) % count
+            if (
+                self.latitudes[index] == self.latitudes[following]
+                and self.longitudes[index] == self.longitudes[following]
+            ):
+                raise ValueError(
+                    f"Polygon has duplicate consecutive vertices at {index} and "
+                    f"{following}"
+                )
+        # A non-collinear ring with zero net area must cross itself, which the
+        # sweep below reports, so only fully collinear rings are degenerate.
+        if all(
+            _cross(
+                self.longitudes[0],
+                self.latitudes[0],
+                self.longitudes[1],
+                self.latitudes[1],
+                self.longitudes[index],
+                self.latitudes[index],
+            )
+            == 0
+            for index in range(2, count)
+        ):
+            raise ValueError("Polygon has zero area")
+        crossing = self.find_self_intersection()
+        if crossing is not None:
+            raise ValueError(
+                f"Polygon boundary intersects itself (edges {crossing[0]} and "
+                f"{crossing[1]})"
+            )
@@ -0,0 +1,173 @@
+"""Spatial index over CAMARA areas."""
+
+import math
+from typing import (Dict, Generic, Hashable, Iterable, Iterator, List, Set,
+                    Tuple, TypeVar)
+
+from .Area import Area
+from .BoundingBox import BoundingBox
+from .Intersection import intersects
+from .Point import Point
+from .PointBatch import PointBatch
+
+K = TypeVar("K", bound=Hashable)
+
+# Finest grid level; cells at this level are 360 / 2**24 degrees (~2.4 m).
+_MAX_LEVEL = 24
+
+_Cell = Tuple[int, int]
+_Entry = Tuple[Area, BoundingBox, int, Tuple[_Cell, ...]]
+
+
+def _level_for(box: BoundingBox) -> int:
+    """Pick the finest level whose cells are at least as large as the box."""
+    extent = max(
+        box.max_latitude - box.min_latitude, box.max_longitude - box.min_longitude
+    )
+    if extent <= 0.0:
+        return _MAX_LEVEL
+    level = int(math.floor(math.log2(360.0 / extent)))
+    return min(max(level, 0), _MAX_LEVEL)
+
+
+def _cell_size(level: int) -> float:
+    return 360.0 / (1 << level)
+
+
+def _cell_range(box: BoundingBox, size: float) -> Tuple[int, int, int, int]:
+    """Return the inclusive (x0, y0, x1, y1) cell range covering a box."""
+    return (
+        int((box.min_longitude + 180.0) // size),
+        int((box.min_latitude + 90.0) // size),
+        int((box.max_longitude + 180.0) // size),
+        int((box.max_latitude + 90.0) // size),
+    )
+
+
+class SpatialIndex(Generic[K]):
+    """
+    Hierarchical grid index over Area geofences, keyed by caller-chosen ids.
+
+    Each area is filed on the grid level whose cell size is at least the
+    larger side of its bounding box, so it occupies at most 2x2 cells. A
+    point query probes a single cell per populated level (at most 25 dict
+    lookups), and exact containment is only evaluated for the few areas
+    whose bounding box contains the point.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[K, _Entry] = {}
+        self._levels: Dict[int, Dict[_Cell, Set[K]]] = {}
+
+    @classmethod
+    def bulk_load(cls, items: Iterable[Tuple[K, Area]]) -> "SpatialIndex[K]":
+        """Build an index from ``(key, area)`` pairs in a single pass."""
+        index: "SpatialIndex[K]" = cls()
+        for key, area in items:
+            index.insert(key, area)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def get(self, key: K) -> Area:
+        """Return the area stored under ``key``."""
+        return self._entries[key][0]
+
+    def bounding_box(self, key: K) -> BoundingBox:
+        """Return the cached bounding box of the area stored under ``key``."""
+        return self._entries[key][1]
+
+    def insert(self, key: K, area: Area) -> None:
+        """Add an area, replacing any area previously stored under ``key``."""
+        if key in self._entries:
+            self.delete(key)
+        box = area.bounding_box()
+        level = _level_for(box)
+        x0, y0, x1, y1 = _cell_range(box, _cell_size(level))
+        cells = tuple((x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+        grid = self._levels.setdefault(level, {})
+        for cell in cells:
+            grid.setdefault(cell, set()).add(key)
+        self._entries[key] = (area, box, level, cells)
+
+    def delete(self, key: K) -> None:
+        """Remove the area stored under ``key``; raises KeyError if absent."""
+        _, _, level, cells = self._entries.pop(key)
+        grid = self._levels[level]
+        for cell in cells:
+            bucket = grid[cell]
+            bucket.discard(key)
+            if not bucket:
+                del grid[cell]
+        if not grid:
+            del self._levels[level]
+
+    def candidates(self, latitude: float, longitude: float) -> List[K]:
+        """Return keys whose bounding box contains the coordinate."""
+        found: List[K] = []
+        entries = self._entries
+        for level, grid in self._levels.items():
+            size = _cell_size(level)
+            bucket = grid.get(
+                (int((longitude + 180.0) // size), int((latitude + 90.0) // size))
+            )
+            if bucket:
+                for key in bucket:
+                    if entries[key][1].contains_coordinates(latitude, longitude):
+                        found.append(key)
+        return found
+
+    def query_coordinates(self, latitude: float, longitude: float) -> List[K]:
+        """Return keys of all areas containing the coordinate."""
+        entries = self._entries
+        return [
+            key
+            for key in self.candidates(latitude, longitude)
+            if entries[key][0].contains_coordinates(latitude, longitude)
+        ]
+
+    def query_point(self, point: Point) -> List[K]:
+        """Return keys of all areas containing the point."""
+        return self.query_coordinates(point.latitude.value, point.longitude.value)
+
+    def query_batch(self, points: PointBatch) -> List[List[K]]:
+        """Return, for each coordinate of a batch, the keys of containing areas."""
+        query = self.query_coordinates
+        return [query(lat, lon) for lat, lon in points.coordinates()]
+
+    def query_bbox(self, box: BoundingBox) -> List[K]:
+        """Return keys of all areas whose bounding box intersects ``box``."""
+        found: Set[K] = set()
+        entries = self._entries
+        for level, grid in self._levels.items():
+            x0, y0, x1, y1 = _cell_range(box, _cell_size(level))
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > len(grid):
+                buckets: Iterable[Set[K]] = grid.values()
+            else:
+                buckets = (
+                    grid[(x, y)]
+                    for x in range(x0, x1 + 1)
+                    for y in range(y0, y1 + 1)
+                    if (x, y) in grid
+                )
+            for bucket in buckets:
+                for key in bucket:
+                    if key not in found and entries[key][1].intersects(box):
+                        found.add(key)
+        return list(found)
+
+    def query_intersecting(self, area: Area) -> List[K]:
+        """Return keys of all indexed areas that intersect ``area``."""
+        entries = self._entries
+        return [
+            key
+            for key in self.query_bbox(area.bounding_box())
+            if intersects(entries[key][0], area)
+        ]
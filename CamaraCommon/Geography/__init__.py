@@ -4,9 +4,25 @@
 from .Area import Area as Area
 # Area types
 from .AreaType import AreaType as AreaType
+from .BoundingBox import BoundingBox as BoundingBox
 from .Circle import Circle as Circle
+from .Distance import distance as distance
+from .Distance import distance_matrix as distance_matrix
+from .Distance import distances_from as distances_from
+from .Distance import haversine_distance as haversine_distance
+from .Distance import iter_distance_matrix as iter_distance_matrix
+from .Distance import vincenty_distance as vincenty_distance
+from .DistanceMethod import DistanceMethod as DistanceMethod
+from .GeofenceEngine import GeofenceEngine as GeofenceEngine
+from .GeofenceEvent import GeofenceEvent as GeofenceEvent
+from .GeofenceEventType import GeofenceEventType as GeofenceEventType
+from .Intersection import intersects as intersects
+from .Intersection import overlap_ratio as overlap_ratio
 from .Latitude import Latitude as Latitude
 from .Longitude import Longitude as Longitude
 from .Point import Point as Point
+from .PointBatch import PointBatch as PointBatch
 from .PointList import PointList as PointList
 from .Polygon import Polygon as Polygon
+from .PolygonGeometry import PolygonGeometry as PolygonGeometry
+from .SpatialIndex import SpatialIndex as SpatialIndex
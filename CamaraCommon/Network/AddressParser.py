@@ -0,0 +1,157 @@
+"""Shared IPv4/IPv6 address parsing for CAMARA network types."""
+
+import ipaddress
+import socket
+from array import array
+from typing import Iterable, List, NamedTuple, Optional
+
+from CamaraCommon.Basic.LaxString import lax_str
+
+# Every valid IPv4 octet spelling maps to its value. ipaddress accepts
+# exactly these strings: ASCII digits, no leading zeros, at most 255.
+_OCTETS = {str(octet): octet for octet in range(256)}
+
+
+def parse_ipv4(value: str) -> int:
+    """
+    Parse a dotted-quad IPv4 address to its 32-bit integer.
+
+    Accepts exactly what ``ipaddress.IPv4Address`` accepts for strings,
+    without allocating an address object. Raises ValueError otherwise.
+    """
+    parts = value.split(".")
+    if len(parts) == 4:
+        octets = _OCTETS
+        try:
+            return (
+                (octets[parts[0]] << 24)
+                | (octets[parts[1]] << 16)
+                | (octets[parts[2]] << 8)
+                | octets[parts[3]]
+            )
+        except KeyError:
+            pass
+    raise ValueError(f"Invalid IPv4 address: {value}")
+
+
+def parse_ipv6(value: str) -> int:
+    """Parse an IPv6 address to its 128-bit integer; raises ValueError."""
+    try:
+        return int(ipaddress.IPv6Address(value))
+    except ipaddress.AddressValueError:
+        raise ValueError(f"Invalid IPv6 address: {value}")
+
+
+def inet_pton_ipv6(value: str) -> Optional[int]:
+    """
+    Parse an IPv6 address with the C ``inet_pton``, or return None.
+
+    An order of magnitude faster than ``ipaddress``. It takes a subset of
+    what ``parse_ipv6`` accepts, so an integer means the address is valid
+    and equal to ``parse_ipv6(value)``; None means only that ``inet_pton``
+    did not take it, as for scoped addresses.
+    """
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET6, value), "big")
+    except (OSError, ValueError):
+        return None
+
+
+def ipv6_to_int(value: str) -> int:
+    """
+    Integer form of an IPv6 address that has already passed ``parse_ipv6``.
+
+    Uses ``inet_pton_ipv6`` and falls back to ``parse_ipv6`` for the forms
+    it does not take. Not a validator: the two parsers agree on valid
+    addresses but not necessarily on invalid ones.
+    """
+    address = inet_pton_ipv6(value)
+    if address is None:
+        return parse_ipv6(value)
+    return address
+
+
+class Ipv4BatchResult(NamedTuple):
+    """
+    Outcome of validating a column of IPv4 strings.
+
+    ``addresses`` holds the 32-bit integer of each valid row and 0 for
+    invalid rows; ``errors`` holds the validator message for invalid rows.
+    """
+
+    valid: List[bool]
+    addresses: "array[int]"
+    errors: List[Optional[str]]
+
+
+class Ipv6BatchResult(NamedTuple):
+    """
+    Outcome of validating a column of IPv6 strings.
+
+    Each valid address is split into its upper and lower 64 bits in
+    ``high`` and ``low``; invalid rows hold 0 and an error message.
+    """
+
+    valid: List[bool]
+    high: "array[int]"
+    low: "array[int]"
+    errors: List[Optional[str]]
+
+    def address(self, index: int) -> int:
+        """Return the full 128-bit integer of row ``index``."""
+        return (self.high[index] << 64) | self.low[index]
+
+
+def validate_ipv4_batch(values: Iterable[object]) -> Ipv4BatchResult:
+    """
+    Validate a column of IPv4 strings without building models.
+
+    Rows are accepted or rejected exactly as ``SingleIpv4Addr`` would, with
+    the same error message; bytes rows are decoded as UTF-8 like pydantic's
+    lax string mode.
+    """
+    valid: List[bool] = []
+    addresses = array("L")
+    errors: List[Optional[str]] = []
+    for value in values:
+        try:
+            addresses.append(parse_ipv4(lax_str(value)))
+            valid.append(True)
+            errors.append(None)
+            continue
+        except ValueError as exc:
+            error = str(exc)
+        addresses.append(0)
+        valid.append(False)
+        errors.append(error)
+    return Ipv4BatchResult(valid, addresses, errors)
+
+
+def validate_ipv6_batch(values: Iterable[object]) -> Ipv6BatchResult:
+    """
+    Validate a column of IPv6 strings without building models.
+
+    Rows are accepted or rejected exactly as ``DeviceIpv6Address`` would,
+    with the same error message; bytes rows are decoded as UTF-8 like
+    pydantic's lax string mode.
+    """
+    valid: List[bool] = []
+    high = array("Q")
+    low = array("Q")
+    errors: List[Optional[str]] = []
+    mask = (1 << 64) - 1
+    for value in values:
+        try:
+            address = parse_ipv6(lax_str(value))
+            high.append(address >> 64)
+            low.append(address & mask)
+            valid.append(True)
+            errors.append(None)
+            continue
+        except ValueError as exc:
+            error = str(exc)
+        high.append(0)
+        low.append(0)
+        valid.append(False)
+        errors.append(error)
+    return Ipv6BatchResult(valid, high, low, errors)
@@ -1,9 +1,11 @@
 """DeviceIpv4Addr data type for CAMARA APIs."""
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, model_validator
 
+from CamaraCommon.Basic.Trusted import construct_trusted
+
 from .Port import Port
 from .SingleIpv4Addr import SingleIpv4Addr
 
@@ -37,6 +39,28 @@ class DeviceIpv4Addr(BaseModel):
             )
         return self
 
+    @classmethod
+    def from_trusted(
+        cls,
+        publicAddress: str,
+        privateAddress: Optional[str] = None,
+        publicPort: Optional[int] = None,
+    ) -> "DeviceIpv4Addr":
+        """
+        Build a device address from raw values known to be valid.
+
+        Skips validation of the nested addresses and port as well as the
+        privateAddress/publicPort rule; see ``construct_trusted``.
+        """
+        values: Dict[str, Any] = {
+            "publicAddress": SingleIpv4Addr.from_trusted(publicAddress)
+        }
+        if privateAddress is not None:
+            values["privateAddress"] = SingleIpv4Addr.from_trusted(privateAddress)
+        if publicPort is not None:
+            values["publicPort"] = Port.from_trusted(publicPort)
+        return construct_trusted(cls, values)
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -1,15 +1,27 @@
 """DeviceIpv6Address data type for CAMARA APIs."""
 
 import ipaddress
+from typing import Iterable
 
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 
+from CamaraCommon.Basic.IntegerValue import IntegerValue
+from CamaraCommon.Basic.Trusted import construct_trusted_value
 
-class DeviceIpv6Address(BaseModel):
+from .AddressParser import (Ipv6BatchResult, ipv6_to_int, parse_ipv6,
+                            validate_ipv6_batch)
+
+
+class DeviceIpv6Address(IntegerValue):
     """
     The device should be identified by the observed IPv6 address,
     or by any single IPv6 address from within the subnet allocated
     to the device (e.g. adding ::0 to the /64 prefix).
+
+    The value serializes exactly as received. Equality, hashing and ordering
+    use the 128-bit integer form, so ``2001:db8::1`` equals
+    ``2001:0db8:0:0:0:0:0:1``. To match any address within the device's
+    subnet, compare ``prefix_key()`` values instead.
     """
 
     value: str
@@ -18,14 +30,42 @@ class DeviceIpv6Address(BaseModel):
     @classmethod
     def validate_ipv6(cls, v: str) -> str:
         """Validate IPv6 address format."""
-        try:
-            ipaddress.IPv6Address(v)
-        except ipaddress.AddressValueError:
-            raise ValueError(f"Invalid IPv6 address: {v}")
+        parse_ipv6(v)
         return v
 
-    def __str__(self) -> str:
-        return self.value
+    @classmethod
+    def validate_batch(cls, values: Iterable[object]) -> Ipv6BatchResult:
+        """
+        Validate many address strings at once without building models.
+
+        Returns a validity mask, the parsed integers and per-row error
+        messages matching ``validate_ipv6``.
+        """
+        return validate_ipv6_batch(values)
+
+    @classmethod
+    def from_trusted(cls, value: str) -> "DeviceIpv6Address":
+        """Build an address from a trusted value; see ``construct_trusted``."""
+        return construct_trusted_value(cls, value)
+
+    @staticmethod
+    def _to_int(value: str) -> int:
+        return ipv6_to_int(value)
+
+    @staticmethod
+    def _from_int(number: int) -> str:
+        return str(ipaddress.IPv6Address(number))
+
+    def prefix_key(self, prefix_len: int = 64) -> int:
+        """
+        Return the network bits of the address as an integer.
+
+        Two addresses in the same /``prefix_len`` subnet share a key whatever
+        their interface identifiers, so the key can index per-device caches.
+        """
+        if not 0 <= prefix_len <= 128:
+            raise ValueError(f"Invalid IPv6 prefix length: {prefix_len}")
+        return int(self) >> (128 - prefix_len)
 
     model_config = {
         "json_schema_extra": {"examples": ["2001:db8:85a3:8d3:1319:8a2e:370:7344"]}
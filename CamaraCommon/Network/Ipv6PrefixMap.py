@@ -0,0 +1,72 @@
+"""Prefix-keyed map for CAMARA IPv6 device addresses."""
+
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from .DeviceIpv6Address import DeviceIpv6Address
+
+V = TypeVar("V")
+
+
+class Ipv6PrefixMap(Generic[V]):
+    """
+    Map from IPv6 subnets of one fixed prefix length to values.
+
+    A device may be identified by any address within its allocated subnet,
+    so entries are keyed by ``DeviceIpv6Address.prefix_key(prefix_len)``
+    and a lookup hits for every address in the subnet, whatever its
+    interface identifier. Computing the key is a single shift of the cached
+    address integer. ``None`` cannot be stored as a value because it
+    signals a miss.
+    """
+
+    def __init__(self, prefix_len: int = 64) -> None:
+        if not 0 <= prefix_len <= 128:
+            raise ValueError(f"Invalid IPv6 prefix length: {prefix_len}")
+        self.prefix_len = prefix_len
+        self._shift = 128 - prefix_len
+        self._entries: Dict[int, V] = {}
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[Tuple[DeviceIpv6Address, V]], prefix_len: int = 64
+    ) -> "Ipv6PrefixMap[V]":
+        """Build a map from ``(address, value)`` pairs."""
+        prefix_map: "Ipv6PrefixMap[V]" = cls(prefix_len)
+        for address, value in items:
+            prefix_map.insert(address, value)
+        return prefix_map
+
+    def insert(self, address: DeviceIpv6Address, value: V) -> None:
+        """Map the subnet containing ``address`` to ``value``."""
+        if value is None:
+            raise ValueError("Ipv6PrefixMap values must not be None")
+        self._entries[int(address) >> self._shift] = value
+
+    def delete(self, address: DeviceIpv6Address) -> None:
+        """Remove the subnet containing ``address``; raises KeyError if absent."""
+        try:
+            del self._entries[int(address) >> self._shift]
+        except KeyError:
+            raise KeyError(address)
+
+    def lookup_int(self, address: int) -> Optional[V]:
+        """Look up a 128-bit address integer."""
+        return self._entries.get(address >> self._shift)
+
+    def lookup(self, address: DeviceIpv6Address) -> Optional[V]:
+        """Return the value of the subnet containing ``address``."""
+        return self._entries.get(int(address) >> self._shift)
+
+    def lookup_many(self, addresses: Iterable[DeviceIpv6Address]) -> List[Optional[V]]:
+        """Look up a batch of addresses."""
+        entries = self._entries
+        shift = self._shift
+        return [entries.get(int(address) >> shift) for address in addresses]
+
+    def __contains__(self, address: object) -> bool:
+        if not isinstance(address, DeviceIpv6Address):
+            return False
+        return (int(address) >> self._shift) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
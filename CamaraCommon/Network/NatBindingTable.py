@@ -0,0 +1,265 @@
+"""NAT binding table for CAMARA IPv4 device identifiers."""
+
+import heapq
+import math
+import time
+from array import array
+from typing import (Callable, Dict, Generic, Iterable, List, Optional, Tuple,
+                    TypeVar)
+
+from .DeviceIpv4Addr import DeviceIpv4Addr
+
+V = TypeVar("V")
+
+_PORT = 0
+_PRIVATE = 1
+
+
+class NatBindingTable(Generic[V]):
+    """
+    In-memory NAT/CGNAT binding table resolving DeviceIpv4Addr to values.
+
+    A DeviceIpv4Addr identifies a device by publicAddress plus either
+    publicPort or privateAddress, so bindings are kept in two hash tables:
+    one keyed on ``public << 16 | port`` and one keyed on
+    ``public << 32 | private``. Each key maps to a slot index; the value,
+    expiry and key of every slot live in flat arrays, so a binding costs a
+    dict entry and a few array cells rather than a tree of models. Freed
+    slots are reused.
+
+    Bindings may carry a TTL in seconds, measured with ``clock``
+    (``time.monotonic`` by default). Expired bindings are never returned and
+    are dropped lazily on lookup or eagerly by ``evict_expired``. ``None``
+    cannot be stored as a value because it signals a miss.
+    """
+
+    def __init__(
+        self,
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self._tables: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+        self._values: List[Optional[V]] = []
+        self._expires = array("d")
+        self._keys = array("Q")
+        self._modes = bytearray()
+        self._generations = array("L")
+        # Expiry of each slot's live heap entry, or inf if it has none.
+        self._queued = array("d")
+        self._free: List[int] = []
+        # (expires, slot, generation) for bindings with a finite TTL. A slot
+        # is pushed again only when its expiry moves earlier than its queued
+        # entry; later expiries are re-queued when that entry is popped.
+        self._heap: List[Tuple[float, int, int]] = []
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[Tuple[DeviceIpv4Addr, V]],
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> "NatBindingTable[V]":
+        """Build a table from ``(device, value)`` pairs."""
+        table: "NatBindingTable[V]" = cls(default_ttl, clock)
+        table.bulk_load(items)
+        return table
+
+    @staticmethod
+    def _port_key(public: int, port: int) -> int:
+        return (public << 16) | port
+
+    @staticmethod
+    def _private_key(public: int, private: int) -> int:
+        return (public << 32) | private
+
+    @staticmethod
+    def _device_keys(device: DeviceIpv4Addr) -> List[Tuple[int, int]]:
+        public = int(device.publicAddress)
+        keys = []
+        if device.publicPort is not None:
+            keys.append((_PORT, (public << 16) | int(device.publicPort)))
+        if device.privateAddress is not None:
+            keys.append((_PRIVATE, (public << 32) | int(device.privateAddress)))
+        return keys
+
+    def _expiry(self, ttl: Optional[float], now: Optional[float]) -> float:
+        if ttl is None:
+            ttl = self.default_ttl
+        if ttl is None:
+            return math.inf
+        if now is None:
+            now = self.clock()
+        return now + ttl
+
+    def _set(self, mode: int, key: int, value: V, expires: float) -> None:
+        if value is None:
+            raise ValueError("NatBindingTable values must not be None")
+        table = self._tables[mode]
+        slot = table.get(key)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._values[slot] = value
+                self._expires[slot] = expires
+                self._keys[slot] = key
+                self._modes[slot] = mode
+            else:
+                slot = len(self._values)
+                self._values.append(value)
+                self._expires.append(expires)
+                self._keys.append(key)
+                self._modes.append(mode)
+                self._generations.append(0)
+                self._queued.append(math.inf)
+            table[key] = slot
+        else:
+            self._values[slot] = value
+            self._expires[slot] = expires
+        if expires < self._queued[slot]:
+            # The entry this supersedes stays in the heap until popped, so
+            # rebuild once such stale entries outnumber the live bindings.
+            if len(self._heap) > 2 * len(self) + 64:
+                self._rebuild_heap()
+            else:
+                heapq.heappush(self._heap, (expires, slot, self._generations[slot]))
+                self._queued[slot] = expires
+
+    def _rebuild_heap(self) -> None:
+        # One entry per binding with a finite TTL, at its current expiry.
+        heap = []
+        expires = self._expires
+        queued = self._queued
+        generations = self._generations
+        for table in self._tables:
+            for slot in table.values():
+                queued[slot] = expires[slot]
+                if expires[slot] != math.inf:
+                    heap.append((expires[slot], slot, generations[slot]))
+        heapq.heapify(heap)
+        self._heap = heap
+
+    def _remove(self, mode: int, key: int) -> bool:
+        slot = self._tables[mode].pop(key, None)
+        if slot is None:
+            return False
+        self._values[slot] = None
+        # Invalidate any heap entry left for this slot.
+        self._generations[slot] = (self._generations[slot] + 1) & 0xFFFFFFFF
+        self._queued[slot] = math.inf
+        self._free.append(slot)
+        return True
+
+    def _get(self, mode: int, key: int) -> Optional[V]:
+        slot = self._tables[mode].get(key)
+        if slot is None:
+            return None
+        expires = self._expires[slot]
+        if expires != math.inf and expires <= self.clock():
+            self._remove(mode, key)
+            return None
+        return self._values[slot]
+
+    def insert(
+        self, device: DeviceIpv4Addr, value: V, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Bind ``device`` to ``value``, replacing any existing binding.
+
+        The binding is reachable by every key the device carries: its
+        publicPort, its privateAddress, or both.
+        """
+        expires = self._expiry(ttl, None)
+        for mode, key in self._device_keys(device):
+            self._set(mode, key, value, expires)
+
+    def insert_port(
+        self, public: int, port: int, value: V, ttl: Optional[float] = None
+    ) -> None:
+        """Bind a ``(publicAddress, publicPort)`` integer pair to ``value``."""
+        self._set(_PORT, self._port_key(public, port), value, self._expiry(ttl, None))
+
+    def insert_private(
+        self, public: int, private: int, value: V, ttl: Optional[float] = None
+    ) -> None:
+        """Bind a ``(publicAddress, privateAddress)`` integer pair."""
+        self._set(
+            _PRIVATE,
+            self._private_key(public, private),
+            value,
+            self._expiry(ttl, None),
+        )
+
+    def bulk_load(
+        self,
+        items: Iterable[Tuple[DeviceIpv4Addr, V]],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Insert many ``(device, value)`` pairs sharing one TTL."""
+        expires = self._expiry(ttl, None)
+        device_keys = self._device_keys
+        set_ = self._set
+        for device, value in items:
+            for mode, key in device_keys(device):
+                set_(mode, key, value, expires)
+
+    def delete(self, device: DeviceIpv4Addr) -> None:
+        """Remove every binding of ``device``; raises KeyError if none exist."""
+        removed = False
+        for mode, key in self._device_keys(device):
+            removed = self._remove(mode, key) or removed
+        if not removed:
+            raise KeyError(device)
+
+    def lookup_port(self, public: int, port: int) -> Optional[V]:
+        """Resolve a ``(publicAddress, publicPort)`` integer pair."""
+        return self._get(_PORT, (public << 16) | port)
+
+    def lookup_private(self, public: int, private: int) -> Optional[V]:
+        """Resolve a ``(publicAddress, privateAddress)`` integer pair."""
+        return self._get(_PRIVATE, (public << 32) | private)
+
+    def lookup(self, device: DeviceIpv4Addr) -> Optional[V]:
+        """
+        Resolve ``device`` to its bound value.
+
+        The publicPort binding is tried first, then the privateAddress one.
+        """
+        for mode, key in self._device_keys(device):
+            value = self._get(mode, key)
+            if value is not None:
+                return value
+        return None
+
+    def lookup_many(self, devices: Iterable[DeviceIpv4Addr]) -> List[Optional[V]]:
+        """Resolve a batch of devices."""
+        lookup = self.lookup
+        return [lookup(device) for device in devices]
+
+    def evict_expired(self) -> int:
+        """Drop every binding whose TTL has passed; returns how many."""
+        now = self.clock()
+        heap = self._heap
+        generations = self._generations
+        queued = self._queued
+        evicted = 0
+        while heap and heap[0][0] <= now:
+            when, slot, generation = heapq.heappop(heap)
+            if generations[slot] != generation or queued[slot] != when:
+                continue
+            expires = self._expires[slot]
+            if expires <= now:
+                if self._remove(self._modes[slot], self._keys[slot]):
+                    evicted += 1
+            elif expires != math.inf:
+                # Refreshed since it was queued: queue the new expiry.
+                heapq.heappush(heap, (expires, slot, generation))
+                queued[slot] = expires
+            else:
+                queued[slot] = math.inf
+        return evicted
+
+    def __len__(self) -> int:
+        """Number of stored bindings, including expired ones not yet evicted."""
+        return len(self._tables[_PORT]) + len(self._tables[_PRIVATE])
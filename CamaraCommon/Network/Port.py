@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from CamaraCommon.Basic.Trusted import construct_trusted_value
+
 
 class Port(BaseModel):
     """
@@ -12,6 +14,11 @@ class Port(BaseModel):
 
     value: int = Field(ge=0, le=65535, description="TCP or UDP port number")
 
+    @classmethod
+    def from_trusted(cls, value: int) -> "Port":
+        """Build a port from a trusted value; see ``construct_trusted``."""
+        return construct_trusted_value(cls, value)
+
     def __int__(self) -> int:
         return self.value
 
@@ -0,0 +1,147 @@
+"""Port range set for CAMARA firewall and QoS rules."""
+
+from array import array
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .Port import Port
+
+MAX_PORT = 65535
+
+PortLike = Union[Port, int]
+
+
+class PortRangeSet:
+    """
+    Immutable set of TCP/UDP ports stored as merged, sorted inclusive ranges.
+
+    Membership is a binary search over the range starts. Once a set holds
+    more than ``DENSE_RANGES`` ranges it also builds a 65536-bit bitmap
+    (8 KiB) and answers membership with a single byte lookup instead.
+    Overlapping and adjacent ranges are merged on construction, so two sets
+    holding the same ports always compare equal.
+    """
+
+    DENSE_RANGES = 64
+
+    __slots__ = ("_starts", "_ends", "_bitmap")
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()) -> None:
+        spans = []
+        for start, end in ranges:
+            if not 0 <= start <= end <= MAX_PORT:
+                raise ValueError(f"Invalid port range: {start}-{end}")
+            spans.append((start, end))
+        spans.sort()
+        starts = array("l")
+        ends = array("l")
+        for start, end in spans:
+            if ends and start <= ends[-1] + 1:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts = starts
+        self._ends = ends
+        self._bitmap: Optional[bytearray] = None
+        if len(starts) > self.DENSE_RANGES:
+            self._bitmap = self._build_bitmap()
+
+    @classmethod
+    def from_ports(cls, ports: Iterable[PortLike]) -> "PortRangeSet":
+        """Build a set from individual ports."""
+        return cls((int(port), int(port)) for port in ports)
+
+    def _build_bitmap(self) -> bytearray:
+        bitmap = bytearray((MAX_PORT + 1) >> 3)
+        for start, end in zip(self._starts, self._ends):
+            for port in range(start, end + 1):
+                bitmap[port >> 3] |= 1 << (port & 7)
+        return bitmap
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        """Return the merged inclusive ranges in ascending order."""
+        return list(zip(self._starts, self._ends))
+
+    def _contains_int(self, port: int) -> bool:
+        if not 0 <= port <= MAX_PORT:
+            return False
+        bitmap = self._bitmap
+        if bitmap is not None:
+            return bool(bitmap[port >> 3] >> (port & 7) & 1)
+        index = bisect_right(self._starts, port) - 1
+        return index >= 0 and port <= self._ends[index]
+
+    def __contains__(self, port: object) -> bool:
+        if isinstance(port, Port):
+            return self._contains_int(port.value)
+        if isinstance(port, int):
+            return self._contains_int(port)
+        return False
+
+    def contains_batch(self, ports: Iterable[PortLike]) -> List[bool]:
+        """Test membership of many ports at once."""
+        values = [port.value if isinstance(port, Port) else port for port in ports]
+        bitmap = self._bitmap
+        if bitmap is not None:
+            return [
+                0 <= port <= MAX_PORT and bool(bitmap[port >> 3] >> (port & 7) & 1)
+                for port in values
+            ]
+        starts = self._starts
+        ends = self._ends
+        result = []
+        for port in values:
+            index = bisect_right(starts, port) - 1
+            result.append(index >= 0 and port <= ends[index])
+        return result
+
+    def union(self, other: "PortRangeSet") -> "PortRangeSet":
+        """Return the ports in either set."""
+        return PortRangeSet(self.ranges() + other.ranges())
+
+    def intersection(self, other: "PortRangeSet") -> "PortRangeSet":
+        """Return the ports in both sets."""
+        spans = []
+        a_starts, a_ends = self._starts, self._ends
+        b_starts, b_ends = other._starts, other._ends
+        i = j = 0
+        while i < len(a_starts) and j < len(b_starts):
+            start = max(a_starts[i], b_starts[j])
+            end = min(a_ends[i], b_ends[j])
+            if start <= end:
+                spans.append((start, end))
+            if a_ends[i] < b_ends[j]:
+                i += 1
+            else:
+                j += 1
+        return PortRangeSet(spans)
+
+    def __or__(self, other: "PortRangeSet") -> "PortRangeSet":
+        return self.union(other)
+
+    def __and__(self, other: "PortRangeSet") -> "PortRangeSet":
+        return self.intersection(other)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PortRangeSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self) -> int:
+        return hash((bytes(self._starts), bytes(self._ends)))
+
+    def __len__(self) -> int:
+        """Number of ports in the set."""
+        return sum(end - start + 1 for start, end in zip(self._starts, self._ends))
+
+    def __bool__(self) -> bool:
+        return len(self._starts) > 0
+
+    def __repr__(self) -> str:
+        spans = ", ".join(
+            str(start) if start == end else f"{start}-{end}"
+            for start, end in self.ranges()
+        )
+        return f"PortRangeSet([{spans}])"
@@ -0,0 +1,127 @@
+"""Longest-prefix-match table for CAMARA device addresses."""
+
+import ipaddress
+from typing import (Dict, Generic, Iterable, List, Optional, Tuple, TypeVar,
+                    Union)
+
+from .DeviceIpv4Addr import DeviceIpv4Addr
+from .DeviceIpv6Address import DeviceIpv6Address
+from .SingleIpv4Addr import SingleIpv4Addr
+
+V = TypeVar("V")
+
+Address = Union[SingleIpv4Addr, DeviceIpv4Addr, DeviceIpv6Address]
+
+
+class _Family(Generic[V]):
+    """Prefix tables of one address family, bucketed by prefix length."""
+
+    __slots__ = ("width", "tables", "lengths")
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self.tables: Dict[int, Dict[int, V]] = {}
+        # Populated prefix lengths, longest first.
+        self.lengths: List[int] = []
+
+    def insert(self, network: int, length: int, value: V) -> None:
+        table = self.tables.get(length)
+        if table is None:
+            table = self.tables[length] = {}
+            self.lengths = sorted(self.tables, reverse=True)
+        table[network >> (self.width - length)] = value
+
+    def delete(self, network: int, length: int) -> None:
+        table = self.tables[length]
+        del table[network >> (self.width - length)]
+        if not table:
+            del self.tables[length]
+            self.lengths = sorted(self.tables, reverse=True)
+
+    def lookup(self, address: int) -> Optional[V]:
+        width = self.width
+        tables = self.tables
+        for length in self.lengths:
+            value = tables[length].get(address >> (width - length))
+            if value is not None:
+                return value
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.tables.values())
+
+
+class PrefixTable(Generic[V]):
+    """
+    Longest-prefix-match table mapping IPv4 and IPv6 CIDR blocks to values.
+
+    Prefixes are stored in one hash table per prefix length, keyed by the
+    network bits as an integer. A lookup shifts the address integer once per
+    populated prefix length, longest first, so it costs at most 33 (IPv4) or
+    129 (IPv6) dict probes and allocates no ``ipaddress`` objects. Addresses
+    are taken as SingleIpv4Addr, DeviceIpv4Addr (its publicAddress) or
+    DeviceIpv6Address, using their cached integer form. ``None`` cannot be
+    stored as a value because it signals a miss.
+    """
+
+    def __init__(self) -> None:
+        self._ipv4: _Family[V] = _Family(32)
+        self._ipv6: _Family[V] = _Family(128)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, V]]) -> "PrefixTable[V]":
+        """Build a table from ``(cidr, value)`` pairs."""
+        table: "PrefixTable[V]" = cls()
+        for cidr, value in items:
+            table.insert(cidr, value)
+        return table
+
+    @staticmethod
+    def _parse(
+        cidr: str,
+    ) -> Union[ipaddress.IPv4Network, ipaddress.IPv6Network]:
+        try:
+            return ipaddress.ip_network(cidr)
+        except ValueError:
+            raise ValueError(f"Invalid CIDR block: {cidr}")
+
+    def insert(self, cidr: str, value: V) -> None:
+        """Map a CIDR block such as ``"10.0.0.0/8"`` to ``value``."""
+        if value is None:
+            raise ValueError("PrefixTable values must not be None")
+        network = self._parse(cidr)
+        family = self._ipv4 if network.version == 4 else self._ipv6
+        family.insert(int(network.network_address), network.prefixlen, value)
+
+    def delete(self, cidr: str) -> None:
+        """Remove a CIDR block; raises KeyError if it is not present."""
+        network = self._parse(cidr)
+        family = self._ipv4 if network.version == 4 else self._ipv6
+        try:
+            family.delete(int(network.network_address), network.prefixlen)
+        except KeyError:
+            raise KeyError(cidr)
+
+    def lookup_ipv4(self, address: int) -> Optional[V]:
+        """Longest-prefix match for a 32-bit address integer."""
+        return self._ipv4.lookup(address)
+
+    def lookup_ipv6(self, address: int) -> Optional[V]:
+        """Longest-prefix match for a 128-bit address integer."""
+        return self._ipv6.lookup(address)
+
+    def lookup(self, address: Address) -> Optional[V]:
+        """Return the value of the longest prefix containing ``address``."""
+        if isinstance(address, DeviceIpv4Addr):
+            return self._ipv4.lookup(int(address.publicAddress))
+        if isinstance(address, SingleIpv4Addr):
+            return self._ipv4.lookup(int(address))
+        return self._ipv6.lookup(int(address))
+
+    def lookup_many(self, addresses: Iterable[Address]) -> List[Optional[V]]:
+        """Look up a batch of addresses."""
+        lookup = self.lookup
+        return [lookup(address) for address in addresses]
+
+    def __len__(self) -> int:
+        return len(self._ipv4) + len(self._ipv6)
@@ -1,13 +1,22 @@
 """SingleIpv4Addr data type for CAMARA APIs."""
 
 import ipaddress
+from typing import Iterable
 
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 
+from CamaraCommon.Basic.IntegerValue import IntegerValue
+from CamaraCommon.Basic.Trusted import construct_trusted_value
 
-class SingleIpv4Addr(BaseModel):
+from .AddressParser import Ipv4BatchResult, parse_ipv4, validate_ipv4_batch
+
+
+class SingleIpv4Addr(IntegerValue):
     """
     A single IPv4 address with no subnet mask.
+
+    The value serializes exactly as received. Equality, hashing and ordering
+    use the 32-bit integer form.
     """
 
     value: str
@@ -16,13 +25,30 @@ class SingleIpv4Addr(BaseModel):
     @classmethod
     def validate_ipv4(cls, v: str) -> str:
         """Validate IPv4 address format."""
-        try:
-            ipaddress.IPv4Address(v)
-        except ipaddress.AddressValueError:
-            raise ValueError(f"Invalid IPv4 address: {v}")
+        parse_ipv4(v)
         return v
 
-    def __str__(self) -> str:
-        return self.value
+    @classmethod
+    def validate_batch(cls, values: Iterable[object]) -> Ipv4BatchResult:
+        """
+        Validate many address strings at once without building models.
+
+        Returns a validity mask, the parsed integers and per-row error
+        messages matching ``validate_ipv4``.
+        """
+        return validate_ipv4_batch(values)
+
+    @classmethod
+    def from_trusted(cls, value: str) -> "SingleIpv4Addr":
+        """Build an address from a trusted value; see ``construct_trusted``."""
+        return construct_trusted_value(cls, value)
+
+    @staticmethod
+    def _to_int(value: str) -> int:
+        return parse_ipv4(value)
+
+    @staticmethod
+    def _from_int(number: int) -> str:
+        return str(ipaddress.IPv4Address(number))
 
     model_config = {"json_schema_extra": {"examples": ["84.125.93.10"]}}
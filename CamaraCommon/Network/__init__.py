@@ -2,5 +2,9 @@
 
 from .DeviceIpv4Addr import DeviceIpv4Addr as DeviceIpv4Addr
 from .DeviceIpv6Address import DeviceIpv6Address as DeviceIpv6Address
+from .Ipv6PrefixMap import Ipv6PrefixMap as Ipv6PrefixMap
+from .NatBindingTable import NatBindingTable as NatBindingTable
 from .Port import Port as Port
+from .PortRangeSet import PortRangeSet as PortRangeSet
+from .PrefixTable import PrefixTable as PrefixTable
 from .SingleIpv4Addr import SingleIpv4Addr as SingleIpv4Addr
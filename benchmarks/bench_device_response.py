@@ -0,0 +1,67 @@
+"""
+Benchmark DeviceResponse.from_device against re-validating a response.
+
+Run from the repository root:
+    python benchmarks/bench_device_response.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from CamaraCommon.Device import Device, DeviceResponse
+
+
+def _compare(
+    name: str, baseline: Callable[[], object], fast: Callable[[], object], number: int
+) -> None:
+    base_time = min(timeit.repeat(baseline, number=number, repeat=5))
+    fast_time = min(timeit.repeat(fast, number=number, repeat=5))
+    print(
+        f"{name:<24} validated {base_time / number * 1e6:8.2f} us  "
+        f"from_device {fast_time / number * 1e6:8.2f} us  "
+        f"speedup {base_time / fast_time:5.2f}x"
+    )
+
+
+def main() -> None:
+    device = Device.model_validate(
+        {
+            "phoneNumber": {"value": "+123456789"},
+            "networkAccessIdentifier": {"value": "123456789@example.com"},
+            "ipv4Address": {
+                "publicAddress": {"value": "84.125.93.10"},
+                "publicPort": {"value": 59765},
+            },
+            "ipv6Address": {"value": "2001:db8:85a3:8d3:1319:8a2e:370:7344"},
+        }
+    )
+    prefer = ("ipv4Address", "phoneNumber")
+
+    def copy_and_null() -> DeviceResponse:
+        # The pattern handlers used: dump the request, drop the other
+        # identifiers and validate the result again.
+        data = device.model_dump(include={"ipv4Address"})
+        return DeviceResponse.model_validate(data)
+
+    _compare(
+        "single device",
+        copy_and_null,
+        lambda: DeviceResponse.from_device(device, prefer=prefer),
+        20000,
+    )
+
+    devices = [device] * 1000
+    _compare(
+        "1000 devices",
+        lambda: [copy_and_null() for _ in devices],
+        lambda: DeviceResponse.from_devices(devices, prefer=prefer),
+        20,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark the streaming Device decoders against per-line validation.
+
+Run from the repository root:
+    python benchmarks/bench_device_stream.py
+"""
+
+import json
+import sys
+import timeit
+from collections import deque
+from pathlib import Path
+from typing import Callable, Iterable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter
+
+from CamaraCommon.Device import Device
+from CamaraCommon.Device.DeviceStream import (
+    iter_devices_json_array,
+    iter_devices_ndjson,
+)
+
+ROWS = [
+    {
+        "phoneNumber": {"value": "+123456789"},
+        "networkAccessIdentifier": {"value": "123456789@example.com"},
+        "ipv4Address": {
+            "publicAddress": {"value": "84.125.93.10"},
+            "publicPort": {"value": 59765},
+        },
+        "ipv6Address": {"value": "2001:db8:85a3:8d3:1319:8a2e:370:7344"},
+    },
+    {"phoneNumber": {"value": "+4915112345678"}},
+    {
+        "ipv4Address": {
+            "publicAddress": {"value": "84.125.93.10"},
+            "privateAddress": {"value": "10.0.0.1"},
+        }
+    },
+]
+
+
+def _compare(
+    name: str,
+    baseline: Callable[[], object],
+    fast: Callable[[], object],
+    rows: int,
+    number: int = 3,
+) -> None:
+    base_time = min(timeit.repeat(baseline, number=number, repeat=3))
+    fast_time = min(timeit.repeat(fast, number=number, repeat=3))
+    print(
+        f"{name:<24} baseline {base_time / number / rows * 1e6:8.2f} us/row  "
+        f"stream {fast_time / number / rows * 1e6:8.2f} us/row  "
+        f"speedup {base_time / fast_time:5.2f}x"
+    )
+
+
+def _drain(records: Iterable[object]) -> None:
+    # Consume without keeping results, as a streaming job would.
+    deque(records, maxlen=0)
+
+
+def main() -> None:
+    rows = [ROWS[i % len(ROWS)] for i in range(30000)]
+    lines = [json.dumps(row).encode() for row in rows]
+    ndjson = b"\n".join(lines)
+    array = json.dumps(rows).encode()
+    devices = TypeAdapter(List[Device])
+
+    _compare(
+        "NDJSON, per line",
+        lambda: _drain(
+            Device.model_validate_json(line) for line in ndjson.splitlines()
+        ),
+        lambda: _drain(iter_devices_ndjson(ndjson)),
+        len(rows),
+    )
+    full = b"\n".join(lines[:: len(ROWS)])
+    _compare(
+        "NDJSON, all identifiers",
+        lambda: _drain(Device.model_validate_json(line) for line in full.splitlines()),
+        lambda: _drain(iter_devices_ndjson(full)),
+        len(rows) // len(ROWS),
+    )
+    _compare(
+        "JSON array, whole",
+        lambda: devices.validate_json(array),
+        lambda: _drain(iter_devices_json_array(array)),
+        len(rows),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark FastJson against the pydantic model JSON path.
+
+Run from the repository root:
+    python benchmarks/bench_fast_json.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter
+
+from CamaraCommon.Geography import (Circle, FastJson, Latitude, Longitude,
+                                    Point, PointList, Polygon)
+
+
+def _point(lat: float, lon: float) -> Point:
+    return Point(latitude=Latitude(value=lat), longitude=Longitude(value=lon))
+
+
+def _compare(
+    name: str, baseline: Callable[[], object], fast: Callable[[], object], number: int
+) -> None:
+    base_time = min(timeit.repeat(baseline, number=number, repeat=5))
+    fast_time = min(timeit.repeat(fast, number=number, repeat=5))
+    print(
+        f"{name:<28} model {base_time / number * 1e6:8.2f} us  "
+        f"fast {fast_time / number * 1e6:8.2f} us  "
+        f"speedup {base_time / fast_time:5.2f}x"
+    )
+
+
+def main() -> None:
+    point = _point(50.735851, 7.10066)
+    boundary = PointList(
+        points=[_point(50.0 + i * 0.001, 7.0 + (i % 3) * 0.002) for i in range(15)]
+    )
+    circle = Circle(center=point, radius=1000.0)
+    polygon = Polygon(boundary=boundary)
+
+    assert FastJson.dump_point_json(point) == point.model_dump_json()
+    assert FastJson.dump_circle_json(circle) == circle.model_dump_json()
+
+    _compare(
+        "Point dump",
+        point.model_dump_json,
+        lambda: FastJson.dump_point_json(point),
+        20000,
+    )
+    _compare(
+        "Circle dump",
+        circle.model_dump_json,
+        lambda: FastJson.dump_circle_json(circle),
+        20000,
+    )
+
+    polygon_json = polygon.model_dump_json()
+    _compare(
+        "Polygon load -> PointBatch",
+        lambda: Polygon.model_validate_json(polygon_json),
+        lambda: FastJson.load_points_json(polygon_json),
+        5000,
+    )
+    points_adapter = TypeAdapter(List[Point])
+    many_json = points_adapter.dump_json(
+        [_point((i % 180) - 90.0, (i % 360) - 180.0) for i in range(10000)]
+    )
+    _compare(
+        "10k points load -> batch",
+        lambda: points_adapter.validate_json(many_json),
+        lambda: FastJson.load_points_json(many_json),
+        20,
+    )
+
+
+if __name__ == "__main__":
+    main()
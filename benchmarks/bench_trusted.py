@@ -0,0 +1,95 @@
+"""
+Benchmark trusted construction against validated construction.
+
+Run from the repository root:
+    python benchmarks/bench_trusted.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from CamaraCommon.Communication import NetworkAccessIdentifier, PhoneNumber
+from CamaraCommon.Device import Device
+from CamaraCommon.Network import (DeviceIpv4Addr, DeviceIpv6Address, Port,
+                                  SingleIpv4Addr)
+
+
+def _compare(
+    name: str, baseline: Callable[[], object], fast: Callable[[], object], number: int
+) -> None:
+    base_time = min(timeit.repeat(baseline, number=number, repeat=5))
+    fast_time = min(timeit.repeat(fast, number=number, repeat=5))
+    print(
+        f"{name:<24} validated {base_time / number * 1e6:8.2f} us  "
+        f"trusted {fast_time / number * 1e6:8.2f} us  "
+        f"speedup {base_time / fast_time:5.2f}x"
+    )
+
+
+def main() -> None:
+    number = 20000
+    _compare(
+        "Port",
+        lambda: Port(value=59765),
+        lambda: Port.from_trusted(59765),
+        number,
+    )
+    _compare(
+        "SingleIpv4Addr",
+        lambda: SingleIpv4Addr(value="84.125.93.10"),
+        lambda: SingleIpv4Addr.from_trusted("84.125.93.10"),
+        number,
+    )
+    _compare(
+        "DeviceIpv6Address",
+        lambda: DeviceIpv6Address(value="2001:db8:85a3:8d3:1319:8a2e:370:7344"),
+        lambda: DeviceIpv6Address.from_trusted("2001:db8:85a3:8d3:1319:8a2e:370:7344"),
+        number,
+    )
+    _compare(
+        "PhoneNumber",
+        lambda: PhoneNumber(value="+123456789"),
+        lambda: PhoneNumber.from_trusted("+123456789"),
+        number,
+    )
+    _compare(
+        "NetworkAccessIdentifier",
+        lambda: NetworkAccessIdentifier(value="123456789@example.com"),
+        lambda: NetworkAccessIdentifier.from_trusted("123456789@example.com"),
+        number,
+    )
+    _compare(
+        "DeviceIpv4Addr",
+        lambda: DeviceIpv4Addr.model_validate(
+            {"publicAddress": {"value": "84.125.93.10"}, "publicPort": {"value": 59765}}
+        ),
+        lambda: DeviceIpv4Addr.from_trusted("84.125.93.10", publicPort=59765),
+        number,
+    )
+    _compare(
+        "Device",
+        lambda: Device.model_validate(
+            {
+                "phoneNumber": {"value": "+123456789"},
+                "ipv4Address": {
+                    "publicAddress": {"value": "84.125.93.10"},
+                    "publicPort": {"value": 59765},
+                },
+                "ipv6Address": {"value": "2001:db8:85a3:8d3:1319:8a2e:370:7344"},
+            }
+        ),
+        lambda: Device.from_trusted(
+            phoneNumber="+123456789",
+            ipv4Address=DeviceIpv4Addr.from_trusted("84.125.93.10", publicPort=59765),
+            ipv6Address="2001:db8:85a3:8d3:1319:8a2e:370:7344",
+        ),
+        number,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Shared factories for the tests.
+"""
+
+from typing import Optional
+
+from CamaraCommon.Geography import (Latitude, Longitude, Point, PointList,
+                                    Polygon)
+from CamaraCommon.Network import DeviceIpv4Addr, Port, SingleIpv4Addr
+
+
+def make_point(lat: float, lon: float) -> Point:
+    """Build a Point from raw coordinates."""
+    return Point(latitude=Latitude(value=lat), longitude=Longitude(value=lon))
+
+
+def make_square(lat: float, lon: float, size: float) -> Polygon:
+    """Build a counter-clockwise square with its south-west corner at lat/lon."""
+    return Polygon(
+        boundary=PointList(
+            points=[
+                make_point(lat, lon),
+                make_point(lat, lon + size),
+                make_point(lat + size, lon + size),
+                make_point(lat + size, lon),
+            ]
+        )
+    )
+
+
+def make_ipv4(
+    public: str, private: Optional[str] = None, port: Optional[int] = None
+) -> DeviceIpv4Addr:
+    """Build a device IPv4 address from a public address and optional parts."""
+    return DeviceIpv4Addr(
+        publicAddress=SingleIpv4Addr(value=public),
+        privateAddress=SingleIpv4Addr(value=private) if private else None,
+        publicPort=Port(value=port) if port is not None else None,
+    )
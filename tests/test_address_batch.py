@@ -0,0 +1,150 @@
+"""
+Tests for bulk IPv4/IPv6 address validation.
+"""
+
+import ipaddress
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from CamaraCommon.Network import DeviceIpv6Address, SingleIpv4Addr
+from CamaraCommon.Network.AddressParser import inet_pton_ipv6, ipv6_to_int
+
+IPV4_CORPUS = [
+    "192.168.1.1",
+    "0.0.0.0",
+    "255.255.255.255",
+    "10.0.0.01",
+    "256.1.1.1",
+    "1.2.3",
+    "1.2.3.4.5",
+    "1.2.3.4/24",
+    "",
+    " 1.2.3.4",
+    "1..3.4",
+    "१.2.3.4",
+    "+1.2.3.4",
+    "1.2.3.0x4",
+    "invalid",
+]
+
+IPV6_CORPUS = [
+    "2001:db8::1",
+    "::",
+    "::1",
+    "::ffff:192.168.1.1",
+    "fe80::1%eth0",
+    "2001:db8::1::2",
+    "2001:db8:0:0:0:0:0:0:1",
+    "gggg::1",
+    "",
+    "192.168.1.1",
+    "ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff",
+]
+
+
+def _single_error(model, value):
+    try:
+        model(value=value)
+    except ValidationError as exc:
+        return exc.errors()[0]["ctx"]["error"].args[0]
+    return None
+
+
+class TestIpv4Batch:
+    """Test SingleIpv4Addr.validate_batch."""
+
+    def test_matches_single_validator(self):
+        """Test every row agrees with the model validator."""
+        result = SingleIpv4Addr.validate_batch(IPV4_CORPUS)
+        for index, value in enumerate(IPV4_CORPUS):
+            error = _single_error(SingleIpv4Addr, value)
+            assert result.valid[index] is (error is None)
+            assert result.errors[index] == error
+            if error is None:
+                assert result.addresses[index] == int(ipaddress.IPv4Address(value))
+            else:
+                assert result.addresses[index] == 0
+
+    def test_random_octets(self):
+        """Test random dotted strings against the ipaddress module."""
+        rng = random.Random(13)
+        pieces = ["0", "00", "1", "01", "99", "255", "256", "999", "", "a"]
+        values = [".".join(rng.choice(pieces) for _ in range(4)) for _ in range(500)]
+        result = SingleIpv4Addr.validate_batch(values)
+        for index, value in enumerate(values):
+            try:
+                expected = int(ipaddress.IPv4Address(value))
+            except ipaddress.AddressValueError:
+                assert not result.valid[index]
+            else:
+                assert result.valid[index]
+                assert result.addresses[index] == expected
+
+    def test_non_string_rows(self):
+        """Test non-string rows are reported with pydantic's message."""
+        result = SingleIpv4Addr.validate_batch(["1.2.3.4", None, 5])
+        assert result.valid == [True, False, False]
+        assert result.errors[1] == "Input should be a valid string"
+        assert result.errors[2] == "Input should be a valid string"
+
+    def test_bytes_rows(self):
+        """Test bytes rows are decoded as UTF-8 like pydantic's lax mode."""
+        result = SingleIpv4Addr.validate_batch([b"1.2.3.4", bytearray(b"10.0.0.1")])
+        assert result.valid == [True, True]
+        assert list(result.addresses) == [0x01020304, 0x0A000001]
+        assert SingleIpv4Addr(value=b"1.2.3.4").value == "1.2.3.4"
+
+    def test_empty_batch(self):
+        """Test an empty input yields empty columns."""
+        result = SingleIpv4Addr.validate_batch([])
+        assert result.valid == [] and len(result.addresses) == 0
+
+
+class TestIpv6Batch:
+    """Test DeviceIpv6Address.validate_batch."""
+
+    def test_matches_single_validator(self):
+        """Test every row agrees with the model validator."""
+        result = DeviceIpv6Address.validate_batch(IPV6_CORPUS)
+        for index, value in enumerate(IPV6_CORPUS):
+            error = _single_error(DeviceIpv6Address, value)
+            assert result.valid[index] is (error is None)
+            assert result.errors[index] == error
+            if error is None:
+                assert result.address(index) == int(ipaddress.IPv6Address(value))
+            else:
+                assert result.address(index) == 0
+
+    def test_high_low_split(self):
+        """Test the 128-bit value is split into two 64-bit halves."""
+        result = DeviceIpv6Address.validate_batch(["2001:db8::ffff:0:0:1"])
+        assert result.high[0] == 0x20010DB800000000
+        assert result.low[0] == 0xFFFF000000000001
+
+    @pytest.mark.parametrize("value", [None, 1, b"\xff::1"])
+    def test_non_string_rows(self, value):
+        """Test non-string rows are reported with pydantic's message."""
+        result = DeviceIpv6Address.validate_batch([value])
+        assert result.valid == [False]
+        with pytest.raises(ValidationError) as exc:
+            DeviceIpv6Address(value=value)
+        assert result.errors[0] == exc.value.errors()[0]["msg"]
+
+    def test_inet_pton_agrees_with_validator(self):
+        """Test the inet_pton parser only accepts valid addresses."""
+        for value in IPV6_CORPUS:
+            address = inet_pton_ipv6(value)
+            if address is not None:
+                assert address == int(ipaddress.IPv6Address(value))
+        assert inet_pton_ipv6("2001:db8::1") == 0x20010DB8000000000000000000000001
+        assert inet_pton_ipv6("fe80::1%eth0") is None
+        assert ipv6_to_int("fe80::1%eth0") == int(DeviceIpv6Address(value="fe80::1"))
+
+    def test_bytes_rows(self):
+        """Test bytes rows are decoded as UTF-8 like pydantic's lax mode."""
+        result = DeviceIpv6Address.validate_batch([b"::1", b"gggg::1"])
+        assert result.valid == [True, False]
+        assert result.low[0] == 1
+        assert result.errors[1] == _single_error(DeviceIpv6Address, "gggg::1")
@@ -1,12 +1,12 @@
 """
-Tests for basic data types (XCorrelator, TimePeriod).
+Tests for basic data types (XCorrelator, TimePeriod, IntegerValue).
 """
 
 from datetime import datetime, timezone
 
 import pytest
 
-from CamaraCommon.Basic import TimePeriod, XCorrelator
+from CamaraCommon.Basic import IntegerValue, TimePeriod, XCorrelator
 
 
 class TestXCorrelator:
@@ -61,3 +61,31 @@ class TestTimePeriod:
         assert time_period.startDate.tzinfo is not None
         if time_period.endDate is not None:
             assert time_period.endDate.tzinfo is not None
+
+
+class TestIntegerValue:
+    """Test the integer-backed base model."""
+
+    def test_requires_conversions(self):
+        """Test the base model cannot be built without conversions."""
+        with pytest.raises(TypeError):
+            IntegerValue(value="1")
+
+    def test_subclass(self):
+        """Test a subclass compares, hashes and round-trips by integer."""
+
+        class Hex(IntegerValue):
+            @staticmethod
+            def _to_int(value: str) -> int:
+                return int(value, 16)
+
+            @staticmethod
+            def _from_int(number: int) -> str:
+                return f"{number:x}"
+
+        assert Hex(value="0a") == Hex(value="A")
+        assert hash(Hex(value="0a")) == hash(10)
+        assert sorted([Hex(value="ff"), Hex(value="1")])[0].value == "1"
+        assert Hex.from_int(255).value == "ff"
+        assert str(Hex(value="0a")) == "0a"
+        assert Hex(value="0a").model_dump_json() == '{"value":"0a"}'
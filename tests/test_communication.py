@@ -52,6 +52,32 @@ class TestPhoneNumber:
         max_phone = PhoneNumber(value="+123456789012345")
         assert max_phone.value == "+123456789012345"
 
+    def test_integer_form(self):
+        """Test the packed integer form, round trip and ordering."""
+        phone = PhoneNumber(value="+4917612345678")
+        assert int(phone) == 4917612345678
+        assert PhoneNumber.from_int(int(phone)) == phone
+        assert PhoneNumber.from_int(int(phone)).value == "+4917612345678"
+        assert int(PhoneNumber(value="+123456789012345")) < 2**64
+        assert PhoneNumber(value="+12345") < phone
+        assert hash(phone) == hash(PhoneNumber(value="+4917612345678"))
+        assert len({phone, PhoneNumber(value="+4917612345678")}) == 1
+        with pytest.raises(ValueError):
+            PhoneNumber.from_int(0)
+
+    def test_no_per_instance_cache(self):
+        """Test numbers carry no private state beyond their value."""
+        phone = PhoneNumber(value="+123456789")
+        hash(phone)
+        assert phone.__pydantic_private__ is None
+
+    def test_reassigned_value_refreshes_integer(self):
+        """Test the integer form follows value changes."""
+        phone = PhoneNumber(value="+123456789")
+        assert int(phone) == 123456789
+        phone.value = "+987654321"
+        assert int(phone) == 987654321
+
 
 class TestNetworkAccessIdentifier:
     """Test NetworkAccessIdentifier validation."""
@@ -124,3 +124,161 @@ class TestDeviceResponse:
             ValueError, match="At least one device identifier must be provided"
         ):
             DeviceResponse()
+
+
+def _full_device():
+    return Device(
+        phoneNumber=PhoneNumber(value="+1234567890"),
+        networkAccessIdentifier=NetworkAccessIdentifier(value="user@example.com"),
+        ipv4Address=DeviceIpv4Addr(
+            publicAddress=SingleIpv4Addr(value="84.125.93.10"),
+            publicPort=Port(value=59765),
+        ),
+        ipv6Address=DeviceIpv6Address(value="2001:db8::1"),
+    )
+
+
+class TestDeviceResponseFromDevice:
+    """Test selecting a DeviceResponse identifier from a Device."""
+
+    def test_default_priority(self):
+        """Test the phone number wins by default and matches validation."""
+        device = _full_device()
+        response = DeviceResponse.from_device(device)
+        expected = DeviceResponse(phoneNumber=device.phoneNumber)
+        assert type(response) is DeviceResponse
+        assert response == expected
+        assert response.model_dump_json() == expected.model_dump_json()
+        assert response.model_fields_set == {"phoneNumber"}
+        assert response.phoneNumber is device.phoneNumber
+
+    def test_prefer_order(self):
+        """Test the first present identifier in prefer is returned."""
+        device = Device(
+            phoneNumber=PhoneNumber(value="+1234567890"),
+            ipv6Address=DeviceIpv6Address(value="2001:db8::1"),
+        )
+        response = DeviceResponse.from_device(
+            device, prefer=("ipv4Address", "ipv6Address", "phoneNumber")
+        )
+        assert response.ipv6Address == device.ipv6Address
+        assert response.phoneNumber is None
+        assert DeviceResponse.from_device(device, prefer="ipv6Address") == response
+
+    def test_missing_preferred_identifier(self):
+        """Test a device without any preferred identifier is rejected."""
+        device = Device(phoneNumber=PhoneNumber(value="+1234567890"))
+        with pytest.raises(ValueError, match="none of the identifiers"):
+            DeviceResponse.from_device(device, prefer=["ipv4Address"])
+
+    def test_invalid_prefer(self):
+        """Test unknown or empty priority lists are rejected."""
+        device = _full_device()
+        with pytest.raises(ValueError, match="Unknown device identifier"):
+            DeviceResponse.from_device(device, prefer=["imei"])
+        with pytest.raises(ValueError, match="At least one"):
+            DeviceResponse.from_device(device, prefer=[])
+
+    def test_from_devices(self):
+        """Test the batch variant matches from_device per device."""
+        devices = [
+            _full_device(),
+            Device(ipv6Address=DeviceIpv6Address(value="2001:db8::2")),
+            Device(networkAccessIdentifier=NetworkAccessIdentifier(value="a@b.org")),
+        ]
+        prefer = ("networkAccessIdentifier", "ipv6Address")
+        responses = DeviceResponse.from_devices(devices, prefer=prefer)
+        assert responses == [
+            DeviceResponse.from_device(device, prefer=prefer) for device in devices
+        ]
+        assert [response.model_dump(exclude_none=True) for response in responses] == [
+            {"networkAccessIdentifier": {"value": "user@example.com"}},
+            {"ipv6Address": {"value": "2001:db8::2"}},
+            {"networkAccessIdentifier": {"value": "a@b.org"}},
+        ]
+
+    def test_from_devices_reports_position(self):
+        """Test the batch variant names the failing device."""
+        devices = [_full_device(), Device(phoneNumber=PhoneNumber(value="+123456789"))]
+        with pytest.raises(ValueError, match="Device 1 has none"):
+            DeviceResponse.from_devices(devices, prefer=["ipv6Address"])
+
+
+class TestDeviceFingerprint:
+    """Test the canonical Device fingerprint."""
+
+    def test_stable_across_notation_and_order(self):
+        """Test equal identifiers give equal fingerprints."""
+        first = Device.model_validate(
+            {
+                "ipv6Address": {"value": "2001:db8::1"},
+                "networkAccessIdentifier": {"value": "user@Example.COM"},
+                "phoneNumber": {"value": "+123456789"},
+            }
+        )
+        second = Device.model_validate(
+            {
+                "phoneNumber": {"value": "+123456789"},
+                "networkAccessIdentifier": {"value": "user@example.com"},
+                "ipv6Address": {"value": "2001:0db8:0000:0000:0000:0000:0000:0001"},
+            }
+        )
+        assert first.model_dump_json() != second.model_dump_json()
+        assert first.fingerprint() == second.fingerprint()
+        assert len(first.fingerprint()) == 16
+
+    def test_distinguishes_identifiers(self):
+        """Test different identifiers give different fingerprints."""
+        devices = [
+            Device(phoneNumber=PhoneNumber(value="+123456789")),
+            Device(phoneNumber=PhoneNumber(value="+123456788")),
+            Device(networkAccessIdentifier=NetworkAccessIdentifier(value="User@x.com")),
+            Device(networkAccessIdentifier=NetworkAccessIdentifier(value="user@x.com")),
+            Device(
+                ipv4Address=DeviceIpv4Addr(
+                    publicAddress=SingleIpv4Addr(value="84.125.93.10"),
+                    publicPort=Port(value=1),
+                )
+            ),
+            Device(
+                ipv4Address=DeviceIpv4Addr(
+                    publicAddress=SingleIpv4Addr(value="84.125.93.10"),
+                    privateAddress=SingleIpv4Addr(value="10.0.0.1"),
+                )
+            ),
+            Device(ipv6Address=DeviceIpv6Address(value="::1")),
+        ]
+        assert len({device.fingerprint() for device in devices}) == len(devices)
+
+    def test_device_response_matches_device(self):
+        """Test the fingerprint depends only on identifiers."""
+        phone = PhoneNumber(value="+123456789")
+        assert (
+            DeviceResponse(phoneNumber=phone).fingerprint()
+            == Device(phoneNumber=phone).fingerprint()
+        )
+
+    def test_memoized_and_invalidated(self):
+        """Test the digest is reused until an identifier changes."""
+        device = Device(
+            ipv4Address=DeviceIpv4Addr(
+                publicAddress=SingleIpv4Addr(value="84.125.93.10"),
+                publicPort=Port(value=59765),
+            )
+        )
+        fingerprint = device.fingerprint()
+        assert device.fingerprint() is fingerprint
+        device.ipv4Address.publicPort.value = 59766
+        changed = device.fingerprint()
+        assert changed != fingerprint
+        device.ipv4Address.publicPort = Port(value=59765)
+        assert device.fingerprint() == fingerprint
+
+    def test_cached_fingerprint_does_not_affect_equality(self):
+        """Test memoizing the fingerprint keeps equal devices equal."""
+        first = Device(phoneNumber=PhoneNumber(value="+123456789"))
+        second = Device(phoneNumber=PhoneNumber(value="+123456789"))
+        first.fingerprint()
+        assert first == second and second == first
+        assert first != Device(phoneNumber=PhoneNumber(value="+987654321"))
+        assert first != DeviceResponse(phoneNumber=PhoneNumber(value="+123456789"))
@@ -0,0 +1,162 @@
+"""
+Tests for the multi-key DeviceRegistry.
+"""
+
+import pytest
+
+from CamaraCommon.Communication import NetworkAccessIdentifier, PhoneNumber
+from CamaraCommon.Device import Device, DeviceRegistry, DeviceResponse
+from CamaraCommon.Network import DeviceIpv6Address
+from tests.helpers import make_ipv4
+
+
+@pytest.fixture
+def registry():
+    registry = DeviceRegistry()
+    registry.register(
+        Device(
+            phoneNumber=PhoneNumber(value="+123456789"),
+            networkAccessIdentifier=NetworkAccessIdentifier(value="alice@op.example"),
+            ipv4Address=make_ipv4("84.125.93.10", private="10.0.0.1", port=59765),
+            ipv6Address=DeviceIpv6Address(value="2001:db8:1:2::1"),
+        ),
+        "alice",
+    )
+    registry.register(Device(phoneNumber=PhoneNumber(value="+987654321")), "bob")
+    return registry
+
+
+class TestDeviceRegistry:
+    """Test DeviceRegistry resolution and updates."""
+
+    def test_resolve_each_identifier(self, registry):
+        """Test every identifier type resolves on its own."""
+        devices = [
+            Device(phoneNumber=PhoneNumber(value="+123456789")),
+            Device(
+                networkAccessIdentifier=NetworkAccessIdentifier(
+                    value="alice@op.example"
+                )
+            ),
+            Device(ipv4Address=make_ipv4("84.125.93.10", port=59765)),
+            Device(ipv4Address=make_ipv4("84.125.93.10", private="10.0.0.1")),
+            Device(ipv6Address=DeviceIpv6Address(value="2001:db8:1:2::1")),
+        ]
+        for device in devices:
+            resolution = registry.resolve(device)
+            assert resolution.value == "alice"
+            assert not resolution.conflict
+        assert len(registry) == 6
+
+    def test_ipv6_matches_whole_prefix(self, registry):
+        """Test any address in the /64 resolves."""
+        device = Device(ipv6Address=DeviceIpv6Address(value="2001:db8:1:2:abcd::9"))
+        assert registry.resolve(device).value == "alice"
+        other = Device(ipv6Address=DeviceIpv6Address(value="2001:db8:1:3::1"))
+        assert registry.resolve(other).value is None
+
+    def test_nai_domain_is_case_insensitive(self, registry):
+        """Test the NAI domain matches in any case, the local part does not."""
+        upper = NetworkAccessIdentifier(value="alice@OP.Example")
+        assert registry.resolve(Device(networkAccessIdentifier=upper)).value == "alice"
+        other = NetworkAccessIdentifier(value="Alice@op.example")
+        assert registry.resolve(Device(networkAccessIdentifier=other)).value is None
+
+    def test_conflicting_identifiers(self, registry):
+        """Test identifiers of different entries are reported."""
+        device = Device(
+            phoneNumber=PhoneNumber(value="+987654321"),
+            ipv4Address=make_ipv4("84.125.93.10", port=59765),
+        )
+        resolution = registry.resolve(device)
+        assert resolution.conflict
+        assert resolution.value is None
+        assert resolution.matches == {
+            "phoneNumber": "bob",
+            "ipv4Address.publicPort": "alice",
+        }
+
+    def test_partial_match(self, registry):
+        """Test unknown identifiers do not count as conflicts."""
+        device = DeviceResponse(phoneNumber=PhoneNumber(value="+123456789"))
+        assert registry.resolve(device).value == "alice"
+        device = Device(
+            phoneNumber=PhoneNumber(value="+123456789"),
+            ipv4Address=make_ipv4("1.1.1.1", port=1),
+        )
+        resolution = registry.resolve(device)
+        assert resolution.value == "alice"
+        assert list(resolution.matches) == ["phoneNumber"]
+
+    def test_unknown_device(self, registry):
+        """Test a device with no registered identifiers."""
+        resolution = registry.resolve(
+            Device(phoneNumber=PhoneNumber(value="+15550000"))
+        )
+        assert resolution.value is None
+        assert resolution.matches == {}
+        assert not resolution.conflict
+
+    def test_register_conflict_and_replace(self, registry):
+        """Test re-registering an identifier to another value."""
+        bob_ipv4 = Device(
+            phoneNumber=PhoneNumber(value="+987654321"),
+            ipv4Address=make_ipv4("84.125.93.10", port=59765),
+        )
+        with pytest.raises(ValueError):
+            registry.register(bob_ipv4, "bob")
+        # Nothing was applied by the failed call
+        assert (
+            registry.resolve(
+                Device(ipv4Address=make_ipv4("84.125.93.10", port=59765))
+            ).value
+            == "alice"
+        )
+        registry.register(bob_ipv4, "bob", replace=True)
+        assert registry.resolve(bob_ipv4).value == "bob"
+
+    def test_incremental_updates(self, registry):
+        """Test adding and removing identifiers."""
+        registry.register(Device(ipv6Address=DeviceIpv6Address(value="fe80::1")), "bob")
+        assert (
+            registry.resolve(
+                Device(ipv6Address=DeviceIpv6Address(value="fe80::2"))
+            ).value
+            == "bob"
+        )
+        removed = registry.unregister(
+            Device(
+                phoneNumber=PhoneNumber(value="+123456789"),
+                networkAccessIdentifier=NetworkAccessIdentifier(value="nobody@x"),
+            ),
+            "alice",
+        )
+        assert removed == 1
+        assert (
+            registry.resolve(Device(phoneNumber=PhoneNumber(value="+123456789"))).value
+            is None
+        )
+
+    def test_unregister_conflict_keeps_other_entries(self, registry):
+        """Test unregistering only removes identifiers owned by the value."""
+        device = Device(
+            phoneNumber=PhoneNumber(value="+987654321"),
+            ipv4Address=make_ipv4("84.125.93.10", port=59765),
+        )
+        assert registry.unregister(device, "bob") == 1
+        assert registry.resolve(device).matches == {"ipv4Address.publicPort": "alice"}
+        assert (
+            registry.resolve(Device(phoneNumber=PhoneNumber(value="+123456789"))).value
+            == "alice"
+        )
+        assert registry.unregister(device, "bob") == 0
+        assert len(registry) == 5
+
+    def test_invalid_arguments(self):
+        """Test None values and bad prefix lengths are rejected."""
+        with pytest.raises(ValueError):
+            DeviceRegistry().register(
+                Device(phoneNumber=PhoneNumber(value="+123456")), None
+            )
+        with pytest.raises(ValueError):
+            DeviceRegistry(ipv6_prefix_len=200)
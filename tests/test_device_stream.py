@@ -0,0 +1,173 @@
+"""
+Tests for the streaming NDJSON and JSON-array Device decoders.
+"""
+
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from CamaraCommon.Device import Device
+from CamaraCommon.Device.DeviceStream import (iter_devices_json_array,
+                                              iter_devices_ndjson)
+
+FULL = {
+    "phoneNumber": {"value": "+123456789"},
+    "networkAccessIdentifier": {"value": "123456789@example.com"},
+    "ipv4Address": {
+        "publicAddress": {"value": "84.125.93.10"},
+        "privateAddress": {"value": "10.0.0.1"},
+        "publicPort": {"value": 59765},
+    },
+    "ipv6Address": {"value": "2001:db8:85a3:8d3:1319:8a2e:370:7344"},
+}
+
+LINES = [
+    json.dumps(FULL),
+    '{"phoneNumber": {"value": "+4915112345678"}}',
+    '{"ipv4Address": {"publicAddress": {"value": "84.125.93.10"}, "publicPort": {"value": 0}}}',
+    '{"ipv6Address": {"value": "::1"}, "phoneNumber": null}',
+    # Valid, but outside the fast path: lax types and extra keys.
+    '{"ipv4Address": {"publicAddress": {"value": "1.2.3.4"}, "publicPort": {"value": "80"}}}',
+    '{"phoneNumber": {"value": "+123456789"}, "imei": "ignored"}',
+    # Invalid.
+    '{"phoneNumber": {"value": "123456789"}}',
+    '{"ipv4Address": {"publicAddress": {"value": "84.125.93.10"}}}',
+    '{"ipv4Address": {"publicAddress": {"value": "1.2.3.4"}, "publicPort": {"value": 70000}}}',
+    '{"ipv6Address": {"value": "2001:db8::g"}}',
+    '{"phoneNumber": null}',
+    "{}",
+    "[]",
+    '{"phoneNumber": {"value": "+123456789"',
+]
+
+
+def _expected(line):
+    try:
+        return Device.model_validate_json(line), None
+    except ValidationError as exc:
+        return None, exc.errors()
+
+
+def _assert_matches(record, line):
+    device, errors = _expected(line)
+    if device is None:
+        assert record.device is None and not record.valid
+        assert [(e["type"], e["loc"]) for e in record.errors] == [
+            (e["type"], e["loc"]) for e in errors
+        ]
+    else:
+        assert record.valid and record.errors == []
+        assert record.device == device
+        assert record.device.model_dump_json() == device.model_dump_json()
+        assert record.device.model_fields_set == device.model_fields_set
+        assert record.device.fingerprint() == device.fingerprint()
+
+
+class TestNdjson:
+    """Test newline-delimited decoding."""
+
+    def test_matches_model_validate_json(self):
+        """Test every line decodes as Device.model_validate_json would."""
+        data = "\n".join(LINES).encode()
+        records = list(iter_devices_ndjson(data, chunk_size=7, batch_size=3))
+        assert [record.line for record in records] == list(range(1, len(LINES) + 1))
+        for record, line in zip(records, LINES):
+            _assert_matches(record, line)
+
+    def test_blank_lines_and_crlf(self):
+        """Test blank lines are skipped but still counted."""
+        data = b'\r\n{"phoneNumber": {"value": "+123456789"}}\r\n\n  \n{"x": 1}'
+        records = list(iter_devices_ndjson(data))
+        assert [record.line for record in records] == [2, 5]
+        assert records[0].device.phoneNumber.value == "+123456789"
+        assert not records[1].valid
+
+    def test_sources(self):
+        """Test files and chunk iterables give the same records."""
+        data = "\n".join(LINES[:6]).encode() + b"\n"
+        expected = list(iter_devices_ndjson(data))
+        from_file = list(iter_devices_ndjson(io.BytesIO(data), chunk_size=16))
+        from_chunks = list(iter_devices_ndjson([data[:50], data[50:51], data[51:]]))
+        assert from_file == expected
+        assert from_chunks == expected
+
+    def test_json_error(self):
+        """Test a malformed line reports json_invalid and decoding continues."""
+        data = b'{"phoneNumber": \n{"phoneNumber": {"value": "+123456789"}}'
+        bad, good = iter_devices_ndjson(data)
+        assert bad.errors[0]["type"] == "json_invalid"
+        assert bad.errors[0]["loc"] == ()
+        assert good.valid
+
+    def test_cached_integers(self):
+        """Test fast-path models carry their integer forms."""
+        (record,) = iter_devices_ndjson(json.dumps(FULL).encode())
+        device = record.device
+        assert int(device.phoneNumber) == 123456789
+        assert int(device.ipv4Address.publicAddress) == 0x547D5D0A
+        assert int(device.ipv6Address) == int(Device.model_validate(FULL).ipv6Address)
+
+
+class TestJsonArray:
+    """Test JSON-array decoding."""
+
+    def test_matches_model_validate_json(self):
+        """Test array elements decode as Device.model_validate_json would."""
+        valid = [line for line in LINES if _expected(line)[0] is not None]
+        data = ("[" + ",\n".join(valid) + "]").encode()
+        records = list(iter_devices_json_array(data, chunk_size=16, batch_size=2))
+        assert [record.line for record in records] == list(range(1, len(valid) + 1))
+        for record, line in zip(records, valid):
+            _assert_matches(record, line)
+
+    def test_invalid_elements(self):
+        """Test invalid elements are reported without stopping."""
+        data = json.dumps([FULL, {"phoneNumber": None}, 5, FULL], indent=2).encode()
+        records = list(iter_devices_json_array(io.BytesIO(data), chunk_size=32))
+        assert [record.valid for record in records] == [True, False, False, True]
+        assert records[2].errors[0]["type"] == "model_type"
+        assert records[1].line == data[: data.index(b"null")].count(b"\n")
+
+    def test_multibyte_characters(self):
+        """Test UTF-8 sequences split across chunks."""
+        nai = {"networkAccessIdentifier": {"value": "usér@example.com"}}
+        data = json.dumps([nai, nai], ensure_ascii=False).encode()
+        records = list(iter_devices_json_array(data, chunk_size=1))
+        assert [r.device.networkAccessIdentifier.value for r in records] == [
+            "usér@example.com"
+        ] * 2
+
+    def test_empty_array(self):
+        """Test an empty array yields nothing."""
+        assert list(iter_devices_json_array(b" [ ] \n")) == []
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b'{"phoneNumber": {"value": "+123456789"}}',
+            b'[{"phoneNumber": {"value": "+123456789"}}',
+            b'[{"phoneNumber": {"value": "+123456789"}} {}]',
+            b'[{"phoneNumber": {"value": "+123456789"}}] x',
+        ],
+    )
+    def test_syntax_errors_stop(self, data):
+        """Test structural errors end the stream with a json_invalid record."""
+        records = list(iter_devices_json_array(data, chunk_size=8))
+        assert records[-1].errors[0]["type"] == "json_invalid"
+        assert all(record.valid for record in records[:-1])
+
+    def test_malformed_element(self):
+        """Test a syntax error inside an element is reported without waiting."""
+        chunks = iter([b'[{"phoneNumber": {"value" 1}}, ', b"{"])
+        records = list(iter_devices_json_array(chunks))
+        assert len(records) == 1
+        assert records[0].errors[0]["msg"] == "Invalid JSON: Expecting ':' delimiter"
+
+    def test_element_larger_than_chunk(self):
+        """Test elements spanning many chunks decode."""
+        data = json.dumps([FULL] * 3).encode()
+        records = list(iter_devices_json_array(data, chunk_size=3))
+        assert [record.valid for record in records] == [True] * 3
@@ -0,0 +1,107 @@
+"""
+Tests for geographic distance calculations.
+"""
+
+import pytest
+
+from CamaraCommon.Geography import (DistanceMethod, Point, PointBatch,
+                                    distance, distance_matrix, distances_from,
+                                    haversine_distance, iter_distance_matrix,
+                                    vincenty_distance)
+from tests.helpers import make_point
+
+
+class TestDistance:
+    """Test single-pair distance functions."""
+
+    def test_haversine_one_degree_at_equator(self):
+        """Test one degree of longitude at the equator."""
+        assert haversine_distance(0.0, 0.0, 0.0, 1.0) == pytest.approx(
+            111195.08, abs=0.01
+        )
+
+    def test_vincenty_reference_geodesic(self):
+        """Test Vincenty against the Flinders Peak to Buninyong reference."""
+        result = vincenty_distance(
+            -37.95103342, 144.42486789, -37.65282114, 143.92649554
+        )
+        assert result == pytest.approx(54972.271, abs=0.001)
+
+    def test_vincenty_identical_points(self):
+        """Test Vincenty distance between identical points is zero."""
+        assert vincenty_distance(10.0, 20.0, 10.0, 20.0) == 0.0
+
+    def test_vincenty_antipodal_falls_back(self):
+        """Test nearly antipodal points fall back to haversine."""
+        result = vincenty_distance(0.0, 0.0, 0.5, 179.7)
+        assert result == pytest.approx(haversine_distance(0.0, 0.0, 0.5, 179.7))
+
+    def test_distance_between_points(self):
+        """Test distance between Point models with both methods."""
+        bonn = make_point(50.735851, 7.10066)
+        cologne = make_point(50.937531, 6.960279)
+
+        spherical = distance(bonn, cologne)
+        ellipsoidal = distance(bonn, cologne, DistanceMethod.VINCENTY)
+
+        assert spherical == pytest.approx(24600, rel=0.01)
+        assert ellipsoidal == pytest.approx(spherical, rel=0.005)
+
+
+class TestDistanceBatches:
+    """Test one-to-many and matrix distance functions."""
+
+    def test_distances_from_input_shapes(self):
+        """Test one-to-many distances accept points, batches and columns."""
+        origin = make_point(0.0, 0.0)
+        targets = [make_point(0.0, 1.0), make_point(1.0, 0.0), make_point(0.0, 0.0)]
+        expected = [
+            haversine_distance(0.0, 0.0, 0.0, 1.0),
+            haversine_distance(0.0, 0.0, 1.0, 0.0),
+            0.0,
+        ]
+
+        assert distances_from(origin, targets) == pytest.approx(expected)
+        assert distances_from(origin, PointBatch.from_points(targets)) == (
+            pytest.approx(expected)
+        )
+        assert distances_from(origin, ([0.0, 1.0, 0.0], [1.0, 0.0, 0.0])) == (
+            pytest.approx(expected)
+        )
+        assert distances_from(origin, targets[0]) == pytest.approx(expected[:1])
+
+    def test_distance_matrix(self):
+        """Test the matrix matches pairwise distances."""
+        sources = [
+            make_point(0.0, 0.0),
+            make_point(10.0, 10.0),
+            make_point(-20.0, 45.0),
+        ]
+        targets = PointBatch([1.0, 2.0], [1.0, -2.0])
+
+        for method in DistanceMethod:
+            matrix = distance_matrix(sources, targets, method)
+            assert len(matrix) == 3
+            for row, source in zip(matrix, sources):
+                assert row == pytest.approx(distances_from(source, targets, method))
+
+    def test_matrix_chunks(self):
+        """Test matrix rows are produced in bounded chunks."""
+        sources = PointBatch([float(i) for i in range(10)], [0.0] * 10)
+        targets = [make_point(0.0, 0.0)]
+
+        blocks = list(iter_distance_matrix(sources, targets, chunk_size=4))
+
+        assert [len(block) for block in blocks] == [4, 4, 2]
+        assert [row for block in blocks for row in block] == distance_matrix(
+            sources, targets
+        )
+
+    def test_invalid_chunk_size(self):
+        """Test a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(
+                iter_distance_matrix(
+                    [make_point(0.0, 0.0)], [make_point(0.0, 0.0)], chunk_size=0
+                )
+            )
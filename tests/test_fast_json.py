@@ -0,0 +1,73 @@
+"""
+Tests for the fast geography JSON encoders and decoder.
+"""
+
+import pytest
+
+from CamaraCommon.Geography import (Circle, FastJson, PointBatch, PointList,
+                                    Polygon)
+from tests.helpers import make_point
+
+# Mixes plain and exponent floats: pydantic-core writes 1e-05 as 0.00001
+TRICKY = [
+    (50.735851, 7.10066),
+    (1e-05, -1.5e-07),
+    (-0.0, 180.0),
+    (0.1 + 0.2, -179.99999999999997),
+    (-90.0, 3e-05),
+]
+
+
+class TestFastJsonDump:
+    """Test the fast serializers produce byte-identical JSON."""
+
+    def test_point(self):
+        """Test Point serialization."""
+        for lat, lon in TRICKY:
+            point = make_point(lat, lon)
+            assert FastJson.dump_point_json(point) == point.model_dump_json()
+
+    def test_circle(self):
+        """Test Circle serialization, including large radii."""
+        for radius in [1.0, 1000.0, 1e16, 123456.789]:
+            circle = Circle(center=make_point(1e-05, 7.10066), radius=radius)
+            assert FastJson.dump_circle_json(circle) == circle.model_dump_json()
+
+
+class TestFastJsonLoad:
+    """Test decoding points into a PointBatch."""
+
+    def test_load_shapes(self):
+        """Test every supported JSON shape decodes to the same batch."""
+        points = [make_point(lat, lon) for lat, lon in TRICKY]
+        point_list = PointList(points=points)
+        expected = PointBatch.from_points(points)
+
+        assert FastJson.load_points_json(point_list.model_dump_json()) == expected
+        assert (
+            FastJson.load_points_json(Polygon(boundary=point_list).model_dump_json())
+            == expected
+        )
+        assert (
+            FastJson.load_points_json(
+                "[" + ",".join(p.model_dump_json() for p in points) + "]"
+            )
+            == expected
+        )
+        assert FastJson.load_points_json(points[0].model_dump_json().encode()) == (
+            PointBatch.from_points(points[:1])
+        )
+
+    def test_load_validates_ranges(self):
+        """Test out-of-range coordinates are rejected."""
+        with pytest.raises(ValueError, match="latitude at index 0"):
+            FastJson.load_points_json(
+                '[{"latitude":{"value":91.0},"longitude":{"value":0.0}}]'
+            )
+
+    def test_load_malformed(self):
+        """Test malformed structures are rejected."""
+        with pytest.raises(ValueError, match="Malformed point"):
+            FastJson.load_points_json('[{"latitude":{"value":1.0}}]')
+        with pytest.raises(ValueError, match="Expected a Point"):
+            FastJson.load_points_json("42")
@@ -0,0 +1,159 @@
+"""
+Tests for the streaming geofence event engine.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from CamaraCommon.Basic import TimePeriod
+from CamaraCommon.Geography import (Circle, GeofenceEngine, GeofenceEventType,
+                                    PointList, Polygon)
+from tests.helpers import make_point
+
+START = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _at(minutes: int) -> datetime:
+    return START + timedelta(minutes=minutes)
+
+
+def _engine(dwell_time=None) -> GeofenceEngine:
+    engine: GeofenceEngine = GeofenceEngine(dwell_time=dwell_time)
+    engine.register(
+        "square",
+        Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(0.0, 0.0),
+                    make_point(0.0, 1.0),
+                    make_point(1.0, 1.0),
+                    make_point(1.0, 0.0),
+                ]
+            )
+        ),
+    )
+    engine.register("circle", Circle(center=make_point(0.9, 0.9), radius=40000.0))
+    return engine
+
+
+class TestGeofenceEngine:
+    """Test geofence state transitions."""
+
+    def test_enter_and_exit(self):
+        """Test ENTER and EXIT events with their periods."""
+        engine = _engine()
+        events = engine.process_batch(
+            [
+                ("dev-1", make_point(5.0, 5.0), _at(0)),
+                ("dev-1", make_point(0.5, 0.5), _at(1)),
+                ("dev-1", make_point(0.6, 0.6), _at(2)),
+                ("dev-1", make_point(5.0, 5.0), _at(3)),
+            ]
+        )
+
+        assert [(e.eventType, e.areaId) for e in events] == [
+            (GeofenceEventType.ENTER, "square"),
+            (GeofenceEventType.EXIT, "square"),
+        ]
+        assert events[0].period == TimePeriod(startDate=_at(1))
+        assert events[1].period == TimePeriod(startDate=_at(1), endDate=_at(3))
+        assert engine.memberships("dev-1") == []
+
+    def test_overlapping_areas(self):
+        """Test moving between overlapping areas emits only transitions."""
+        engine = _engine()
+        events = engine.process_batch(
+            [
+                ("dev-1", make_point(0.5, 0.5), _at(0)),
+                ("dev-1", make_point(0.95, 0.95), _at(1)),
+                ("dev-1", make_point(1.1, 1.1), _at(2)),
+            ]
+        )
+
+        assert [(e.eventType, e.areaId) for e in events] == [
+            (GeofenceEventType.ENTER, "square"),
+            (GeofenceEventType.ENTER, "circle"),
+            (GeofenceEventType.EXIT, "square"),
+        ]
+        assert engine.memberships("dev-1") == ["circle"]
+
+    def test_dwell_emitted_once(self):
+        """Test DWELL fires once after the dwell time."""
+        engine = _engine(dwell_time=timedelta(minutes=5))
+        events = engine.process_batch(
+            [
+                ("dev-1", make_point(0.5, 0.5), _at(0)),
+                ("dev-1", make_point(0.5, 0.5), _at(4)),
+                ("dev-1", make_point(0.5, 0.5), _at(5)),
+                ("dev-1", make_point(0.5, 0.5), _at(9)),
+            ]
+        )
+
+        assert [e.eventType for e in events] == [
+            GeofenceEventType.ENTER,
+            GeofenceEventType.DWELL,
+        ]
+        assert events[1].period == TimePeriod(startDate=_at(0), endDate=_at(5))
+
+    def test_devices_are_independent(self):
+        """Test state is tracked per device."""
+        engine = _engine()
+        events = engine.process_batch(
+            [
+                ("dev-1", make_point(0.5, 0.5), _at(0)),
+                ("dev-2", make_point(5.0, 5.0), _at(0)),
+                ("dev-2", make_point(0.5, 0.5), _at(1)),
+            ]
+        )
+
+        assert [(e.deviceId, e.eventType) for e in events] == [
+            ("dev-1", GeofenceEventType.ENTER),
+            ("dev-2", GeofenceEventType.ENTER),
+        ]
+
+    def test_process_iterator_in_batches(self):
+        """Test the iterator API yields the same events across batches."""
+        reports = [
+            ("dev-1", make_point(0.5, 0.5), _at(0)),
+            ("dev-1", make_point(5.0, 5.0), _at(1)),
+            ("dev-1", make_point(0.5, 0.5), _at(2)),
+        ]
+
+        events = list(_engine().process(iter(reports), batch_size=2))
+
+        assert [e.eventType for e in events] == [
+            GeofenceEventType.ENTER,
+            GeofenceEventType.EXIT,
+            GeofenceEventType.ENTER,
+        ]
+
+    def test_process_async(self):
+        """Test the async iterator API."""
+        reports = [
+            ("dev-1", make_point(0.5, 0.5), _at(0)),
+            ("dev-1", make_point(5.0, 5.0), _at(1)),
+        ]
+
+        async def source():
+            for report in reports:
+                yield report
+
+        async def collect():
+            return [event async for event in _engine().process_async(source())]
+
+        events = asyncio.run(collect())
+
+        assert [e.eventType for e in events] == [
+            GeofenceEventType.ENTER,
+            GeofenceEventType.EXIT,
+        ]
+
+    def test_unregister_drops_state(self):
+        """Test unregistering an area forgets memberships without events."""
+        engine = _engine()
+        engine.process_batch([("dev-1", make_point(0.5, 0.5), _at(0))])
+
+        engine.unregister("square")
+
+        assert engine.memberships("dev-1") == []
+        assert engine.process_batch([("dev-1", make_point(5.0, 5.0), _at(1))]) == []
@@ -6,6 +6,7 @@ import pytest
 
 from CamaraCommon.Geography import (Area, AreaType, Circle, Latitude,
                                     Longitude, Point, PointList, Polygon)
+from tests.helpers import make_point, make_square
 
 
 class TestGeographyTypes:
@@ -176,3 +177,268 @@ class TestAreaTypes:
         assert polygon.areaType == AreaType.POLYGON
         assert len(polygon.boundary) == 3
         assert polygon.boundary.points[0].latitude.value == 50.735851
+
+
+
+class TestAreaContainment:
+    """Test point-in-area containment."""
+
+    def test_circle_contains_point(self):
+        """Test scalar Circle containment using haversine distance."""
+        circle = Circle(center=make_point(50.735851, 7.10066), radius=1000.0)
+
+        assert circle.contains(make_point(50.735851, 7.10066))
+        # ~556 m north of the center
+        assert circle.contains(make_point(50.740851, 7.10066))
+        # ~1.1 km north of the center
+        assert not circle.contains(make_point(50.745851, 7.10066))
+
+    def test_circle_contains_batch(self):
+        """Test batched Circle containment matches the scalar API."""
+        circle = Circle(center=make_point(0.0, 0.0), radius=100000.0)
+        latitudes = [0.0, 0.5, 0.0, 1.0, -0.8, 45.0]
+        longitudes = [0.0, 0.5, -0.8, 0.0, 0.0, 0.0]
+
+        mask = circle.contains_batch(latitudes, longitudes)
+
+        assert mask == [True, True, True, False, True, False]
+        for lat, lon, expected in zip(latitudes, longitudes, mask):
+            assert circle.contains_coordinates(lat, lon) == expected
+
+    def test_circle_across_antimeridian(self):
+        """Test Circle containment wraps around the antimeridian."""
+        circle = Circle(center=make_point(0.0, 179.9), radius=50000.0)
+
+        assert circle.contains_coordinates(0.0, -179.9)
+        assert not circle.contains_coordinates(0.0, 179.0)
+
+    def test_polygon_contains_point(self):
+        """Test scalar Polygon containment."""
+        polygon = Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(0.0, 0.0),
+                    make_point(0.0, 10.0),
+                    make_point(10.0, 10.0),
+                    make_point(10.0, 0.0),
+                ]
+            )
+        )
+
+        assert polygon.contains(make_point(5.0, 5.0))
+        assert not polygon.contains(make_point(15.0, 5.0))
+        assert not polygon.contains(make_point(5.0, -1.0))
+
+    def test_polygon_contains_batch_concave(self):
+        """Test batched containment against a concave polygon."""
+        # U-shape opening to the north
+        polygon = Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(0.0, 0.0),
+                    make_point(0.0, 3.0),
+                    make_point(3.0, 3.0),
+                    make_point(3.0, 2.0),
+                    make_point(1.0, 2.0),
+                    make_point(1.0, 1.0),
+                    make_point(3.0, 1.0),
+                    make_point(3.0, 0.0),
+                ]
+            )
+        )
+
+        mask = polygon.contains_batch([0.5, 2.0, 2.0, 2.0], [1.5, 1.5, 0.5, 2.5])
+
+        assert mask == [True, False, True, True]
+
+    def test_contains_batch_length_mismatch(self):
+        """Test that mismatched coordinate columns are rejected."""
+        circle = Circle(center=make_point(0.0, 0.0), radius=1000.0)
+
+        with pytest.raises(ValueError, match="same length"):
+            circle.contains_batch([0.0, 1.0], [0.0])
+
+    def test_base_area_is_abstract(self):
+        """Test that the bare Area base cannot be instantiated."""
+        with pytest.raises(TypeError, match="abstract"):
+            Area(areaType=AreaType.CIRCLE)
+
+
+class TestPolygonGeometry:
+    """Test the cached Polygon geometry view."""
+
+    def test_geometry_values(self):
+        """Test bounding box, area and centroid of the geometry."""
+        geometry = make_square(0.0, 0.0, 1.0).geometry
+
+        assert tuple(geometry.bbox) == (0.0, 0.0, 1.0, 1.0)
+        assert list(geometry.latitudes) == [0.0, 0.0, 1.0, 1.0]
+        # ~111.2 km per degree at the equator
+        assert geometry.area == pytest.approx(1.2364e10, rel=1e-3)
+        assert geometry.centroid == pytest.approx((0.5, 0.5))
+
+    def test_signed_area_orientation(self):
+        """Test the signed area flips sign with ring orientation."""
+        polygon = make_square(0.0, 0.0, 1.0)
+        reversed_polygon = Polygon(
+            boundary=PointList(points=list(reversed(polygon.boundary.points)))
+        )
+
+        assert polygon.geometry.signed_area > 0
+        assert reversed_polygon.geometry.signed_area < 0
+        assert polygon.geometry.area == pytest.approx(reversed_polygon.geometry.area)
+
+    def test_geometry_is_cached(self):
+        """Test the geometry is computed once per instance."""
+        polygon = make_square(0.0, 0.0, 1.0)
+
+        assert polygon.geometry is polygon.geometry
+        polygon.contains(make_point(0.5, 0.5))
+        assert polygon.bounding_box() is polygon.geometry.bbox
+
+    def test_geometry_invalidated_on_reassignment(self):
+        """Test reassigning the boundary refreshes the geometry."""
+        polygon = make_square(0.0, 0.0, 1.0)
+        assert polygon.contains(make_point(0.5, 0.5))
+
+        polygon.boundary = PointList(
+            points=[make_point(5.0, 5.0), make_point(5.0, 6.0), make_point(6.0, 6.0)]
+        )
+        assert not polygon.contains(make_point(0.5, 0.5))
+        assert polygon.bounding_box().min_latitude == 5.0
+
+        polygon.boundary.points = [
+            make_point(0.0, 0.0),
+            make_point(0.0, 2.0),
+            make_point(2.0, 2.0),
+            make_point(2.0, 0.0),
+        ]
+        assert polygon.contains(make_point(1.5, 1.5))
+
+    def test_geometry_after_model_copy(self):
+        """Test model_copy with a new boundary does not reuse stale geometry."""
+        polygon = make_square(0.0, 0.0, 1.0)
+        _ = polygon.geometry
+        moved = polygon.model_copy(
+            update={
+                "boundary": PointList(
+                    points=[
+                        make_point(5.0, 5.0),
+                        make_point(5.0, 6.0),
+                        make_point(6.0, 6.0),
+                    ]
+                )
+            }
+        )
+
+        assert moved.bounding_box().min_latitude == 5.0
+        assert polygon.bounding_box().min_latitude == 0.0
+
+    def test_geometry_cache_does_not_affect_equality(self):
+        """Test a polygon with cached geometry equals an identical copy."""
+        polygon = make_square(0.0, 0.0, 1.0)
+        other = make_square(0.0, 0.0, 1.0)
+
+        polygon.contains(make_point(0.5, 0.5))
+        assert polygon == other
+        assert polygon != make_square(0.0, 0.0, 2.0)
+
+
+class TestSimplePolygonValidation:
+    """Test the optional simple-polygon validator."""
+
+    def _polygon(self, coordinates):
+        return Polygon(
+            boundary=PointList(
+                points=[make_point(lat, lon) for lat, lon in coordinates]
+            )
+        )
+
+    def test_simple_polygons_accepted(self):
+        """Test convex and concave simple polygons pass."""
+        square = self._polygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+        concave = self._polygon(
+            [(0, 0), (0, 3), (3, 3), (3, 2), (1, 2), (1, 1), (3, 1), (3, 0)]
+        )
+
+        assert square.validate_simple() is square
+        concave.validate_simple()
+
+    def test_self_intersecting_rejected(self):
+        """Test a bow-tie boundary is rejected."""
+        bow_tie = self._polygon([(0, 0), (1, 1), (0, 1), (1, 0)])
+
+        with pytest.raises(ValueError, match="intersects itself"):
+            bow_tie.validate_simple()
+
+    def test_touching_vertex_rejected(self):
+        """Test a boundary that revisits a vertex is rejected."""
+        figure_eight = self._polygon(
+            [(0, 0), (1, 1), (2, 0), (2, 2), (1, 1), (0, 2)]
+        )
+
+        with pytest.raises(ValueError, match="intersects itself"):
+            figure_eight.validate_simple()
+
+    def test_duplicate_consecutive_vertices_rejected(self):
+        """Test repeated consecutive vertices, including a closing vertex."""
+        repeated = self._polygon([(0, 0), (0, 1), (0, 1), (1, 0)])
+        closed = self._polygon([(0, 0), (0, 1), (1, 1), (0, 0)])
+
+        with pytest.raises(ValueError, match="duplicate consecutive"):
+            repeated.validate_simple()
+        with pytest.raises(ValueError, match="duplicate consecutive"):
+            closed.validate_simple()
+
+    def test_zero_area_rejected(self):
+        """Test collinear boundaries are rejected."""
+        line = self._polygon([(0, 0), (1, 1), (2, 2)])
+
+        with pytest.raises(ValueError, match="zero area"):
+            line.validate_simple()
+
+    def test_validation_context(self):
+        """Test simplicity is only enforced when requested via context."""
+        data = {
+            "boundary": {
+                "points": [
+                    {"latitude": {"value": lat}, "longitude": {"value": lon}}
+                    for lat, lon in [(0, 0), (1, 1), (0, 1), (1, 0)]
+                ]
+            }
+        }
+
+        assert Polygon.model_validate(data) is not None
+        with pytest.raises(ValueError, match="intersects itself"):
+            Polygon.model_validate(data, context={"simple_polygon": True})
+
+    def test_sweep_matches_pairwise_on_large_rings(self):
+        """Test the sweep line agrees with a pairwise check beyond 15 points."""
+        import math
+        import random
+
+        from CamaraCommon.Geography.PolygonGeometry import PolygonGeometry
+
+        rng = random.Random(7)
+        for trial in range(200):
+            count = rng.randint(3, 60)
+            angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(count))
+            points = []
+            for angle in angles:
+                radius = rng.uniform(0.5, 5.0)
+                points.append(
+                    make_point(
+                        10 + radius * math.sin(angle), 10 + radius * math.cos(angle)
+                    )
+                )
+            if trial % 2:
+                first, second = rng.randrange(count), rng.randrange(count)
+                points[first], points[second] = points[second], points[first]
+            geometry = PolygonGeometry(PointList.model_construct(points=points))
+
+            pairwise = any(
+                geometry._edges_conflict(i, j)
+                for i in range(count)
+                for j in range(i + 1, count)
+            )
+            assert (geometry.find_self_intersection() is not None) == pairwise
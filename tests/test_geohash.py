@@ -0,0 +1,153 @@
+"""
+Tests for geohash encoding and area cell covers.
+"""
+
+import random
+
+import pytest
+
+from CamaraCommon.Geography import (Circle, Geohash, PointBatch, PointList,
+                                    Polygon)
+from tests.helpers import make_point
+
+
+class TestGeohashEncoding:
+    """Test geohash encode and decode."""
+
+    def test_reference_values(self):
+        """Test encoding against well-known geohashes."""
+        assert Geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+        assert Geohash.encode(42.6, -5.6, 5) == "ezs42"
+        assert Geohash.encode_point(make_point(57.64911, 10.40744), 6) == "u4pruy"
+
+    def test_decode(self):
+        """Test decoding returns the cell and its centre."""
+        box = Geohash.decode_bbox("ezs42")
+        assert box.min_latitude == pytest.approx(42.5830078125)
+        assert box.max_longitude == pytest.approx(-5.5810546875)
+
+        lat, lon = Geohash.decode("u4pruydqqvj")
+        assert lat == pytest.approx(57.64911, abs=1e-5)
+        assert lon == pytest.approx(10.40744, abs=1e-5)
+
+    def test_round_trip_contains_coordinate(self):
+        """Test every encoded coordinate lies in its decoded cell."""
+        rng = random.Random(3)
+        for _ in range(500):
+            lat = rng.uniform(-90.0, 90.0)
+            lon = rng.uniform(-180.0, 180.0)
+            precision = rng.randint(1, Geohash.MAX_PRECISION)
+            box = Geohash.decode_bbox(Geohash.encode(lat, lon, precision))
+            assert box.contains_coordinates(lat, lon)
+
+    def test_extreme_coordinates(self):
+        """Test the corners of the coordinate range."""
+        assert Geohash.encode(90.0, 180.0, 4) == "zzzz"
+        assert Geohash.encode(-90.0, -180.0, 4) == "0000"
+
+    def test_encode_batch(self):
+        """Test batch encoding matches scalar encoding."""
+        batch = PointBatch([57.64911, 42.6, 0.0], [10.40744, -5.6, 0.0])
+        expected = [Geohash.encode(lat, lon, 7) for lat, lon in batch.coordinates()]
+
+        assert Geohash.encode_batch(batch, 7) == expected
+        assert Geohash.encode_batch((batch.latitudes, batch.longitudes), 7) == (
+            expected
+        )
+
+    def test_invalid_input(self):
+        """Test invalid precision and characters are rejected."""
+        with pytest.raises(ValueError, match="precision"):
+            Geohash.encode(0.0, 0.0, 0)
+        with pytest.raises(ValueError, match="Invalid geohash"):
+            Geohash.decode("abc")
+
+
+class TestGeohashCover:
+    """Test cell covers for areas."""
+
+    def _assert_covers_samples(self, area, cells, precision):
+        rng = random.Random(5)
+        box = area.bounding_box()
+        checked = 0
+        while checked < 300:
+            lat = rng.uniform(box.min_latitude, box.max_latitude)
+            lon = rng.uniform(box.min_longitude, box.max_longitude)
+            if area.contains_coordinates(lat, lon):
+                assert Geohash.covers(cells, Geohash.encode(lat, lon, precision))
+                checked += 1
+
+    def test_circle_cover(self):
+        """Test a circle cover contains every inside point and prunes corners."""
+        circle = Circle(center=make_point(50.735851, 7.10066), radius=5000.0)
+        cells = Geohash.cover(circle, precision=6, compact=False)
+
+        self._assert_covers_samples(circle, cells, 6)
+        assert all(len(cell) == 6 for cell in cells)
+        box = circle.bounding_box()
+        assert not Geohash.covers(
+            cells, Geohash.encode(box.max_latitude, box.max_longitude, 6)
+        )
+
+    def test_polygon_cover(self):
+        """Test a triangle cover contains every inside point."""
+        triangle = Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(0.0, 0.0),
+                    make_point(0.0, 1.0),
+                    make_point(1.0, 0.0),
+                ]
+            )
+        )
+        cells = Geohash.cover(triangle, precision=4)
+
+        self._assert_covers_samples(triangle, cells, 4)
+        assert not Geohash.covers(cells, Geohash.encode(0.95, 0.95, 4))
+
+    def test_compact_cover(self):
+        """Test complete sibling groups are merged into their parent."""
+        square = Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(-10.0, -10.0),
+                    make_point(-10.0, 20.0),
+                    make_point(20.0, 20.0),
+                    make_point(20.0, -10.0),
+                ]
+            )
+        )
+        full = Geohash.cover(square, precision=3, compact=False)
+        compacted = Geohash.cover(square, precision=3)
+
+        assert len(compacted) < len(full)
+        assert any(len(cell) < 3 for cell in compacted)
+        for cell in full:
+            assert Geohash.covers(compacted, cell)
+
+    @pytest.mark.parametrize("longitude", [-179.999, 179.999])
+    @pytest.mark.parametrize("precision", [5, 6])
+    def test_circle_across_antimeridian(self, longitude, precision):
+        """Test cells on both sides of the antimeridian are covered."""
+        circle = Circle(center=make_point(0.0, longitude), radius=2000.0)
+        cells = Geohash.cover(circle, precision=precision, compact=False)
+
+        rng = random.Random(5)
+        checked = 0
+        while checked < 300:
+            lat = rng.uniform(-0.02, 0.02)
+            lon = (longitude + rng.uniform(-0.02, 0.02) + 180.0) % 360.0 - 180.0
+            if circle.contains_coordinates(lat, lon):
+                assert Geohash.covers(cells, Geohash.encode(lat, lon, precision))
+                checked += 1
+        assert Geohash.covers(cells, Geohash.encode(0.0, 179.995, precision))
+        assert Geohash.covers(cells, Geohash.encode(0.0, -179.995, precision))
+        assert not Geohash.covers(cells, Geohash.encode(0.0, 0.0, precision))
+        assert len(cells) < 50
+
+    def test_max_cells(self):
+        """Test oversized covers are refused."""
+        circle = Circle(center=make_point(0.0, 0.0), radius=500000.0)
+
+        with pytest.raises(ValueError, match="max_cells"):
+            Geohash.cover(circle, precision=7, max_cells=1000)
@@ -0,0 +1,86 @@
+"""
+Tests for the InternCache value interning layer.
+"""
+
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from CamaraCommon.Basic import InternCache
+from CamaraCommon.Communication import PhoneNumber
+from CamaraCommon.Network import DeviceIpv6Address, Port, SingleIpv4Addr
+
+
+class TestInternCache:
+    """Test InternCache sharing, eviction and counters."""
+
+    def test_repeated_values_are_shared(self):
+        """Test the same raw value returns the same instance."""
+        cache = InternCache()
+        first = cache.get(SingleIpv4Addr, "84.125.93.10")
+        second = cache.get(SingleIpv4Addr, "84.125.93.10")
+        assert first is second
+        assert first == SingleIpv4Addr(value="84.125.93.10")
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_types_are_kept_apart(self):
+        """Test entries are keyed by model class as well as value."""
+        cache = InternCache()
+        port = cache.get(Port, 443)
+        phone = cache.get(PhoneNumber, "+123456789")
+        ipv6 = cache.get(DeviceIpv6Address, "2001:db8::1")
+        assert isinstance(port, Port) and port.value == 443
+        assert isinstance(phone, PhoneNumber)
+        assert isinstance(ipv6, DeviceIpv6Address)
+        assert len(cache) == 3
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted."""
+        cache = InternCache(maxsize=2)
+        a = cache.get(Port, 1)
+        cache.get(Port, 2)
+        assert cache.get(Port, 1) is a
+        cache.get(Port, 3)
+        assert len(cache) == 2
+        cache.get(Port, 2)
+        assert cache.info().misses == 4
+        assert cache.get(Port, 1) is not a
+
+    def test_invalid_values_are_not_cached(self):
+        """Test validation errors propagate and leave the cache unchanged."""
+        cache = InternCache()
+        with pytest.raises(ValidationError):
+            cache.get(SingleIpv4Addr, "999.1.1.1")
+        assert len(cache) == 0
+
+    def test_clear_and_bad_size(self):
+        """Test clearing resets counters and maxsize is checked."""
+        cache = InternCache()
+        cache.get(Port, 80)
+        cache.clear()
+        assert cache.info() == (0, 0, 4096, 0)
+        with pytest.raises(ValueError):
+            InternCache(maxsize=0)
+
+    def test_thread_safety(self):
+        """Test concurrent callers agree on one instance per value."""
+        cache = InternCache(maxsize=64)
+        results = []
+
+        def worker():
+            results.append(
+                [cache.get(SingleIpv4Addr, f"10.0.0.{i % 32}") for i in range(500)]
+            )
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for row in results[1:]:
+            assert all(a is b for a, b in zip(row, results[0]))
+        info = cache.info()
+        assert info.hits + info.misses == 8 * 500
+        assert info.currsize == 32
@@ -0,0 +1,195 @@
+"""
+Tests for area intersection and overlap.
+"""
+
+from typing import List, Sequence
+
+import pytest
+
+from CamaraCommon.Geography import (Area, AreaType, BoundingBox, Circle,
+                                    PointList, Polygon, SpatialIndex,
+                                    intersects, overlap_ratio)
+from tests.helpers import make_point, make_square
+
+# One degree of latitude in meters on the mean-radius sphere
+DEGREE = 111195.08
+
+
+class Everywhere(Area):
+    """An area type the intersection tests do not know about."""
+
+    areaType: AreaType = AreaType.CIRCLE
+
+    def bounding_box(self) -> BoundingBox:
+        return BoundingBox(-90.0, -180.0, 90.0, 180.0)
+
+    def contains_batch(
+        self, latitudes: Sequence[float], longitudes: Sequence[float]
+    ) -> List[bool]:
+        return [True] * len(latitudes)
+
+
+class TestIntersects:
+    """Test area intersection predicates."""
+
+    def test_circle_circle(self):
+        """Test circles intersect when centers are within the radius sum."""
+        first = Circle(center=make_point(0.0, 0.0), radius=60000.0)
+
+        assert intersects(first, Circle(center=make_point(0.0, 1.0), radius=60000.0))
+        assert not intersects(
+            first, Circle(center=make_point(0.0, 1.0), radius=50000.0)
+        )
+
+    def test_circle_polygon(self):
+        """Test circle-polygon intersection for edge, inside and disjoint cases."""
+        square = make_square(0.0, 0.0, 1.0)
+
+        # Circle centered inside the polygon
+        assert intersects(Circle(center=make_point(0.5, 0.5), radius=10.0), square)
+        # Circle reaching the east edge from outside
+        near = Circle(center=make_point(0.5, 1.1), radius=0.15 * DEGREE)
+        assert intersects(near, square)
+        assert intersects(square, near)
+        # Circle just short of the east edge
+        assert not intersects(
+            Circle(center=make_point(0.5, 1.1), radius=0.05 * DEGREE), square
+        )
+        # Polygon entirely inside a large circle
+        assert intersects(
+            Circle(center=make_point(0.5, 0.5), radius=5 * DEGREE), square
+        )
+
+    def test_circle_near_polygon_corner(self):
+        """Test the bbox overlaps but the circle misses the corner."""
+        square = make_square(0.0, 0.0, 1.0)
+        circle = Circle(center=make_point(1.1, 1.1), radius=0.12 * DEGREE)
+
+        assert circle.bounding_box().intersects(square.bounding_box())
+        assert not intersects(circle, square)
+
+    def test_polygon_polygon(self):
+        """Test polygon pairs: crossing, nested and disjoint."""
+        square = make_square(0.0, 0.0, 2.0)
+
+        assert intersects(square, make_square(1.0, 1.0, 2.0))
+        assert intersects(square, make_square(0.5, 0.5, 0.5))
+        assert intersects(make_square(0.5, 0.5, 0.5), square)
+        assert not intersects(square, make_square(3.0, 3.0, 1.0))
+
+    def test_polygon_polygon_edges_cross_without_vertices_inside(self):
+        """Test a cross shape where no vertex lies inside the other polygon."""
+        wide = Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(1, 0),
+                    make_point(1, 3),
+                    make_point(2, 3),
+                    make_point(2, 0),
+                ]
+            )
+        )
+        tall = Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(0, 1),
+                    make_point(0, 2),
+                    make_point(3, 2),
+                    make_point(3, 1),
+                ]
+            )
+        )
+
+        assert intersects(wide, tall)
+
+    def test_circle_polygon_across_antimeridian(self):
+        """Test a circle reaches a polygon on the other side of 180."""
+        square = make_square(-0.1, -180.0, 0.05)
+        circle = Circle(center=make_point(0.0, 179.9), radius=0.3 * DEGREE)
+
+        assert intersects(circle, square)
+        assert intersects(square, circle)
+        assert not intersects(
+            Circle(center=make_point(0.0, 179.9), radius=0.05 * DEGREE), square
+        )
+
+    def test_unsupported_area_type(self):
+        """Test unknown area types raise TypeError naming both types."""
+        circle = Circle(center=make_point(0.0, 0.0), radius=1000.0)
+
+        with pytest.raises(TypeError, match="Everywhere and Circle"):
+            intersects(Everywhere(), circle)
+
+
+class TestOverlapRatio:
+    """Test approximate overlap ratios."""
+
+    def test_circle_circle_ratio(self):
+        """Test the analytic circle-circle overlap."""
+        circle = Circle(center=make_point(0.0, 0.0), radius=1000.0)
+
+        assert overlap_ratio(circle, circle) == pytest.approx(1.0)
+        small = Circle(center=make_point(0.0, 0.0), radius=500.0)
+        assert overlap_ratio(small, circle) == pytest.approx(1.0)
+        assert overlap_ratio(circle, small) == pytest.approx(0.25)
+        far = Circle(center=make_point(1.0, 0.0), radius=1000.0)
+        assert overlap_ratio(circle, far) == 0.0
+
+    def test_polygon_overlap_ratio(self):
+        """Test sampled overlap of two half-overlapping squares."""
+        first = make_square(0.0, 0.0, 1.0)
+        second = make_square(0.0, 0.5, 1.0)
+
+        assert overlap_ratio(first, second) == pytest.approx(0.5, abs=0.02)
+        assert overlap_ratio(first, make_square(5.0, 5.0, 1.0)) == 0.0
+
+    def test_polygon_in_circle_ratio(self):
+        """Test a square fully inside a circle is fully covered."""
+        square = make_square(0.0, 0.0, 0.1)
+        circle = Circle(center=make_point(0.05, 0.05), radius=DEGREE)
+
+        assert overlap_ratio(square, circle) == pytest.approx(1.0)
+        assert 0.0 < overlap_ratio(circle, square) < 0.01
+
+    def test_circle_across_antimeridian_ratio(self):
+        """Test a circle crossing 180 is sampled on both sides of it."""
+        circle = Circle(center=make_point(0.0, 179.95), radius=0.1 * DEGREE)
+        east = Polygon(
+            boundary=PointList(
+                points=[
+                    make_point(-1.0, 179.0),
+                    make_point(-1.0, 180.0),
+                    make_point(1.0, 180.0),
+                    make_point(1.0, 179.0),
+                ]
+            )
+        )
+
+        # The circle reaches 0.05 degrees past 180, cutting off about 19.5%.
+        assert overlap_ratio(circle, east) == pytest.approx(0.805, abs=0.02)
+
+    def test_invalid_resolution(self):
+        """Test the sampling resolution must be positive."""
+        square = make_square(0.0, 0.0, 1.0)
+        with pytest.raises(ValueError, match="resolution"):
+            overlap_ratio(square, square, resolution=0)
+
+
+class TestIndexedIntersection:
+    """Test intersecting one area against an indexed set."""
+
+    def test_query_intersecting(self):
+        """Test index intersection queries apply the exact test."""
+        index = SpatialIndex.bulk_load(
+            [
+                ("square", make_square(0.0, 0.0, 1.0)),
+                ("corner", Circle(center=make_point(1.1, 1.1), radius=0.12 * DEGREE)),
+                ("far", make_square(10.0, 10.0, 1.0)),
+            ]
+        )
+
+        probe = Circle(center=make_point(0.5, 0.5), radius=0.3 * DEGREE)
+        assert index.query_intersecting(probe) == ["square"]
+
+        big = make_square(-1.0, -1.0, 3.0)
+        assert sorted(index.query_intersecting(big)) == ["corner", "square"]
@@ -0,0 +1,58 @@
+"""
+Tests for the prefix-keyed IPv6 map.
+"""
+
+import pytest
+
+from CamaraCommon.Network import DeviceIpv6Address, Ipv6PrefixMap
+
+
+def _address(value):
+    return DeviceIpv6Address(value=value)
+
+
+class TestIpv6PrefixMap:
+    """Test Ipv6PrefixMap lookups and updates."""
+
+    def test_any_host_in_subnet_hits(self):
+        """Test a lookup ignores the interface identifier."""
+        prefix_map = Ipv6PrefixMap.from_items([(_address("2001:db8:1:2::"), "dev")])
+        assert prefix_map.lookup(_address("2001:db8:1:2::1")) == "dev"
+        assert prefix_map.lookup(_address("2001:db8:1:2:ffff:ffff:ffff:ffff")) == "dev"
+        assert prefix_map.lookup(_address("2001:db8:1:3::1")) is None
+        assert _address("2001:db8:1:2::abcd") in prefix_map
+        assert "2001:db8:1:2::" not in prefix_map
+
+    def test_configurable_prefix_length(self):
+        """Test a /56 map groups neighbouring /64 subnets."""
+        prefix_map = Ipv6PrefixMap(prefix_len=56)
+        prefix_map.insert(_address("2001:db8:0:100::1"), "site")
+        assert prefix_map.lookup(_address("2001:db8:0:1ff::9")) == "site"
+        assert prefix_map.lookup(_address("2001:db8:0:200::1")) is None
+
+    def test_lookup_int_and_many(self):
+        """Test integer and batch lookups agree."""
+        prefix_map = Ipv6PrefixMap()
+        address = _address("fe80::1")
+        prefix_map.insert(address, 1)
+        assert prefix_map.lookup_int(int(address) | 0xFFFF) == 1
+        assert prefix_map.lookup_many([address, _address("fe81::1")]) == [1, None]
+
+    def test_replace_and_delete(self):
+        """Test overwriting and removing subnets."""
+        prefix_map = Ipv6PrefixMap()
+        prefix_map.insert(_address("2001:db8::1"), "old")
+        prefix_map.insert(_address("2001:db8::2"), "new")
+        assert len(prefix_map) == 1
+        assert prefix_map.lookup(_address("2001:db8::3")) == "new"
+        prefix_map.delete(_address("2001:db8::4"))
+        assert len(prefix_map) == 0
+        with pytest.raises(KeyError):
+            prefix_map.delete(_address("2001:db8::4"))
+
+    def test_invalid_arguments(self):
+        """Test bad prefix lengths and None values are rejected."""
+        with pytest.raises(ValueError):
+            Ipv6PrefixMap(prefix_len=-1)
+        with pytest.raises(ValueError):
+            Ipv6PrefixMap().insert(_address("::1"), None)
@@ -0,0 +1,160 @@
+"""
+Tests for NetworkAccessIdentifier parsing and the per-domain index.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from CamaraCommon.Communication import NaiDomainIndex, NetworkAccessIdentifier
+from CamaraCommon.Communication.NaiParser import split_external_identifier
+
+VALID = [
+    "user@example.com",
+    "123456789@domain.com",
+    "test.user+tag@example-site.com",
+    "first.last@Sub.Domain.COM",
+    "a@b",
+]
+
+INVALID = [
+    "",
+    "user",
+    "@domain.com",
+    "user@",
+    "user@@domain.com",
+    "user@domain@com",
+    "user name@domain.com",
+    "user@-domain.com",
+    "user@domain..com",
+    "user@dom_ain.com",
+    "user@" + "a" * 64 + ".com",
+    "usér@domain.com",
+]
+
+
+class TestExternalIdentifier:
+    """Test External Identifier splitting and validation."""
+
+    def test_parts(self):
+        """Test the local and domain parts."""
+        nai = NetworkAccessIdentifier(value="first.last@Sub.Domain.COM")
+        assert nai.parts() == ("first.last", "sub.domain.com")
+        assert nai.local_identifier == "first.last"
+        assert nai.domain_identifier == "sub.domain.com"
+        assert nai.is_external_identifier()
+
+    def test_domains_are_interned(self):
+        """Test equal domains are one shared string."""
+        first = NetworkAccessIdentifier(value="a@Operator.example")
+        second = NetworkAccessIdentifier(value="b@operator.EXAMPLE")
+        assert first.domain_identifier is second.domain_identifier
+
+    @pytest.mark.parametrize("value", INVALID)
+    def test_invalid_formats(self, value):
+        """Test malformed identifiers are reported on parse."""
+        nai = NetworkAccessIdentifier(value=value)
+        assert not nai.is_external_identifier()
+        with pytest.raises(ValueError):
+            nai.parts()
+
+    def test_model_stays_permissive_by_default(self):
+        """Test default validation still accepts any string."""
+        for value in INVALID:
+            assert NetworkAccessIdentifier(value=value).value == value
+
+    def test_validation_context(self):
+        """Test the format is enforced through the validation context."""
+        context = {"external_identifier": True}
+        for value in VALID:
+            NetworkAccessIdentifier.model_validate({"value": value}, context=context)
+        for value in INVALID:
+            with pytest.raises(ValidationError):
+                NetworkAccessIdentifier.model_validate(
+                    {"value": value}, context=context
+                )
+
+    def test_reassigned_value_is_reparsed(self):
+        """Test the split follows value changes."""
+        nai = NetworkAccessIdentifier(value="a@one.example")
+        assert nai.domain_identifier == "one.example"
+        nai.value = "a@two.example"
+        assert nai.domain_identifier == "two.example"
+
+    def test_parsing_does_not_affect_equality(self):
+        """Test parsing one of two equal identifiers keeps them equal."""
+        first = NetworkAccessIdentifier(value="a@operator.example")
+        second = NetworkAccessIdentifier(value="a@operator.example")
+        NaiDomainIndex().add(first)
+        assert first == second and second == first
+        assert first != NetworkAccessIdentifier(value="b@operator.example")
+
+
+class TestBulkParsing:
+    """Test NetworkAccessIdentifier.parse_batch."""
+
+    def test_matches_single_parser(self):
+        """Test every row agrees with split_external_identifier."""
+        values = VALID + INVALID
+        result = NetworkAccessIdentifier.parse_batch(values)
+        for index, value in enumerate(values):
+            try:
+                expected = split_external_identifier(value)
+            except ValueError as exc:
+                assert not result.valid[index]
+                assert result.errors[index] == str(exc)
+                assert result.domain[index] == ""
+            else:
+                assert result.valid[index]
+                assert (result.local[index], result.domain[index]) == expected
+                assert result.errors[index] is None
+
+    def test_one_domain_object_per_domain(self):
+        """Test rows of one domain share a single string object."""
+        values = [f"user{i}@Operator.Example" for i in range(100)]
+        result = NetworkAccessIdentifier.parse_batch(values)
+        assert all(valid for valid in result.valid)
+        assert len({id(domain) for domain in result.domain}) == 1
+
+    def test_non_string_rows(self):
+        """Test non-string rows are reported rather than raised."""
+        result = NetworkAccessIdentifier.parse_batch([None, "a@b.c", b"a@b.c"])
+        assert result.valid == [False, True, True]
+        assert result.errors[0] == "Input should be a valid string"
+        assert result.domain[2] == "b.c"
+
+
+class TestNaiDomainIndex:
+    """Test grouping identifiers by domain."""
+
+    def test_group_by_domain(self):
+        """Test identifiers are grouped and looked up case-insensitively."""
+        index = NaiDomainIndex.from_strings(
+            ["a@op1.example", "b@OP1.example", "c@op2.example"]
+        )
+        assert len(index) == 3
+        assert index.domains() == ["op1.example", "op2.example"]
+        assert [nai.value for nai in index.identifiers("Op1.Example")] == [
+            "a@op1.example",
+            "b@OP1.example",
+        ]
+        assert index.counts() == {"op1.example": 2, "op2.example": 1}
+        assert "op2.example" in index
+        assert index.identifiers("missing.example") == []
+
+    def test_models_and_strings_agree(self):
+        """Test building from models matches building from strings."""
+        values = ["x@one.example", "y@two.example", "z@one.example"]
+        from_strings = NaiDomainIndex.from_strings(values)
+        from_models = NaiDomainIndex.from_identifiers(
+            NetworkAccessIdentifier(value=value) for value in values
+        )
+        assert dict(from_strings.items()) == dict(from_models.items())
+        nai = from_strings.identifiers("one.example")[0]
+        assert nai.local_identifier == "x"
+
+    def test_malformed_identifiers_rejected(self):
+        """Test invalid identifiers cannot be indexed."""
+        with pytest.raises(ValueError):
+            NaiDomainIndex.from_strings(["ok@example.com", "broken"])
+        with pytest.raises(ValueError):
+            NaiDomainIndex().add(NetworkAccessIdentifier(value="broken"))
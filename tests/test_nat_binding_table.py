@@ -0,0 +1,157 @@
+"""
+Tests for the NAT binding table.
+"""
+
+import pytest
+
+from CamaraCommon.Network import NatBindingTable
+from tests.helpers import make_ipv4
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNatBindingTable:
+    """Test NatBindingTable lookups, updates and expiry."""
+
+    def test_lookup_by_port(self):
+        """Test resolving a public address and port."""
+        table = NatBindingTable()
+        table.insert(make_ipv4("84.125.93.10", port=59765), "alice")
+        table.insert(make_ipv4("84.125.93.10", port=59766), "bob")
+        assert table.lookup(make_ipv4("84.125.93.10", port=59765)) == "alice"
+        assert table.lookup(make_ipv4("84.125.93.10", port=59766)) == "bob"
+        assert table.lookup(make_ipv4("84.125.93.11", port=59765)) is None
+
+    def test_lookup_by_private(self):
+        """Test resolving a public and private address pair."""
+        table = NatBindingTable()
+        table.insert(make_ipv4("84.125.93.10", private="10.0.0.1"), "alice")
+        assert table.lookup(make_ipv4("84.125.93.10", private="10.0.0.1")) == "alice"
+        assert table.lookup(make_ipv4("84.125.93.10", private="10.0.0.2")) is None
+
+    def test_device_with_both_keys(self):
+        """Test a device carrying both keys is reachable by either."""
+        table = NatBindingTable()
+        table.insert(make_ipv4("84.125.93.10", private="10.0.0.1", port=80), "alice")
+        assert len(table) == 2
+        assert table.lookup(make_ipv4("84.125.93.10", port=80)) == "alice"
+        assert table.lookup(make_ipv4("84.125.93.10", private="10.0.0.1")) == "alice"
+
+    def test_port_and_private_keys_do_not_collide(self):
+        """Test the two lookup modes are kept apart."""
+        table = NatBindingTable()
+        table.insert_port(0, 1, "port")
+        table.insert_private(0, 1, "private")
+        assert table.lookup_port(0, 1) == "port"
+        assert table.lookup_private(0, 1) == "private"
+
+    def test_integer_lookups(self):
+        """Test the integer entry points agree with the model ones."""
+        table = NatBindingTable()
+        device = make_ipv4("255.255.255.255", private="255.255.255.254", port=65535)
+        table.insert(device, 7)
+        public = int(device.publicAddress)
+        assert table.lookup_port(public, 65535) == 7
+        assert table.lookup_private(public, int(device.privateAddress)) == 7
+
+    def test_replace_and_delete(self):
+        """Test overwriting and removing bindings."""
+        table = NatBindingTable()
+        device = make_ipv4("1.2.3.4", port=1000)
+        table.insert(device, "old")
+        table.insert(device, "new")
+        assert table.lookup(device) == "new"
+        assert len(table) == 1
+        table.delete(device)
+        assert table.lookup(device) is None
+        with pytest.raises(KeyError):
+            table.delete(device)
+
+    def test_slots_are_reused(self):
+        """Test deleted slots are recycled."""
+        table = NatBindingTable()
+        for port in range(10):
+            table.insert_port(1, port, port)
+        for port in range(10):
+            table.delete(make_ipv4("0.0.0.1", port=port))
+        for port in range(10):
+            table.insert_port(2, port, port)
+        assert len(table._values) == 10
+        assert table.lookup_port(2, 3) == 3
+
+    def test_none_value_rejected(self):
+        """Test None cannot be stored."""
+        with pytest.raises(ValueError):
+            NatBindingTable().insert_port(1, 1, None)
+
+    def test_ttl_expiry_on_lookup(self):
+        """Test expired bindings are not returned."""
+        clock = FakeClock()
+        table = NatBindingTable(default_ttl=10.0, clock=clock)
+        table.insert_port(1, 1, "a")
+        table.insert_port(1, 2, "b", ttl=100.0)
+        clock.now = 10.0
+        assert table.lookup_port(1, 1) is None
+        assert table.lookup_port(1, 2) == "b"
+        assert len(table) == 1
+
+    def test_evict_expired(self):
+        """Test eager eviction removes only expired bindings."""
+        clock = FakeClock()
+        table = NatBindingTable(clock=clock)
+        table.insert_port(1, 1, "a", ttl=5.0)
+        table.insert_port(1, 2, "b", ttl=15.0)
+        table.insert_port(1, 3, "c")
+        clock.now = 6.0
+        assert table.evict_expired() == 1
+        assert len(table) == 2
+        clock.now = 1000.0
+        assert table.evict_expired() == 1
+        assert table.lookup_port(1, 3) == "c"
+
+    def test_refresh_extends_ttl(self):
+        """Test re-inserting a binding supersedes its old expiry."""
+        clock = FakeClock()
+        table = NatBindingTable(clock=clock)
+        table.insert_port(1, 1, "a", ttl=5.0)
+        clock.now = 4.0
+        table.insert_port(1, 1, "a", ttl=5.0)
+        clock.now = 6.0
+        assert table.evict_expired() == 0
+        assert table.lookup_port(1, 1) == "a"
+
+    def test_refreshes_do_not_grow_heap(self):
+        """Test extending or shortening TTLs keeps the expiry heap bounded."""
+        clock = FakeClock()
+        table = NatBindingTable(clock=clock)
+        for port in range(10):
+            table.insert_port(1, port, "a", ttl=5.0)
+        for step in range(1000):
+            clock.now = step / 100.0
+            table.insert_port(1, step % 10, "a", ttl=5.0)
+        assert len(table._heap) == 10
+        for ttl in range(1000, 0, -1):
+            table.insert_port(1, 0, "a", ttl=float(ttl))
+        assert len(table._heap) <= 2 * len(table) + 65
+        clock.now = 20.0
+        table.insert_port(1, 0, "a", ttl=100.0)
+        assert table.evict_expired() == 9
+        assert table.lookup_port(1, 0) == "a"
+        clock.now = 200.0
+        assert table.evict_expired() == 1
+        assert len(table) == 0
+
+    def test_bulk_load(self):
+        """Test building a table from pairs."""
+        items = [(make_ipv4("100.64.0.1", port=port), port) for port in range(100)]
+        table = NatBindingTable.from_items(items)
+        assert len(table) == 100
+        assert table.lookup_many([make_ipv4("100.64.0.1", port=42)]) == [42]
@@ -45,6 +45,34 @@ class TestSingleIpv4Addr:
             with pytest.raises(ValueError):
                 SingleIpv4Addr(value=address)
 
+    def test_integer_form(self):
+        """Test the integer form and round trip."""
+        ipv4 = SingleIpv4Addr(value="84.125.93.10")
+        assert int(ipv4) == 0x547D5D0A
+        assert SingleIpv4Addr.from_int(0x547D5D0A) == ipv4
+        assert SingleIpv4Addr.from_int(0x547D5D0A).value == "84.125.93.10"
+
+    def test_hash_and_ordering(self):
+        """Test hashing and ordering use the integer form."""
+        addresses = [
+            SingleIpv4Addr(value="10.0.0.2"),
+            SingleIpv4Addr(value="9.255.255.255"),
+            SingleIpv4Addr(value="10.0.0.2"),
+        ]
+
+        assert len(set(addresses)) == 2
+        assert sorted(addresses)[0].value == "9.255.255.255"
+        assert addresses[1] < addresses[0] <= addresses[2]
+        assert addresses[0] != "10.0.0.2"
+
+    def test_reassigned_value_updates_integer(self):
+        """Test the integer form follows value reassignment."""
+        ipv4 = SingleIpv4Addr(value="10.0.0.1")
+        assert int(ipv4) == 0x0A000001
+
+        ipv4.value = "10.0.0.2"
+        assert int(ipv4) == 0x0A000002
+
 
 class TestDeviceIpv6Address:
     """Test DeviceIpv6Address validation."""
@@ -79,6 +107,49 @@ class TestDeviceIpv6Address:
             with pytest.raises(ValueError):
                 DeviceIpv6Address(value=address)
 
+    def test_canonical_equality(self):
+        """Test equal addresses in different notations compare equal."""
+        short = DeviceIpv6Address(value="2001:db8::1")
+        expanded = DeviceIpv6Address(value="2001:0db8:0000:0000:0000:0000:0000:0001")
+
+        assert short == expanded
+        assert hash(short) == hash(expanded)
+        assert len({short, expanded}) == 1
+        # Serialization keeps the original notation
+        assert expanded.model_dump() == {
+            "value": "2001:0db8:0000:0000:0000:0000:0000:0001"
+        }
+
+    def test_integer_form_and_ordering(self):
+        """Test the integer form, round trip and ordering."""
+        ipv6 = DeviceIpv6Address(value="2001:db8::1")
+        assert int(ipv6) == 0x20010DB8000000000000000000000001
+        assert DeviceIpv6Address.from_int(int(ipv6)).value == "2001:db8::1"
+        assert DeviceIpv6Address(value="::1") < ipv6
+
+    def test_not_equal_to_ipv4(self):
+        """Test addresses of different families never compare equal."""
+        ipv6 = DeviceIpv6Address(value="::1")
+        ipv4 = SingleIpv4Addr(value="0.0.0.1")
+        assert int(ipv6) == int(ipv4)
+        assert ipv6 != ipv4 and ipv4 != ipv6
+        with pytest.raises(TypeError):
+            ipv6 < ipv4
+
+    def test_prefix_key(self):
+        """Test addresses in one subnet share a prefix key."""
+        first = DeviceIpv6Address(value="2001:db8:85a3:8d3:1319:8a2e:370:7344")
+        second = DeviceIpv6Address(value="2001:db8:85a3:8d3::")
+        other = DeviceIpv6Address(value="2001:db8:85a3:8d4::1")
+
+        assert first.prefix_key() == second.prefix_key() == 0x20010DB885A308D3
+        assert first.prefix_key() != other.prefix_key()
+        assert first.prefix_key(48) == other.prefix_key(48)
+        assert first.prefix_key(128) == int(first)
+        assert first.prefix_key(0) == 0
+        with pytest.raises(ValueError):
+            first.prefix_key(129)
+
 
 class TestPort:
     """Test Port validation."""
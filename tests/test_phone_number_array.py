@@ -0,0 +1,75 @@
+"""
+Tests for the PhoneNumberArray packed phone number set.
+"""
+
+import random
+
+import pytest
+
+from CamaraCommon.Communication import PhoneNumber, PhoneNumberArray
+
+
+class TestPhoneNumberArray:
+    """Test PhoneNumberArray storage, ordering and membership."""
+
+    def test_sorted_and_unique(self):
+        """Test numbers are stored sorted without duplicates."""
+        numbers = PhoneNumberArray(
+            [
+                "+4917612345678",
+                PhoneNumber(value="+123456789"),
+                123456789,
+                "+33612345678",
+            ]
+        )
+        assert len(numbers) == 3
+        assert numbers.to_strings() == ["+123456789", "+33612345678", "+4917612345678"]
+        assert list(numbers) == [
+            PhoneNumber(value="+123456789"),
+            PhoneNumber(value="+33612345678"),
+            PhoneNumber(value="+4917612345678"),
+        ]
+        assert numbers[-1].value == "+4917612345678"
+
+    def test_membership_and_index(self):
+        """Test binary-search membership for every accepted input form."""
+        numbers = PhoneNumberArray(["+123456789", "+33612345678"])
+        assert "+33612345678" in numbers
+        assert PhoneNumber(value="+123456789") in numbers
+        assert 33612345678 in numbers
+        assert "+999999999" not in numbers
+        assert "not a number" not in numbers
+        assert None not in numbers
+        assert numbers.index("+33612345678") == 1
+        with pytest.raises(ValueError):
+            numbers.index("+999999999")
+
+    def test_add_and_update(self):
+        """Test incremental inserts keep the array sorted."""
+        numbers = PhoneNumberArray()
+        numbers.add("+500000")
+        numbers.add("+100000")
+        numbers.add("+100000")
+        numbers.update(["+300000", "+500000"])
+        assert numbers.to_strings() == ["+100000", "+300000", "+500000"]
+
+    def test_invalid_numbers_rejected(self):
+        """Test strings and integers are validated."""
+        for bad in ["123456789", "+0123456", "+1234", 1234, 10**15]:
+            with pytest.raises(ValueError):
+                PhoneNumberArray([bad])
+
+    def test_contains_batch(self):
+        """Test batch membership against a plain set."""
+        rng = random.Random(20)
+        stored = {rng.randrange(10**9, 10**12) for _ in range(1000)}
+        numbers = PhoneNumberArray(stored)
+        probes = list(stored)[:100] + [rng.randrange(10**9, 10**12) for _ in range(100)]
+        assert numbers.contains_batch(probes) == [p in stored for p in probes]
+
+    def test_equality(self):
+        """Test arrays with the same numbers compare equal."""
+        assert PhoneNumberArray(["+123456", "+654321"]) == PhoneNumberArray(
+            [654321, 123456]
+        )
+        assert repr(PhoneNumberArray(["+123456"])) == "PhoneNumberArray(['+123456'])"
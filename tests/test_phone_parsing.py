@@ -0,0 +1,144 @@
+"""
+Tests for E.164 prefix routing and bulk phone number parsing.
+"""
+
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from CamaraCommon.Communication import PhoneNumber, PhonePrefixTable
+from CamaraCommon.Communication.PhoneNumberParser import (COUNTRY_CODES,
+                                                          is_e164,
+                                                          split_country_code)
+
+
+def _model_valid(value):
+    try:
+        PhoneNumber(value=value)
+    except ValidationError:
+        return False
+    return True
+
+
+class TestCountryCodes:
+    """Test country calling code splitting."""
+
+    def test_codes_are_prefix_free(self):
+        """Test no assigned code is a prefix of another."""
+        for code in COUNTRY_CODES:
+            for length in range(1, len(code)):
+                assert code[:length] not in COUNTRY_CODES
+
+    @pytest.mark.parametrize(
+        "digits, expected",
+        [
+            ("4917612345678", (49, "17612345678")),
+            ("12025550123", (1, "2025550123")),
+            ("353861234567", (353, "861234567")),
+            ("79161234567", (7, "9161234567")),
+            ("2800000000", (0, "2800000000")),
+        ],
+    )
+    def test_split(self, digits, expected):
+        """Test splitting known numbers."""
+        assert split_country_code(digits) == expected
+
+
+class TestPhonePrefixTable:
+    """Test PhonePrefixTable lookups and updates."""
+
+    def test_longest_prefix_wins(self):
+        """Test the most specific range is returned."""
+        table = PhonePrefixTable.from_items(
+            [("+49", "de"), ("+4917", "de-mobile"), ("+49176", "operator-a")]
+        )
+        assert table.lookup("+4917612345678") == "operator-a"
+        assert table.lookup(PhoneNumber(value="+4917012345678")) == "de-mobile"
+        assert table.lookup("+4930123456") == "de"
+        assert table.lookup("+3312345678") is None
+        assert table.lookup_many(["+49176000000", "+1555000000"]) == [
+            "operator-a",
+            None,
+        ]
+
+    def test_insert_and_delete(self):
+        """Test updating the table."""
+        table = PhonePrefixTable()
+        table.insert("44", "uk")
+        assert len(table) == 1
+        table.delete("+44")
+        assert table.lookup("+447700900123") is None
+        with pytest.raises(KeyError):
+            table.delete("+44")
+        for bad in ["", "+", "+4a", "+1234567890123456"]:
+            with pytest.raises(ValueError):
+                table.insert(bad, "x")
+        with pytest.raises(ValueError):
+            table.insert("+1", None)
+
+
+class TestBulkParsing:
+    """Test PhoneNumber.parse_batch."""
+
+    CORPUS = [
+        "+123456789",
+        "+4917612345678",
+        "+390612345678",
+        "+12345",
+        "+1234",
+        "+123456789012345",
+        "+1234567890123456",
+        "123456789",
+        "+0123456789",
+        "+12345678a",
+        "+123456789\n",
+        "+１23456789",
+        "",
+        "+",
+    ]
+
+    def test_validity_matches_model(self):
+        """Test the validity mask agrees with PhoneNumber."""
+        result = PhoneNumber.parse_batch(self.CORPUS)
+        assert result.valid == [_model_valid(value) for value in self.CORPUS]
+
+    def test_random_strings_match_model(self):
+        """Test random near-miss strings against the model pattern."""
+        rng = random.Random(19)
+        alphabet = "+0123456789a "
+        values = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randrange(18)))
+            for _ in range(500)
+        ]
+        values += ["+" + str(rng.randrange(10**4, 10**15)) for _ in range(200)]
+        assert [is_e164(value) for value in values] == [
+            _model_valid(value) for value in values
+        ]
+
+    def test_columns(self):
+        """Test country code, national number and routing columns."""
+        routes = PhonePrefixTable.from_items([("+39", "it"), ("+4917", "de-mobile")])
+        result = PhoneNumber.parse_batch(
+            ["+4917612345678", "bad", "+390612345678", "+2800000000"], routes
+        )
+        assert result.valid == [True, False, True, True]
+        assert list(result.country_code) == [49, 0, 39, 0]
+        assert result.national_number[0] == 17612345678
+        assert result.national_digits(2) == "0612345678"
+        assert result.national_digits(3) == "2800000000"
+        assert result.routing_tag == ["de-mobile", None, "it", None]
+
+    def test_non_string_rows(self):
+        """Test non-string rows are invalid rather than raising."""
+        result = PhoneNumber.parse_batch([None, 123456789])
+        assert result.valid == [False, False]
+        assert result.routing_tag == [None, None]
+
+    def test_bytes_rows(self):
+        """Test bytes rows are decoded like pydantic's lax string mode."""
+        values = [b"+123456789", bytearray(b"+4917612345678"), b"+12\xff4567"]
+        result = PhoneNumber.parse_batch(values)
+        assert result.valid == [_model_valid(value) for value in values]
+        assert result.valid == [True, True, False]
+        assert result.national_number[1] == 17612345678
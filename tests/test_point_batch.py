@@ -0,0 +1,82 @@
+"""
+Tests for the columnar PointBatch type.
+"""
+
+from array import array
+
+import pytest
+
+from CamaraCommon.Geography import (Circle, Latitude, Point, PointBatch,
+                                    SpatialIndex)
+from tests.helpers import make_point
+
+
+class TestPointBatch:
+    """Test PointBatch construction, validation and conversion."""
+
+    def test_valid_batch(self):
+        """Test batch construction from coordinate columns."""
+        batch = PointBatch([50.735851, -90.0, 90.0], [7.10066, -180.0, 180.0])
+
+        assert len(batch) == 3
+        assert isinstance(batch.latitudes, array)
+        assert batch.latitudes.typecode == "d"
+        assert batch[0].latitude.value == 50.735851
+        assert batch[0].longitude.value == 7.10066
+
+    def test_invalid_latitude(self):
+        """Test bulk validation reports the offending latitude."""
+        with pytest.raises(ValueError, match="latitude at index 1"):
+            PointBatch([0.0, 90.5, 0.0], [0.0, 0.0, 0.0])
+
+    def test_invalid_longitude(self):
+        """Test bulk validation reports the offending longitude."""
+        with pytest.raises(ValueError, match="longitude at index 2"):
+            PointBatch([0.0, 0.0, 0.0], [0.0, 0.0, -180.1])
+
+    def test_nan_rejected(self):
+        """Test NaN coordinates are rejected like the Latitude model does."""
+        with pytest.raises(ValueError, match="latitude at index 0"):
+            PointBatch([float("nan")], [0.0])
+
+    def test_length_mismatch(self):
+        """Test mismatched columns are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            PointBatch([0.0, 1.0], [0.0])
+
+    def test_append(self):
+        """Test appending single coordinates."""
+        batch = PointBatch()
+        batch.append(1.0, 2.0)
+        assert len(batch) == 1
+
+        with pytest.raises(ValueError):
+            batch.append(91.0, 0.0)
+        assert len(batch) == 1
+
+    def test_points_round_trip(self):
+        """Test conversion to and from Point models."""
+        points = [make_point(1.0, 2.0), make_point(-3.5, 4.25)]
+        batch = PointBatch.from_points(points)
+
+        assert batch.to_points() == points
+        assert list(batch) == points
+
+    def test_json_round_trip(self):
+        """Test conversion to and from the CAMARA JSON shape."""
+        points = [make_point(1.0, 2.0), make_point(-3.5, 4.25)]
+        data = [point.model_dump() for point in points]
+        batch = PointBatch.from_json(data)
+
+        assert batch.to_json() == data
+        assert batch == PointBatch.from_points(points)
+
+    def test_geometry_input(self):
+        """Test PointBatch as input to containment and index queries."""
+        circle = Circle(center=make_point(0.0, 0.0), radius=100000.0)
+        batch = PointBatch([0.0, 0.5, 5.0], [0.0, 0.5, 5.0])
+
+        assert circle.contains_points(batch) == [True, True, False]
+
+        index = SpatialIndex.bulk_load([("c", circle)])
+        assert index.query_batch(batch) == [["c"], ["c"], []]
@@ -0,0 +1,76 @@
+"""
+Tests for the PortRangeSet type.
+"""
+
+import random
+
+import pytest
+
+from CamaraCommon.Network import Port, PortRangeSet
+
+
+class TestPortRangeSet:
+    """Test PortRangeSet construction, membership and set operations."""
+
+    def test_ranges_are_merged(self):
+        """Test overlapping and adjacent ranges collapse."""
+        ports = PortRangeSet([(100, 200), (10, 20), (150, 300), (21, 30)])
+        assert ports.ranges() == [(10, 30), (100, 300)]
+        assert len(ports) == 21 + 201
+
+    def test_membership(self):
+        """Test Port and int membership."""
+        ports = PortRangeSet([(80, 80), (8000, 8080)])
+        assert 80 in ports
+        assert Port(value=8080) in ports
+        assert 81 not in ports
+        assert -1 not in ports
+        assert 70000 not in ports
+        assert "80" not in ports
+
+    def test_invalid_ranges(self):
+        """Test out-of-range and reversed bounds are rejected."""
+        for bad in [(-1, 5), (5, 65536), (10, 5)]:
+            with pytest.raises(ValueError):
+                PortRangeSet([bad])
+
+    def test_union_and_intersection(self):
+        """Test set algebra on range sets."""
+        web = PortRangeSet([(80, 80), (443, 443), (8000, 8999)])
+        high = PortRangeSet([(1024, 65535)])
+        assert (web & high).ranges() == [(8000, 8999)]
+        assert (web | high).ranges() == [(80, 80), (443, 443), (1024, 65535)]
+        assert web & PortRangeSet() == PortRangeSet()
+
+    def test_equality_and_hash(self):
+        """Test sets with the same ports are equal."""
+        first = PortRangeSet([(1, 5), (6, 10)])
+        second = PortRangeSet.from_ports(range(1, 11))
+        assert first == second
+        assert hash(first) == hash(second)
+        assert repr(first) == "PortRangeSet([1-10])"
+
+    @pytest.mark.parametrize("count", [10, 500])
+    def test_matches_python_set(self, count):
+        """Test sparse and dense (bitmap) sets against a plain set."""
+        rng = random.Random(count)
+        ranges = []
+        for _ in range(count):
+            start = rng.randrange(65536)
+            ranges.append((start, min(65535, start + rng.randrange(20))))
+        ports = PortRangeSet(ranges)
+        assert (ports._bitmap is not None) == (len(ports.ranges()) > 64)
+        expected = {port for start, end in ranges for port in range(start, end + 1)}
+        assert len(ports) == len(expected)
+        probes = [rng.randrange(-10, 65546) for _ in range(2000)]
+        assert ports.contains_batch(probes) == [port in expected for port in probes]
+        assert [port in ports for port in probes] == ports.contains_batch(probes)
+        other = PortRangeSet.from_ports([p for p in probes[:200] if 0 <= p <= 65535])
+        other_set = {p for p in probes[:200] if 0 <= p <= 65535}
+        assert len(ports & other) == len(expected & other_set)
+        assert len(ports | other) == len(expected | other_set)
+
+    def test_batch_accepts_ports(self):
+        """Test batch membership over Port models."""
+        ports = PortRangeSet([(22, 22)])
+        assert ports.contains_batch([Port(value=22), Port(value=23)]) == [True, False]
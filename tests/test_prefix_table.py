@@ -0,0 +1,113 @@
+"""
+Tests for the longest-prefix-match PrefixTable.
+"""
+
+import ipaddress
+import random
+
+import pytest
+
+from CamaraCommon.Network import (DeviceIpv4Addr, DeviceIpv6Address, Port,
+                                  PrefixTable, SingleIpv4Addr)
+
+
+class TestPrefixTable:
+    """Test PrefixTable lookups and updates."""
+
+    def test_longest_prefix_wins(self):
+        """Test the most specific IPv4 block is returned."""
+        table = PrefixTable.from_items(
+            [
+                ("0.0.0.0/0", "default"),
+                ("84.0.0.0/8", "operator-a"),
+                ("84.125.0.0/16", "region-1"),
+                ("84.125.93.10/32", "gateway"),
+            ]
+        )
+
+        assert table.lookup(SingleIpv4Addr(value="84.125.93.10")) == "gateway"
+        assert table.lookup(SingleIpv4Addr(value="84.125.93.11")) == "region-1"
+        assert table.lookup(SingleIpv4Addr(value="84.1.1.1")) == "operator-a"
+        assert table.lookup(SingleIpv4Addr(value="1.1.1.1")) == "default"
+        assert len(table) == 4
+
+    def test_device_ipv4_uses_public_address(self):
+        """Test DeviceIpv4Addr is matched on its public address."""
+        table = PrefixTable.from_items([("84.125.0.0/16", "region-1")])
+        device = DeviceIpv4Addr(
+            publicAddress=SingleIpv4Addr(value="84.125.93.10"),
+            privateAddress=SingleIpv4Addr(value="10.0.0.1"),
+            publicPort=Port(value=59765),
+        )
+
+        assert table.lookup(device) == "region-1"
+
+    def test_ipv6(self):
+        """Test IPv6 lookups are kept separate from IPv4."""
+        table = PrefixTable.from_items(
+            [("2001:db8::/32", "doc"), ("2001:db8:85a3::/48", "site"), ("::/0", "any6")]
+        )
+
+        assert table.lookup(DeviceIpv6Address(value="2001:db8:85a3::1")) == "site"
+        assert table.lookup(DeviceIpv6Address(value="2001:db8:1::1")) == "doc"
+        assert table.lookup(DeviceIpv6Address(value="fe80::1")) == "any6"
+        assert table.lookup(SingleIpv4Addr(value="1.1.1.1")) is None
+
+    def test_insert_delete(self):
+        """Test incremental updates."""
+        table: PrefixTable[str] = PrefixTable()
+        table.insert("10.0.0.0/8", "a")
+        table.insert("10.1.0.0/16", "b")
+        address = SingleIpv4Addr(value="10.1.2.3")
+        assert table.lookup(address) == "b"
+
+        table.delete("10.1.0.0/16")
+        assert table.lookup(address) == "a"
+        table.insert("10.0.0.0/8", "c")
+        assert table.lookup(address) == "c"
+
+        with pytest.raises(KeyError):
+            table.delete("10.1.0.0/16")
+
+    def test_invalid_input(self):
+        """Test invalid CIDR blocks and values are rejected."""
+        table: PrefixTable[str] = PrefixTable()
+        with pytest.raises(ValueError, match="Invalid CIDR"):
+            table.insert("10.0.0.1/8", "host bits set")
+        with pytest.raises(ValueError, match="Invalid CIDR"):
+            table.insert("not-a-network", "x")
+        with pytest.raises(ValueError, match="must not be None"):
+            table.insert("10.0.0.0/8", None)
+
+    def test_batch_matches_linear_scan(self):
+        """Test batch lookups match a linear ipaddress scan."""
+        rng = random.Random(11)
+        blocks = []
+        for index in range(300):
+            length = rng.randint(8, 28)
+            network = ipaddress.ip_network(
+                (rng.getrandbits(32) >> (32 - length) << (32 - length), length)
+            )
+            blocks.append((network, index))
+        table = PrefixTable.from_items(
+            (str(network), index) for network, index in blocks
+        )
+
+        addresses = [
+            SingleIpv4Addr(value=str(ipaddress.IPv4Address(rng.getrandbits(32))))
+            for _ in range(200)
+        ] + [
+            SingleIpv4Addr(value=str(network.network_address + 1))
+            for network, _ in blocks[:100]
+        ]
+
+        expected = []
+        for address in addresses:
+            ip = ipaddress.IPv4Address(address.value)
+            matches = [(n.prefixlen, i) for n, i in blocks if ip in n]
+            # Later inserts replace earlier ones for identical blocks
+            best = max((length for length, _ in matches), default=None)
+            candidates = [i for length, i in matches if length == best]
+            expected.append(candidates[-1] if candidates else None)
+
+        assert table.lookup_many(addresses) == expected
@@ -0,0 +1,147 @@
+"""
+Tests for area bounding boxes and the SpatialIndex.
+"""
+
+import random
+
+import pytest
+
+from CamaraCommon.Geography import (BoundingBox, Circle, Longitude, Polygon,
+                                    SpatialIndex)
+from tests.helpers import make_point, make_square
+
+
+class TestBoundingBox:
+    """Test bounding boxes of areas."""
+
+    def test_polygon_bounding_box(self):
+        """Test Polygon bounding box spans its boundary points."""
+        box = make_square(10.0, 20.0, 2.0).bounding_box()
+        assert box == BoundingBox(10.0, 20.0, 12.0, 22.0)
+
+    def test_circle_bounding_box_contains_circle(self):
+        """Test Circle bounding box encloses points on the circle edge."""
+        circle = Circle(center=make_point(50.0, 7.0), radius=10000.0)
+        box = circle.bounding_box()
+
+        assert box.contains_coordinates(50.0, 7.0)
+        assert box.min_latitude < 50.0 < box.max_latitude
+        # Longitude extent grows with latitude
+        assert (box.max_longitude - box.min_longitude) > (
+            box.max_latitude - box.min_latitude
+        )
+
+    def test_circle_bounding_box_near_pole(self):
+        """Test Circle around a pole spans all longitudes."""
+        circle = Circle(center=make_point(89.99, 0.0), radius=5000.0)
+        box = circle.bounding_box()
+
+        assert box.max_latitude == 90.0
+        assert box.min_longitude == -180.0
+        assert box.max_longitude == 180.0
+
+    def test_circle_bounding_box_antimeridian(self):
+        """Test Circle crossing the antimeridian spans all longitudes."""
+        circle = Circle(center=make_point(0.0, 179.99), radius=5000.0)
+        box = circle.bounding_box()
+
+        assert box.min_longitude == -180.0
+        assert box.max_longitude == 180.0
+
+    def test_bounding_box_intersects(self):
+        """Test bounding box overlap checks."""
+        box = BoundingBox(0.0, 0.0, 1.0, 1.0)
+
+        assert box.intersects(BoundingBox(0.5, 0.5, 2.0, 2.0))
+        assert box.intersects(BoundingBox(1.0, 1.0, 2.0, 2.0))
+        assert not box.intersects(BoundingBox(1.5, 0.0, 2.0, 1.0))
+
+
+class TestSpatialIndex:
+    """Test SpatialIndex queries and updates."""
+
+    def test_query_point(self):
+        """Test point queries return only containing areas."""
+        index = SpatialIndex.bulk_load(
+            [
+                ("small", make_square(0.0, 0.0, 1.0)),
+                ("large", make_square(-10.0, -10.0, 20.0)),
+                ("circle", Circle(center=make_point(0.5, 0.5), radius=1000.0)),
+                ("far", make_square(40.0, 40.0, 1.0)),
+            ]
+        )
+
+        assert sorted(index.query_coordinates(0.5, 0.5)) == [
+            "circle",
+            "large",
+            "small",
+        ]
+        assert sorted(index.query_point(make_point(0.9, 0.9))) == ["large", "small"]
+        assert index.query_coordinates(40.5, 40.5) == ["far"]
+        assert index.query_coordinates(-50.0, -50.0) == []
+
+    def test_insert_and_delete(self):
+        """Test incremental updates keep queries consistent."""
+        index: SpatialIndex[int] = SpatialIndex()
+        index.insert(1, make_square(0.0, 0.0, 1.0))
+        index.insert(2, make_square(0.0, 0.0, 1.0))
+        assert len(index) == 2
+        assert sorted(index.query_coordinates(0.5, 0.5)) == [1, 2]
+
+        index.delete(1)
+        assert 1 not in index
+        assert index.query_coordinates(0.5, 0.5) == [2]
+
+        # Re-inserting a key replaces its area
+        index.insert(2, make_square(5.0, 5.0, 1.0))
+        assert index.query_coordinates(0.5, 0.5) == []
+        assert index.query_coordinates(5.5, 5.5) == [2]
+
+        with pytest.raises(KeyError):
+            index.delete(1)
+
+    def test_query_bbox(self):
+        """Test bounding box queries."""
+        index = SpatialIndex.bulk_load(
+            [
+                ("a", make_square(0.0, 0.0, 1.0)),
+                ("b", make_square(2.0, 2.0, 1.0)),
+                ("c", make_square(-60.0, -60.0, 100.0)),
+            ]
+        )
+
+        assert sorted(index.query_bbox(BoundingBox(0.5, 0.5, 2.5, 2.5))) == [
+            "a",
+            "b",
+            "c",
+        ]
+        assert index.query_bbox(BoundingBox(70.0, 70.0, 80.0, 80.0)) == []
+
+    def test_matches_linear_scan(self):
+        """Test index results match a brute-force scan."""
+        rng = random.Random(42)
+        areas = {}
+        anchors = []
+        for key in range(200):
+            lat = rng.uniform(-60.0, 60.0)
+            lon = rng.uniform(-170.0, 170.0)
+            anchors.append((lat, lon))
+            if key % 2:
+                areas[key] = Circle(
+                    center=make_point(lat, lon), radius=rng.uniform(100.0, 500000.0)
+                )
+            else:
+                areas[key] = make_square(lat, lon, rng.uniform(0.001, 5.0))
+        index = SpatialIndex.bulk_load(areas.items())
+
+        for _ in range(300):
+            # Sample near area anchors so most queries hit something
+            anchor_lat, anchor_lon = rng.choice(anchors)
+            lat = anchor_lat + rng.uniform(-1.0, 3.0)
+            lon = anchor_lon + rng.uniform(-1.0, 3.0)
+            expected = sorted(
+                key
+                for key, area in areas.items()
+                if area.contains_coordinates(lat, lon)
+            )
+            assert sorted(index.query_coordinates(lat, lon)) == expected
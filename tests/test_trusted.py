@@ -0,0 +1,112 @@
+"""
+Tests for validation-free trusted constructors.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from CamaraCommon.Basic.Trusted import construct_trusted
+from CamaraCommon.Communication import NetworkAccessIdentifier, PhoneNumber
+from CamaraCommon.Device import Device, DeviceResponse
+from CamaraCommon.Network import (DeviceIpv4Addr, DeviceIpv6Address, Port,
+                                  SingleIpv4Addr)
+
+
+def _assert_same(trusted, validated):
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.model_fields_set == validated.model_fields_set
+
+
+class TestTrustedConstruction:
+    """Test from_trusted matches validated construction."""
+
+    def test_leaf_types(self):
+        """Test every leaf type."""
+        _assert_same(Port.from_trusted(8080), Port(value=8080))
+        _assert_same(
+            SingleIpv4Addr.from_trusted("84.125.93.10"),
+            SingleIpv4Addr(value="84.125.93.10"),
+        )
+        _assert_same(
+            DeviceIpv6Address.from_trusted("2001:db8::1"),
+            DeviceIpv6Address(value="2001:db8::1"),
+        )
+        _assert_same(
+            PhoneNumber.from_trusted("+123456789"), PhoneNumber(value="+123456789")
+        )
+        _assert_same(
+            NetworkAccessIdentifier.from_trusted("user@example.com"),
+            NetworkAccessIdentifier(value="user@example.com"),
+        )
+
+    def test_addresses_are_fully_usable(self):
+        """Test cached integer forms, hashing and ordering work."""
+        ipv4 = SingleIpv4Addr.from_trusted("10.0.0.1")
+        assert int(ipv4) == 0x0A000001
+        assert hash(ipv4) == hash(SingleIpv4Addr(value="10.0.0.1"))
+        assert SingleIpv4Addr.from_trusted("10.0.0.0") < ipv4
+        assert DeviceIpv6Address.from_trusted("::1").prefix_key(128) == 1
+        assert int(Port.from_trusted(443)) == 443
+
+    def test_device_ipv4(self):
+        """Test the composite IPv4 device address."""
+        _assert_same(
+            DeviceIpv4Addr.from_trusted("84.125.93.10", publicPort=59765),
+            DeviceIpv4Addr(
+                publicAddress=SingleIpv4Addr(value="84.125.93.10"),
+                publicPort=Port(value=59765),
+            ),
+        )
+        _assert_same(
+            DeviceIpv4Addr.from_trusted("84.125.93.10", privateAddress="10.0.0.1"),
+            DeviceIpv4Addr(
+                publicAddress=SingleIpv4Addr(value="84.125.93.10"),
+                privateAddress=SingleIpv4Addr(value="10.0.0.1"),
+            ),
+        )
+
+    def test_device(self):
+        """Test Device keeps unset identifiers out of the fields set."""
+        data = {
+            "phoneNumber": {"value": "+123456789"},
+            "ipv4Address": {
+                "publicAddress": {"value": "84.125.93.10"},
+                "publicPort": {"value": 59765},
+            },
+        }
+        trusted = Device.from_trusted(
+            phoneNumber="+123456789",
+            ipv4Address=DeviceIpv4Addr.from_trusted("84.125.93.10", publicPort=59765),
+        )
+        _assert_same(trusted, Device.model_validate(data))
+        assert trusted.model_dump(exclude_unset=True) == data
+        assert trusted.networkAccessIdentifier is None
+
+    def test_device_response(self):
+        """Test subclasses build instances of themselves."""
+        response = DeviceResponse.from_trusted(ipv6Address="2001:db8::1")
+        _assert_same(
+            response,
+            DeviceResponse(ipv6Address=DeviceIpv6Address(value="2001:db8::1")),
+        )
+
+    def test_validation_is_skipped(self):
+        """Test trusted input is not checked."""
+        assert Port.from_trusted(70000).value == 70000
+
+    def test_default_factories_run_per_instance(self):
+        """Test omitted fields with a default factory get fresh values."""
+
+        class Tagged(BaseModel):
+            name: str
+            tags: List[str] = Field(default_factory=list)
+
+        first = construct_trusted(Tagged, {"name": "a"})
+        second = construct_trusted(Tagged, {"name": "b"})
+        _assert_same(first, Tagged(name="a"))
+        assert first.tags == [] and first.tags is not second.tags
+        assert first.model_fields_set == {"name"}